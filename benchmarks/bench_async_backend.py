@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+비동기 S3 백엔드 벤치마크
+
+로컬 moto 서버에 작은 gzip JSONL 객체를 올린 뒤 boto3 스레드 백엔드("s3"),
+작은 객체 모드("s3", download_mode="small"), aiobotocore 백엔드("async")로 같은 비교를
+실행하여 처리량(objects/s)을 측정합니다. 모든 설정의 비교 결과가 같은지도 확인합니다.
+
+사용법:
+    pip install "moto[server]" aiobotocore
+    python benchmarks/bench_async_backend.py --objects 2000
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import boto3
+from moto.server import ThreadedMotoServer
+
+from s3_json_compare import S3JSONComparer
+
+
+def upload_objects(endpoint_url: str, object_count: int, records_per_object: int):
+    """소스/백업 버킷을 만들고 같은 내용의 작은 객체를 올립니다"""
+    client = boto3.client('s3', region_name='us-east-1', endpoint_url=endpoint_url)
+    for bucket in ('bench-source', 'bench-backup'):
+        client.create_bucket(Bucket=bucket)
+    
+    def put(index: int):
+        records = [
+            {"device_id": index, "seq": seq, "speed": seq * 0.5, "tags": ["a", "b"]}
+            for seq in range(records_per_object)
+        ]
+        body = gzip.compress('\n'.join(json.dumps(r) for r in records).encode('utf-8'))
+        key = f"TRIP/type=X/year=2023/month=2/day={index % 28 + 1}/part-{index:06d}.json.gz"
+        for bucket in ('bench-source', 'bench-backup'):
+            client.put_object(Bucket=bucket, Key=key, Body=body)
+    
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(put, range(object_count)))
+
+
+# (이름, 백엔드, 다운로드 방식)
+BENCH_CONFIGS = [
+    ("s3", "s3", "stream"),
+    ("small", "s3", "small"),
+    ("async", "async", "stream"),
+]
+
+
+def run_backend(endpoint_url: str, name: str, backend: str, download_mode: str):
+    """지정한 설정으로 비교를 실행하고 (소요 시간, 전체 결과)를 반환합니다"""
+    comparer = S3JSONComparer(
+        source_bucket='bench-source',
+        backup_bucket='bench-backup',
+        download_mode=download_mode,
+        backend=backend,
+        endpoint_url=endpoint_url
+    )
+    
+    report_path = f"bench_{name}_report.csv"
+    start_time = time.time()
+    comparer.compare_buckets('TRIP/', 'TRIP/', report_path=report_path)
+    duration = time.time() - start_time
+    
+    if backend == 'async':
+        comparer.s3_handler.close()
+    
+    for path in Path('.').glob(f"bench_{name}_report*.csv"):
+        path.unlink()
+    
+    overall = next(r for r in comparer.compare_results if r.file_path == "OVERALL_COMPARISON")
+    return duration, overall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 S3 백엔드 벤치마크 (moto 서버)")
+    parser.add_argument('--objects', type=int, default=1000, help="버킷당 객체 수")
+    parser.add_argument('--records', type=int, default=20, help="객체당 레코드 수")
+    parser.add_argument('--port', type=int, default=5055, help="moto 서버 포트")
+    args = parser.parse_args()
+    
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    
+    server = ThreadedMotoServer(port=args.port, verbose=False)
+    server.start()
+    endpoint_url = f"http://127.0.0.1:{args.port}"
+    
+    try:
+        upload_objects(endpoint_url, args.objects, args.records)
+        
+        results = {}
+        for name, backend, download_mode in BENCH_CONFIGS:
+            duration, overall = run_backend(endpoint_url, name, backend, download_mode)
+            results[name] = overall
+            objects_per_second = 2 * args.objects / duration if duration else 0
+            print(f"{name:>5}: {duration:.2f}s, {objects_per_second:,.0f} objects/s, "
+                  f"matched={overall.matched_records}, mismatched={overall.mismatched_records}")
+        
+        first = results[BENCH_CONFIGS[0][0]]
+        assert all(result == first for result in results.values()), "설정별 비교 결과가 다릅니다"
+        print("모든 설정의 비교 결과가 일치합니다")
+    
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
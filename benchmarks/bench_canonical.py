@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+레코드 정규화/해시 마이크로벤치마크
+
+기존 방식(_normalize_record로 정렬된 dict 사본 생성 → json.dumps(sort_keys=True) →
+UTF-8 인코딩 → sha256)과 정규화 바이트를 바로 해시하는 방식(utils.canonical)의
+처리량(records/s)을 비교하고, 설치된 레코드 해시 알고리즘(utils.hashers)별 처리량도 측정합니다.
+
+사용법:
+    pip install orjson xxhash blake3
+    python benchmarks/bench_canonical.py --records 200000
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.canonical import canonical_bytes, get_canonical_encoder, orjson
+from utils.hashers import HASH_ALGORITHMS, describe_hash_algorithm, get_hasher
+
+
+def make_records(record_count: int) -> list:
+    """텔레메트리와 비슷한 레코드를 만듭니다 (키 순서는 레코드마다 섞음)"""
+    rng = random.Random(0)
+    records = []
+    for index in range(record_count):
+        record = {
+            "device_id": f"dev-{index % 5000:05d}",
+            "ts": 1675209600000 + index,
+            "speed": round(rng.uniform(0, 120), 3),
+            "location": {"lon": rng.uniform(126, 130), "lat": rng.uniform(33, 38)},
+            "status": rng.choice(["DRIVE", "IDLE", "PARK"]),
+            "tags": ["can", "gps"],
+            "name": "한글 데이터"
+        }
+        items = list(record.items())
+        rng.shuffle(items)
+        records.append(dict(items))
+    return records
+
+
+def normalize_record(record):
+    """기존 S3JSONComparer._normalize_record"""
+    if isinstance(record, dict):
+        return {k: normalize_record(v) for k, v in sorted(record.items())}
+    elif isinstance(record, list):
+        return [normalize_record(item) for item in record]
+    else:
+        return record
+
+
+def legacy_hash(record) -> str:
+    """기존 _normalize_record + _generate_record_hash 조합"""
+    record_json = json.dumps(normalize_record(record), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(record_json.encode('utf-8')).hexdigest()
+
+
+def run(label: str, records: list, hash_record) -> float:
+    """모든 레코드를 해시하고 records/s를 출력합니다"""
+    start_time = time.perf_counter()
+    for record in records:
+        hash_record(record)
+    duration = time.perf_counter() - start_time
+    
+    records_per_second = len(records) / duration if duration else 0
+    print(f"{label:<34} {duration:6.2f}s  {records_per_second:>12,.0f} records/s")
+    return records_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레코드 정규화/해시 마이크로벤치마크")
+    parser.add_argument('--records', type=int, default=200_000, help="레코드 수")
+    args = parser.parse_args()
+    
+    records = make_records(args.records)
+    encode_json = get_canonical_encoder(use_orjson=False)
+    
+    baseline = run("normalize + json.dumps (이전)", records, legacy_hash)
+    run("정규화 바이트 (json)", records,
+        lambda record: hashlib.sha256(encode_json(record)).hexdigest())
+    
+    if orjson is not None:
+        encode_orjson = get_canonical_encoder(use_orjson=True)
+        fast = run("정규화 바이트 (orjson OPT_SORT_KEYS)", records,
+                   lambda record: hashlib.sha256(encode_orjson(record)).hexdigest())
+        print(f"속도 향상: {fast / baseline:.1f}배")
+    else:
+        print("orjson이 설치되어 있지 않아 orjson 측정을 건너뜁니다")
+    
+    # 정규화 바이트는 미리 만들어 두고 해시 알고리즘만 비교
+    encoded = [canonical_bytes(record) for record in records]
+    print()
+    for algorithm in HASH_ALGORITHMS:
+        try:
+            digest = get_hasher(algorithm)
+        except ImportError as e:
+            print(f"{algorithm}: {e}")
+            continue
+        run(f"해시 {describe_hash_algorithm(algorithm)}", encoded, digest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+JSONL 파싱 벤치마크
+
+gzip JSONL 파일을 만들어 기존 방식(TextIOWrapper + json.loads)과 바이트 줄 파싱
+(json.loads / orjson), chunk_size 배치 파싱(process_stream_batches)의 처리량(records/s)을
+비교합니다.
+
+사용법:
+    pip install orjson
+    python benchmarks/bench_jsonl_parse.py --lines 2000000
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.json_processor import JSONProcessor, orjson
+
+
+def write_jsonl(path: str, line_count: int):
+    """텔레메트리와 비슷한 레코드로 gzip JSONL 파일을 만듭니다"""
+    rng = random.Random(0)
+    with gzip.open(path, 'wt', encoding='utf-8', compresslevel=1) as f:
+        for index in range(line_count):
+            record = {
+                "device_id": f"dev-{index % 5000:05d}",
+                "ts": 1675209600000 + index,
+                "speed": round(rng.uniform(0, 120), 3),
+                "location": {"lat": rng.uniform(33, 38), "lon": rng.uniform(126, 130)},
+                "status": rng.choice(["DRIVE", "IDLE", "PARK"]),
+                "tags": ["can", "gps"],
+                "name": "한글 데이터"
+            }
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+
+
+def run(label: str, path: str, text: bool, use_orjson: bool, batches: bool = False) -> float:
+    """파일 전체를 파싱하고 records/s를 출력합니다"""
+    processor = JSONProcessor(use_orjson=use_orjson)
+    
+    start_time = time.time()
+    with gzip.open(path, 'rb') as binary_stream:
+        stream = io.TextIOWrapper(binary_stream, encoding='utf-8') if text else binary_stream
+        if batches:
+            record_count = sum(len(batch) for batch in processor.process_stream_batches(stream))
+        else:
+            record_count = sum(1 for _ in processor.process_stream(stream))
+    duration = time.time() - start_time
+    
+    records_per_second = record_count / duration if duration else 0
+    print(f"{label:<28} {record_count:>10,} records  {duration:6.2f}s  "
+          f"{records_per_second:>12,.0f} records/s")
+    return records_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSONL 파싱 벤치마크")
+    parser.add_argument('--lines', type=int, default=2_000_000, help="JSONL 줄 수")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'bench.jsonl.gz')
+        print(f"{args.lines:,}줄 gzip JSONL 생성 중...")
+        write_jsonl(path, args.lines)
+        
+        baseline = run("text + json.loads (이전)", path, text=True, use_orjson=False)
+        run("bytes + json.loads", path, text=False, use_orjson=False)
+        if orjson is not None:
+            fast = run("bytes + orjson", path, text=False, use_orjson=True)
+            fast = run("bytes + orjson (배치)", path, text=False, use_orjson=True, batches=True)
+            print(f"속도 향상: {fast / baseline:.1f}배")
+        else:
+            print("orjson이 설치되어 있지 않아 orjson 측정을 건너뜁니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,17 @@ S3 JSON 데이터 일치성 비교 프로그램
 AWS S3 버킷에 저장된 대용량 JSON 데이터의 백업 무결성을 검증하는 프로그램
 """
 
+import argparse
 import asyncio
 import concurrent.futures
-import gzip
-import hashlib
+import io
 import json
 import logging
 import os
 import sys
 import time
+from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Generator, List, Optional, Tuple, Union
@@ -23,11 +25,38 @@ import ijson
 from botocore.exceptions import ClientError, NoCredentialsError
 from tqdm import tqdm
 
-from utils.s3_handler import S3Handler
-from utils.json_processor import JSONProcessor
+from utils.s3_handler import DEFAULT_MAX_POOL_CONNECTIONS, S3Handler
+from utils.async_s3_handler import DEFAULT_ASYNC_CONCURRENCY, AsyncS3Handler
+from utils.inventory import InventoryReader
+from utils.canonical import canonical_bytes
+from utils.compression import decompress_bytes, open_decompressed
+from utils.hashers import (
+    DEFAULT_HASH_ALGORITHM, HASH_ALGORITHMS, describe_hash_algorithm, get_hasher
+)
+from utils.json_processor import (
+    CSV_COLUMN_TYPES, DETECT_HEAD_SIZE, PROCESS_MODES, JSONProcessor, peek_head
+)
+from utils.listing_cache import (
+    DEFAULT_LISTING_CACHE_RECONCILE_INTERVAL, DEFAULT_LISTING_CACHE_TTL, ListingCache
+)
+from utils.local_handler import LocalFileHandler, is_local_location, local_root
+from utils.object_info import ObjectInfo
+from utils.object_verifier import DEFAULT_VERIFY_WORKERS, VERIFICATION_STRENGTHS, ObjectVerifier
+from utils.prefetcher import (
+    DEFAULT_PREFETCH_BYTES, DEFAULT_PREFETCH_COUNT, DEFAULT_PREFETCH_MAX_OBJECT_BYTES,
+    DEFAULT_SMALL_OBJECT_CONCURRENCY,
+    DEFAULT_SMALL_OBJECT_MAX_BYTES,
+    ConcurrentObjectProcessor, ObjectPrefetcher
+)
 from utils.report_generator import ReportGenerator
 from utils.logger import setup_logger
 
+# "ranged" 다운로드 모드에서 범위 병렬 다운로드를 사용할 최소 객체 크기
+DEFAULT_RANGE_THRESHOLD = 64 * 1024 * 1024
+
+# 불일치 줄을 다시 읽을 때 앞의 내용을 건너뛰며 한 번에 읽을 크기
+_SKIP_READ_SIZE = 1024 * 1024
+
 
 @dataclass
 class CompareResult:
@@ -41,31 +70,201 @@ class CompareResult:
     missing_in_source: int
     errors: List[str]
     processing_time: float
+    verification: str = "content"
+    verification_strength: str = ""
+    verified_objects: int = 0
+    verified_bytes: int = 0
+    verified_records: Optional[int] = None
 
 
 class S3JSONComparer:
     """S3 JSON 데이터 비교 클래스"""
     
     def __init__(self, source_bucket: str, backup_bucket: str, 
-                 processes: int = 4, chunk_size: int = 10000):
+                 processes: int = 4, chunk_size: int = 10000,
+                 download_mode: str = "stream",
+                 prefetch_count: int = DEFAULT_PREFETCH_COUNT,
+                 prefetch_bytes: int = DEFAULT_PREFETCH_BYTES,
+                 prefetch_max_object_bytes: int = DEFAULT_PREFETCH_MAX_OBJECT_BYTES,
+                 max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+                 parallel_listing: bool = True,
+                 range_threshold: int = DEFAULT_RANGE_THRESHOLD,
+                 source_inventory: Optional[str] = None,
+                 backup_inventory: Optional[str] = None,
+                 listing_cache_path: Optional[str] = None,
+                 listing_cache_ttl: float = DEFAULT_LISTING_CACHE_TTL,
+                 listing_cache_reconcile_interval: float = DEFAULT_LISTING_CACHE_RECONCILE_INTERVAL,
+                 force_refresh_listing: bool = False,
+                 backend: str = "s3",
+                 async_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+                 endpoint_url: Optional[str] = None,
+                 small_object_concurrency: int = DEFAULT_SMALL_OBJECT_CONCURRENCY,
+                 small_object_max_bytes: int = DEFAULT_SMALL_OBJECT_MAX_BYTES,
+                 compare_mode: str = "jsonl",
+                 csv_column_types: Optional[Dict[str, str]] = None,
+                 hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
+                 raw_line_tier: bool = True,
+                 object_fast_path: bool = True,
+                 object_verify_workers: int = DEFAULT_VERIFY_WORKERS,
+                 count_verified_records: bool = False):
+        """
+        S3JSONComparer 초기화
+        
+        Args:
+            source_bucket: 소스 버킷명 (로컬 디렉터리 경로 또는 file:// URL도 가능)
+            backup_bucket: 백업 버킷명 (로컬 디렉터리 경로 또는 file:// URL도 가능)
+            processes: 프로세스 수
+            chunk_size: 청크 크기 (레코드 수)
+            download_mode: 다운로드 방식 ("stream": 단일 GET 스트리밍,
+                "ranged": 바이트 범위 병렬 다운로드,
+                "small": 수 KB 객체를 많이 동시에 통째로 읽는 작은 객체 모드)
+            prefetch_count: 해시하는 동안 미리 내려받을 객체 수 (0이면 순차 스트리밍)
+            prefetch_bytes: 미리 내려받은 객체가 차지할 수 있는 최대 메모리 (바이트)
+            prefetch_max_object_bytes: 미리 통째로 내려받을 최대 객체 크기
+                (이 크기 이상인 객체는 버퍼링하지 않고 바로 스트리밍)
+            max_pool_connections: 모든 작업 스레드가 공유하는 S3 연결 풀 크기
+            parallel_listing: 하위 접두사(month=, day= 등)를 병렬로 나열할지 여부
+            range_threshold: "ranged" 모드에서 범위 병렬 다운로드를 사용할 최소 객체 크기
+            source_inventory: 소스 목록으로 사용할 S3 Inventory manifest.json 위치
+                (로컬 경로 또는 s3://, CSV/Parquet)
+            backup_inventory: 백업 목록으로 사용할 S3 Inventory manifest.json 위치
+            listing_cache_path: 목록 캐시 SQLite 파일 경로 (None이면 캐시 미사용)
+            listing_cache_ttl: 목록 조회 없이 캐시를 사용할 시간 (초)
+            listing_cache_reconcile_interval: TTL 이후 증분(StartAfter) 갱신 대신 전체 목록으로
+                다시 맞추는 주기 (초, 0이면 매번 전체 목록 조회)
+            force_refresh_listing: 캐시를 무시하고 전체 목록을 다시 조회할지 여부
+            backend: S3 백엔드 ("s3": boto3 스레드 기반, "async": aiobotocore 기반.
+                "async"는 "small" 모드에서 비동기 fetch 파이프라인을 사용하고,
+                "stream" 모드에서는 S3Handler와 같이 객체를 스트리밍합니다. "ranged"와는 함께 사용 불가)
+            async_concurrency: "async" 백엔드의 동시 GET 요청 수
+            endpoint_url: S3 호환 엔드포인트 URL (로컬 moto 서버 등)
+            small_object_concurrency: "small" 모드의 동시 GET 요청 수
+                (연결 풀도 이 크기 이상으로 늘림)
+            small_object_max_bytes: "small" 모드에서 메모리로 한 번에 압축 해제할 최대 크기
+                (넘는 객체는 스트리밍으로 압축 해제/파싱)
+            compare_mode: 레코드 형식 ("jsonl", "array", "single", "csv",
+                "auto": 객체마다 앞부분과 압축 형식을 보고 자동 감지)
+            csv_column_types: CSV 열별 타입 ({열 이름: "int"/"float"/"bool"/"json"/"str"}).
+                지정하지 않은 열은 문자열로 비교합니다.
+            hash_algorithm: 레코드 해시 알고리즘 ("xxh3_128", "blake2b", "blake3", "sha256_128", "sha256").
+                다이제스트는 bytes로 저장/비교하며, 리포트에 사용한 알고리즘이 기록됩니다.
+            raw_line_tier: JSONL 줄을 먼저 파싱 없이 원본 바이트로 해시해 비교하고,
+                일치하지 않은 줄만 파싱/정규화 해시할지 여부 (바이트 단위 복사본이면 파싱 생략)
+            object_fast_path: 상대 키가 같은 객체 쌍을 먼저 크기/ETag/추가 체크섬으로 비교하고,
+                같으면 내용을 내려받지 않고 객체 단위로 검증된 것으로 처리할지 여부
+            object_verify_workers: 체크섬 HEAD 요청/ETag 재계산을 동시에 수행할 객체 쌍 수
+            count_verified_records: 객체 단위로 검증된 객체도 소스 쪽을 읽어 레코드 수를 셀지 여부
+                (해시/비교는 하지 않으며, 리포트의 verified_records 열에 기록)
+        """
+        if download_mode not in ("stream", "ranged", "small"):
+            raise ValueError(f"지원하지 않는 다운로드 방식: {download_mode}")
+        if backend not in ("s3", "async"):
+            raise ValueError(f"지원하지 않는 백엔드: {backend}")
+        if backend == "async" and download_mode == "ranged":
+            raise ValueError(
+                "비동기 백엔드는 범위 병렬 다운로드(download_mode=\"ranged\")를 지원하지 않습니다. "
+                "\"stream\" 또는 \"small\"을 사용하세요"
+            )
+        if compare_mode not in PROCESS_MODES:
+            raise ValueError(f"지원하지 않는 비교 모드: {compare_mode}")
+        
         self.source_bucket = source_bucket
         self.backup_bucket = backup_bucket
         self.processes = processes
         self.chunk_size = chunk_size
+        self.download_mode = download_mode
+        self.prefetch_count = prefetch_count
+        self.prefetch_bytes = prefetch_bytes
+        self.prefetch_max_object_bytes = prefetch_max_object_bytes
+        self.parallel_listing = parallel_listing
+        self.range_threshold = range_threshold
+        self.source_inventory = source_inventory
+        self.backup_inventory = backup_inventory
+        self.force_refresh_listing = force_refresh_listing
+        self.backend = backend
+        self.small_object_concurrency = small_object_concurrency
+        self.small_object_max_bytes = small_object_max_bytes
+        self.compare_mode = compare_mode
+        self.hash_algorithm = hash_algorithm
+        self._digest = get_hasher(hash_algorithm)
+        self.raw_line_tier = raw_line_tier
+        self.object_fast_path = object_fast_path
+        self.count_verified_records = count_verified_records
         self.logger = setup_logger(__name__)
         
-        # S3 핸들러 초기화
-        self.s3_handler = S3Handler()
-        self.json_processor = JSONProcessor(chunk_size)
+        # 작은 객체 모드는 동시 요청마다 keep-alive 연결 하나씩 사용
+        if download_mode == "small":
+            max_pool_connections = max(max_pool_connections, small_object_concurrency)
+        
+        # S3 핸들러 초기화 (양쪽 모두 로컬 디렉터리이면 AWS 자격 증명 없이 동작)
+        self.local_handler = LocalFileHandler()
+        if is_local_location(source_bucket) and is_local_location(backup_bucket):
+            self.s3_handler = None
+        elif backend == "async":
+            self.s3_handler = AsyncS3Handler(
+                max_concurrency=async_concurrency,
+                endpoint_url=endpoint_url
+            )
+        else:
+            self.s3_handler = S3Handler(
+                max_pool_connections=max_pool_connections,
+                endpoint_url=endpoint_url
+            )
+        self.inventory_reader = InventoryReader(self.s3_handler)
+        self.listing_cache = (
+            ListingCache(listing_cache_path, listing_cache_ttl, listing_cache_reconcile_interval)
+            if listing_cache_path else None
+        )
+        self.json_processor = JSONProcessor(chunk_size, csv_column_types=csv_column_types)
         self.report_generator = ReportGenerator()
+        self.object_verifier = ObjectVerifier(self._handler_for, object_verify_workers)
         
         # 결과 저장
         self.compare_results: List[CompareResult] = []
         
+    def close(self):
+        """S3 핸들러(비동기 백엔드의 이벤트 루프/클라이언트 포함)와 목록 캐시를 닫습니다"""
+        close_handler = getattr(self.s3_handler, 'close', None)
+        if close_handler is not None:
+            close_handler()
+        if self.listing_cache is not None:
+            self.listing_cache.close()
+    
+    def __enter__(self) -> "S3JSONComparer":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _handler_for(self, bucket: str):
+        """버킷 위치에 맞는 핸들러를 반환합니다 (로컬 디렉터리 또는 S3)"""
+        return self.local_handler if is_local_location(bucket) else self.s3_handler
+    
     def get_file_list(self, bucket: str, prefix: str = "") -> List[str]:
         """S3 버킷에서 파일 목록을 가져옵니다"""
+        return [obj.key for obj in self.get_object_list(bucket, prefix)]
+    
+    def get_object_list(self, bucket: str, prefix: str = "",
+                        inventory_manifest: Optional[str] = None) -> List[ObjectInfo]:
+        """S3 버킷에서 크기/ETag 등을 포함한 객체 정보 목록을 가져옵니다 (인벤토리 우선)"""
         try:
-            return self.s3_handler.list_files(bucket, prefix)
+            if inventory_manifest:
+                # 목록 조회 대신 S3 Inventory 매니페스트 사용
+                return self.inventory_reader.list_objects(inventory_manifest, prefix)
+            
+            if self.listing_cache is not None:
+                # 로컬 목록 캐시 사용 (TTL 이후에는 증분 갱신, 주기적으로 전체 목록 재조회)
+                return self.listing_cache.get_objects(
+                    bucket, prefix,
+                    lambda start_after: self._handler_for(bucket).list_objects(
+                        bucket, prefix, parallel=self.parallel_listing, start_after=start_after
+                    ),
+                    force_refresh=self.force_refresh_listing
+                )
+            
+            return self._handler_for(bucket).list_objects(
+                bucket, prefix, parallel=self.parallel_listing
+            )
         except Exception as e:
             self.logger.error(f"파일 목록 가져오기 실패: {e}")
             return []
@@ -98,13 +297,13 @@ class S3JSONComparer:
             )
             result.backup_records = len(backup_hashes)
             
-            # 해시 비교
-            source_set = set(source_hashes)
-            backup_set = set(backup_hashes)
+            # 해시 비교 (같은 레코드가 여러 번 나오면 개수까지 비교)
+            source_counts = Counter(source_hashes)
+            backup_counts = Counter(backup_hashes)
             
-            result.matched_records = len(source_set.intersection(backup_set))
-            result.missing_in_backup = len(source_set - backup_set)
-            result.missing_in_source = len(backup_set - source_set)
+            result.matched_records = sum((source_counts & backup_counts).values())
+            result.missing_in_backup = sum((source_counts - backup_counts).values())
+            result.missing_in_source = sum((backup_counts - source_counts).values())
             result.mismatched_records = (
                 result.missing_in_backup + result.missing_in_source
             )
@@ -117,79 +316,488 @@ class S3JSONComparer:
         result.processing_time = time.time() - start_time
         return result
     
-    def _generate_file_hashes(self, bucket: str, file_path: str) -> List[str]:
-        """파일에서 레코드별 해시를 생성합니다"""
-        hashes = []
+    @contextmanager
+    def _open_binary_stream(self, bucket: str, file_path: str,
+                            data: Optional[bytes] = None) -> Generator[io.BufferedIOBase, None, None]:
+        """S3 객체를 스트리밍으로 열어 (필요 시 압축 해제 후) 바이너리 스트림으로 제공합니다"""
+        handler = self._handler_for(bucket)
+        if data is not None:
+            # 프리페치로 이미 내려받은 객체
+            stream = io.BytesIO(data)
+        elif self.download_mode == "ranged":
+            stream = handler.open_file_stream_ranged(bucket, file_path)
+        else:
+            stream = handler.open_file_stream(bucket, file_path)
         
         try:
-            # S3에서 스트림으로 파일 읽기
-            stream = self.s3_handler.get_file_stream(bucket, file_path)
-            
-            # 압축 파일 처리
-            if file_path.endswith('.gz'):
-                gzip_stream = gzip.GzipFile(fileobj=stream)
-                # gzip 스트림을 텍스트로 디코딩
-                import io
-                text_stream = io.TextIOWrapper(gzip_stream, encoding='utf-8')
-            else:
-                # 바이너리 스트림을 텍스트로 디코딩
-                import io
-                text_stream = io.TextIOWrapper(stream, encoding='utf-8')
+            # 압축 파일 처리 (확장자 대신 매직 바이트로 gzip/zstd/bz2/xz 판단,
+            # StreamingBody를 압축 해제 스트림에 직접 연결)
+            binary_stream = open_decompressed(stream)
             
-            # JSON 처리 모드에 따라 다른 방식으로 처리
-            for record in self.json_processor.process_stream(text_stream):
-                # 레코드를 정규화하고 해시 생성
-                normalized_record = self._normalize_record(record)
-                record_hash = self._generate_record_hash(normalized_record)
-                hashes.append(record_hash)
+            # 텍스트로 디코딩하지 않고 바이트 줄을 그대로 파서에 전달
+            try:
+                yield binary_stream
+            finally:
+                binary_stream.close()
+        finally:
+            stream.close()
+    
+    @contextmanager
+    def _open_record_batches(self, bucket: str, file_path: str, data: Optional[bytes] = None,
+                             raw: bool = False, mode: Optional[str] = None
+                             ) -> Generator[Tuple[bool, Generator[List, None, None]], None, None]:
+        """
+        객체를 열어 레코드(또는 JSONL 원본 줄) 배치 제너레이터를 제공합니다
+        
+        "auto" 모드는 압축 해제된 앞부분으로 형식을 판단하며, raw는 JSONL 객체에만
+        적용됩니다 (다른 형식은 파싱된 레코드 배치를 제공).
+        
+        Args:
+            bucket: 버킷명
+            file_path: 파일 경로
+            data: 이미 내려받은 (압축된) 객체 내용 (None이면 S3에서 스트리밍으로 읽음)
+            raw: JSONL이면 줄을 파싱하지 않고 원본 줄 배치를 제공할지 여부
+            mode: 처리 모드 (기본값: compare_mode)
+        
+        Yields:
+            (원본 줄 배치 여부, 배치 제너레이터)
+        """
+        mode = mode or self.compare_mode
+        
+        if data is not None and self.download_mode == "small":
+            # 작은 객체는 스트림 래퍼 없이 바이트에서 바로 파싱 (압축 해제 크기 제한,
+            # 넘으면 아래 스트리밍 경로로 압축 해제)
+            decompressed = decompress_bytes(data, max_size=self.small_object_max_bytes)
+            if decompressed is not None:
+                if mode == "auto":
+                    mode = JSONProcessor.detect_mode(decompressed[:DETECT_HEAD_SIZE])
+                raw = raw and mode == "jsonl"
+                yield raw, self.json_processor.process_bytes_batches(decompressed, mode, raw)
+                return
+        
+        # 스트리밍으로 압축 해제/파싱 (프리페치로 받은 바이트도 BytesIO로 감싸 스트리밍하므로
+        # 압축 해제된 전체 내용을 메모리에 올리지 않음)
+        with self._open_binary_stream(bucket, file_path, data) as binary_stream:
+            if mode == "auto":
+                mode = JSONProcessor.detect_mode(peek_head(binary_stream))
+            raw = raw and mode == "jsonl"
+            yield raw, self.json_processor.process_stream_batches(binary_stream, mode, raw)
+    
+    def _generate_file_hashes(self, bucket: str, file_path: str,
+                              data: Optional[bytes] = None) -> List[bytes]:
+        """파일에서 레코드별 해시를 생성합니다 (data가 주어지면 다시 내려받지 않음)"""
+        return self._generate_file_digests(bucket, file_path, data, raw=False)[1]
+    
+    def _generate_file_digests(self, bucket: str, file_path: str,
+                               data: Optional[bytes] = None,
+                               raw: Optional[bool] = None) -> Tuple[Optional[List[int]], List[bytes]]:
+        """
+        파일의 다이제스트 목록을 생성합니다
+        
+        JSONL 객체는 1단계로 앞뒤 공백만 제거한 원본 줄을 파싱 없이 해시하고,
+        그 밖의 형식은 레코드를 파싱하여 정규화 바이트를 해시합니다.
+        
+        Args:
+            bucket: 버킷명
+            file_path: 파일 경로
+            data: 이미 내려받은 객체 내용 (None이면 스트리밍으로 읽음)
+            raw: JSONL 원본 줄 해시를 사용할지 여부 (기본값: raw_line_tier)
+        
+        Returns:
+            (원본 줄 다이제스트이면 압축 해제된 내용 기준 줄 시작 위치 목록, 아니면 None;
+             다이제스트 목록)
+        """
+        raw = self.raw_line_tier if raw is None else raw
+        offsets = None
+        digests = []
+        
+        try:
+            with self._open_record_batches(bucket, file_path, data, raw=raw) as (raw, batches):
+                if raw:
+                    digest = self._digest
+                    offsets = []
+                    for batch_offsets, lines in batches:
+                        offsets.extend(batch_offsets)
+                        digests.extend([digest(line) for line in lines])
+                else:
+                    for batch in batches:
+                        # 배치마다 정규화 바이트로 직렬화하고 해시 생성
+                        digests.extend(self._hash_records(batch))
                 
         except Exception as e:
             raise Exception(f"파일 해시 생성 실패 ({file_path}): {str(e)}")
         
-        return hashes
+        return offsets, digests
     
-    def _normalize_record(self, record: Dict) -> Dict:
-        """레코드를 정규화합니다 (키 순서 정렬)"""
-        if isinstance(record, dict):
-            return {k: self._normalize_record(v) for k, v in sorted(record.items())}
-        elif isinstance(record, list):
-            return [self._normalize_record(item) for item in record]
-        else:
-            return record
+    def _hash_lines_at(self, bucket: str, file_path: str,
+                       lines: List[Tuple[int, int]]) -> List[Tuple[bytes, int]]:
+        """
+        1단계에서 기록한 시작 위치의 JSONL 줄만 읽어 정규화 해시를 생성합니다 (2단계)
+        
+        사이의 내용은 줄로 나누거나 해시하지 않고 읽어 넘기며, 마지막으로 필요한 줄까지만
+        읽고 스트림을 닫습니다.
+        
+        Args:
+            bucket: 버킷명
+            file_path: 파일 경로
+            lines: (줄 시작 위치, 레코드 수) 목록 (시작 위치 순으로 정렬)
+        
+        Returns:
+            (정규화 해시, 레코드 수) 목록 (파싱할 수 없는 줄은 경고 후 제외)
+        """
+        rows = []
+        position = 0
+        
+        with self._open_binary_stream(bucket, file_path) as stream:
+            for offset, occurrences in lines:
+                remaining = offset - position
+                while remaining > 0:
+                    skipped = len(stream.read(min(remaining, _SKIP_READ_SIZE)))
+                    if not skipped:
+                        raise EOFError(f"줄 위치 {offset}가 객체 끝을 넘음 (비교 도중 객체가 바뀜)")
+                    remaining -= skipped
+                
+                line = stream.readline()
+                position = offset + len(line)
+                try:
+                    record = self.json_processor.parse_line(line)
+                except ValueError as e:
+                    self.logger.warning(f"JSON 파싱 오류 ({file_path}, 위치 {offset}): {e}")
+                    continue
+                rows.append((self._generate_record_hash(record), occurrences))
+        
+        return rows
+    
+    def _generate_record_hash(self, record: Dict) -> bytes:
+        """레코드의 해시 다이제스트를 생성합니다 (키 정렬된 정규화 바이트를 바로 해시)"""
+        return self._digest(canonical_bytes(record))
     
-    def _generate_record_hash(self, record: Dict) -> str:
-        """레코드의 해시를 생성합니다"""
-        record_json = json.dumps(record, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(record_json.encode('utf-8')).hexdigest()
+    def _hash_records(self, records: List[Dict]) -> List[bytes]:
+        """레코드 배치의 해시 다이제스트 목록을 생성합니다 (레코드마다 메서드 호출 체인을 거치지 않음)"""
+        encode = canonical_bytes
+        digest = self._digest
+        return [digest(encode(record)) for record in records]
     
-    def _find_record_by_hash(self, bucket: str, file_path: str, target_hash: str) -> Optional[Dict]:
+    def _find_record_by_hash(self, bucket: str, file_path: str, target_hash: bytes) -> Optional[Dict]:
         """특정 해시에 해당하는 원본 JSON 레코드를 찾습니다"""
         try:
-            # S3에서 스트림으로 파일 읽기
-            stream = self.s3_handler.get_file_stream(bucket, file_path)
+            # S3에서 스트리밍으로 파일 읽기
+            with self._open_binary_stream(bucket, file_path) as binary_stream:
+                # JSON 처리 모드에 따라 다른 방식으로 처리
+                for record in self.json_processor.process_stream(binary_stream, self.compare_mode):
+                    # 레코드를 정규화 바이트로 직렬화하여 해시 생성
+                    record_hash = self._generate_record_hash(record)
+                    
+                    if record_hash == target_hash:
+                        return record  # 원본 레코드 반환 (정규화되지 않은)
+                    
+        except Exception as e:
+            self.logger.error(f"해시로 레코드 찾기 실패 ({file_path}, {target_hash.hex()[:16]}...): {str(e)}")
+        
+        return None
+    
+    def _iter_file_payloads(self, bucket: str, objects: List[ObjectInfo]
+                            ) -> Generator[Tuple[str, Optional[bytes], Optional[Exception]], None, None]:
+        """파일을 순서대로 반환하되, 프리페치가 켜져 있으면 다음 파일들을 미리 내려받습니다"""
+        # 로컬 파일은 미리 메모리로 읽지 않고 큰 버퍼로 직접 스트리밍
+        if self.prefetch_count <= 0 or is_local_location(bucket):
+            for obj in objects:
+                yield obj.key, None, None
+            return
+        
+        # 큰 객체는 미리 통째로 받지 않고 바로 스트리밍 (범위 다운로드 모드에서는
+        # range_threshold 이상인 객체를 범위 병렬 스트림으로 처리)
+        stream_threshold = self.prefetch_max_object_bytes
+        if self.download_mode == "ranged":
+            stream_threshold = min(stream_threshold, self.range_threshold)
+        
+        prefetcher = ObjectPrefetcher(
+            lambda key: self.s3_handler.get_file_bytes(bucket, key),
+            max_prefetch=self.prefetch_count,
+            max_inflight_bytes=self.prefetch_bytes,
+            stream_threshold=stream_threshold
+        )
+        yield from prefetcher.iter_objects((obj.key, obj.size) for obj in objects)
+    
+    def _iter_file_digests(self, bucket: str, objects: List[ObjectInfo]
+                           ) -> Generator[Tuple[str, Optional[Tuple[Optional[List[int]], List[bytes]]], Optional[Exception]], None, None]:
+        """
+        파일별 (원본 줄 시작 위치 목록 또는 None, 다이제스트 목록)을 반환합니다
+        (비동기 백엔드/작은 객체 모드는 완료 순서대로)
+        """
+        if self.download_mode == "small":
+            # 통째로 읽을 작은 객체와 스트리밍할 큰 객체를 나눔 (큰 객체는 아래 순차 경로)
+            small_keys = [obj.key for obj in objects if obj.size <= self.small_object_max_bytes]
+            objects = [obj for obj in objects if obj.size > self.small_object_max_bytes]
             
-            # 압축 파일 처리
-            if file_path.endswith('.gz'):
-                gzip_stream = gzip.GzipFile(fileobj=stream)
-                import io
-                text_stream = io.TextIOWrapper(gzip_stream, encoding='utf-8')
+            if self.backend == "async" and not is_local_location(bucket):
+                # 비동기 fetch → 스레드 풀 압축 해제/해시 파이프라인
+                yield from self.s3_handler.iter_processed(
+                    bucket,
+                    small_keys,
+                    lambda file_path, data: self._generate_file_digests(bucket, file_path, data),
+                    concurrency=self.small_object_concurrency
+                )
             else:
-                import io
-                text_stream = io.TextIOWrapper(stream, encoding='utf-8')
+                # 많은 GET을 동시에 보내고 작업 스레드에서 바로 압축 해제/해시
+                handler = self._handler_for(bucket)
+                processor = ConcurrentObjectProcessor(
+                    lambda file_path: self._generate_file_digests(
+                        bucket, file_path, handler.get_file_bytes(bucket, file_path)
+                    ),
+                    max_workers=self.small_object_concurrency
+                )
+                yield from processor.iter_results(small_keys)
+        
+        for file_path, data, fetch_error in self._iter_file_payloads(bucket, objects):
+            if fetch_error is not None:
+                yield file_path, None, fetch_error
+                continue
             
-            # JSON 처리 모드에 따라 다른 방식으로 처리
-            for record in self.json_processor.process_stream(text_stream):
-                # 레코드를 정규화하고 해시 생성
-                normalized_record = self._normalize_record(record)
-                record_hash = self._generate_record_hash(normalized_record)
-                
-                if record_hash == target_hash:
-                    return record  # 원본 레코드 반환 (정규화되지 않은)
+            try:
+                file_digests = self._generate_file_digests(bucket, file_path, data)
+            except Exception as e:
+                yield file_path, None, e
+                continue
+            
+            yield file_path, file_digests, None
+    
+    def _append_file_error(self, file_path: str, message: str):
+        """파일 처리 오류를 비교 결과에 추가합니다"""
+        self.compare_results.append(CompareResult(
+            file_path=file_path,
+            source_records=0,
+            backup_records=0,
+            matched_records=0,
+            mismatched_records=0,
+            missing_in_backup=0,
+            missing_in_source=0,
+            errors=[message],
+            processing_time=0
+        ))
+    
+    def _listing_is_fresh(self, bucket: str, prefix: str,
+                          inventory_manifest: Optional[str], since: float) -> bool:
+        """
+        객체 목록을 since 이후에 직접 조회했는지 확인합니다
+        
+        인벤토리와 TTL 이내이거나 증분 갱신한 목록 캐시는 그 사이 덮어써진 객체의
+        크기/ETag를 반영하지 못하므로, 객체 단위 검증 전에 HEAD로 메타데이터를 다시
+        조회해야 합니다.
+        """
+        if inventory_manifest:
+            return False
+        if self.listing_cache is None:
+            return True
+        reconciled_at = self.listing_cache.reconciled_at(bucket, prefix)
+        return reconciled_at is not None and reconciled_at >= since
+    
+    def _count_file_records(self, bucket: str, file_path: str) -> int:
+        """파일의 레코드 수를 셉니다 (해시하지 않음, JSONL 원본 줄 비교가 켜져 있으면 빈 줄이 아닌 줄 수)"""
+        with self._open_record_batches(bucket, file_path, raw=self.raw_line_tier) as (raw, batches):
+            if raw:
+                return sum(len(lines) for _, lines in batches)
+            return sum(len(batch) for batch in batches)
+    
+    def _verify_objects_by_metadata(self, source_objects: List[ObjectInfo], source_prefix: str,
+                                    backup_objects: List[ObjectInfo], backup_prefix: str,
+                                    refresh_source: bool = False, refresh_backup: bool = False
+                                    ) -> Tuple[List[ObjectInfo], List[ObjectInfo], List[CompareResult]]:
+        """
+        메타데이터가 같은 객체 쌍을 객체 단위로 검증하고 내용 비교 대상에서 제외합니다
+        
+        접두사를 뺀 상대 키로 짝지은 쌍 중 크기가 같고 ETag나 추가 체크섬이 같은 쌍
+        (멀티파트 파트 크기가 달라 ETag가 다르면 한쪽 내용으로 ETag를 다시 계산)은
+        검증 방식과 함께 비교 결과에 기록합니다. 검증된 객체의 레코드는 레코드 수 열에
+        포함하지 않고 verified_objects/verified_bytes(/verified_records) 열에 따로 기록합니다.
+        
+        Args:
+            source_objects: 소스 객체 목록
+            source_prefix: 소스 접두사
+            backup_objects: 백업 객체 목록
+            backup_prefix: 백업 접두사
+            refresh_source: 소스 목록이 오래되었을 수 있어 HEAD로 다시 확인할지 여부
+            refresh_backup: 백업 목록이 오래되었을 수 있어 HEAD로 다시 확인할지 여부
+        
+        Returns:
+            (내용 비교할 소스 객체, 내용 비교할 백업 객체, 검증된 쌍의 비교 결과)
+        """
+        if is_local_location(self.source_bucket) and is_local_location(self.backup_bucket):
+            # 로컬 파일에는 ETag가 없음
+            return source_objects, backup_objects, []
+        
+        pairs = self.object_verifier.pair_objects(
+            source_objects, source_prefix, backup_objects, backup_prefix
+        )
+        verified = self.object_verifier.verify_pairs(
+            self.source_bucket, self.backup_bucket, pairs,
+            refresh_source=refresh_source, refresh_backup=refresh_backup
+        )
+        if not verified:
+            return source_objects, backup_objects, []
+        
+        verified.sort(key=lambda item: item[0].key)
+        record_counts = {}
+        count_errors = {}
+        if self.count_verified_records:
+            # 내용이 같음을 확인했으므로 소스 쪽만 읽어 레코드 수를 셈
+            processor = ConcurrentObjectProcessor(
+                lambda file_path: self._count_file_records(self.source_bucket, file_path),
+                max_workers=self.small_object_concurrency
+            )
+            for file_path, record_count, error in processor.iter_results(
+                source_obj.key for source_obj, _, _ in verified
+            ):
+                if error is not None:
+                    self.logger.error(f"검증된 객체 레코드 수 세기 실패 ({file_path}): {error}")
+                    count_errors[file_path] = f"검증된 객체 레코드 수 세기 실패: {str(error)}"
+                else:
+                    record_counts[file_path] = record_count
+        
+        verified_results = []
+        for source_obj, backup_obj, method in verified:
+            verified_results.append(CompareResult(
+                file_path=source_obj.key,
+                source_records=0,
+                backup_records=0,
+                matched_records=0,
+                mismatched_records=0,
+                missing_in_backup=0,
+                missing_in_source=0,
+                errors=[count_errors[source_obj.key]] if source_obj.key in count_errors else [],
+                processing_time=0,
+                verification=method,
+                verification_strength=VERIFICATION_STRENGTHS[method],
+                verified_objects=1,
+                verified_bytes=source_obj.size,
+                verified_records=record_counts.get(source_obj.key)
+            ))
+        self.compare_results.extend(verified_results)
+        
+        verified_source_keys = {source_obj.key for source_obj, _, _ in verified}
+        verified_backup_keys = {backup_obj.key for _, backup_obj, _ in verified}
+        return (
+            [obj for obj in source_objects if obj.key not in verified_source_keys],
+            [obj for obj in backup_objects if obj.key not in verified_backup_keys],
+            verified_results
+        )
+    
+    def _hash_bucket_files(self, cursor, bucket: str, objects: List[ObjectInfo],
+                           side: str, label: str, file_ids: Dict[str, int]):
+        """
+        버킷의 파일들을 해시하여 SQLite 테이블에 삽입합니다
+        
+        JSONL 원본 줄 다이제스트는 {side}_raw 테이블에 첫 줄의 시작 위치와 함께, 정규화 해시는
+        {side}_hashes 테이블에 삽입하고, 같은 다이제스트가 다시 나오면 occurrences만 늘립니다.
+        파일 경로는 files 테이블에 한 번만 저장하고, 해시 행에는 정수 file_id만 기록합니다
+        (file_ids: 파일 경로 → file_id, 소스/백업이 함께 사용).
+        """
+        pending_rows = []
+        pending_raw_rows = []
+        
+        def file_id_for(file_path: str) -> int:
+            file_id = file_ids.get(file_path)
+            if file_id is None:
+                cursor.execute('INSERT INTO files (file_path) VALUES (?)', (file_path,))
+                file_id = file_ids[file_path] = cursor.lastrowid
+            return file_id
+        
+        def flush_rows():
+            # 작은 파일이 많을 때 파일마다 삽입하지 않고 chunk_size 단위로 모아서 삽입
+            if pending_rows:
+                cursor.executemany(
+                    f'INSERT INTO {side}_hashes (hash, file_id, occurrences) VALUES (?, ?, 1) '
+                    'ON CONFLICT(hash) DO UPDATE SET occurrences = occurrences + 1',
+                    pending_rows
+                )
+                pending_rows.clear()
+            if pending_raw_rows:
+                cursor.executemany(
+                    f'INSERT INTO {side}_raw (hash, file_id, line_offset, occurrences) '
+                    'VALUES (?, ?, ?, 1) '
+                    'ON CONFLICT(hash) DO UPDATE SET occurrences = occurrences + 1',
+                    pending_raw_rows
+                )
+                pending_raw_rows.clear()
+        
+        with tqdm(total=len(objects), desc=f"{label} 파일 처리") as pbar:
+            for file_path, file_digests, error in self._iter_file_digests(bucket, objects):
+                try:
+                    if error is not None:
+                        raise error
                     
-        except Exception as e:
-            self.logger.error(f"해시로 레코드 찾기 실패 ({file_path}, {target_hash[:16]}...): {str(e)}")
+                    offsets, digests = file_digests
+                    
+                    # SQLite에 배치 삽입
+                    file_id = file_id_for(file_path)
+                    if offsets is not None:
+                        pending_raw_rows.extend(
+                            (digest, file_id, offset) for digest, offset in zip(digests, offsets)
+                        )
+                    else:
+                        pending_rows.extend((digest, file_id) for digest in digests)
+                    if len(pending_rows) + len(pending_raw_rows) >= self.chunk_size:
+                        flush_rows()
+                    
+                    pbar.set_postfix(
+                        {'current': file_path, 'records': len(digests)}, refresh=False
+                    )
+                    
+                except Exception as e:
+                    self.logger.error(f"{label} 파일 처리 실패 ({file_path}): {e}")
+                    self._append_file_error(file_path, f"{label} 파일 처리 실패: {str(e)}")
+                pbar.update(1)
         
-        return None
+        flush_rows()
+    
+    def _rehash_unmatched_lines(self, cursor, bucket: str, side: str, other_side: str,
+                                label: str, file_ids: Dict[str, int]) -> int:
+        """
+        원본 줄 일치로 짝을 찾지 못한 JSONL 레코드만 다시 읽어 정규화 해시합니다 (2단계)
+        
+        원본 줄 다이제스트마다 양쪽 중 적은 쪽의 개수만큼은 1단계에서 일치로 집계되고,
+        남은 개수(반대편에 없거나 더 적게 있는 만큼)만 {side}_hashes에 들어가 반대편에
+        남은 레코드와 정규화 해시로 다시 비교됩니다. 따라서 키 순서나 공백만 다른 중복 줄이
+        한쪽에 있어도 각 레코드는 한 번씩만 집계되고, 결과는 원본 줄 비교를 끄고 모든
+        레코드를 정규화 해시로 비교한 것과 같습니다.
+        
+        Returns:
+            다시 해시한 레코드 수
+        """
+        file_paths = {file_id: file_path for file_path, file_id in file_ids.items()}
+        
+        # 파일별 (줄 시작 위치, 남은 레코드 수)
+        unmatched = {}
+        for file_id, line_offset, occurrences in cursor.execute(f'''
+            SELECT r.file_id, r.line_offset, r.occurrences - COALESCE(o.occurrences, 0)
+            FROM {side}_raw r
+            LEFT JOIN {other_side}_raw o ON r.hash = o.hash
+            WHERE r.occurrences > COALESCE(o.occurrences, 0)
+        ''').fetchall():
+            unmatched.setdefault(file_id, []).append((line_offset, occurrences))
+        
+        if not unmatched:
+            return 0
+        
+        rehashed_records = 0
+        
+        with tqdm(total=len(unmatched), desc=f"{label} 불일치 줄 재해시") as pbar:
+            for file_id, lines in unmatched.items():
+                file_path = file_paths[file_id]
+                try:
+                    rows = self._hash_lines_at(bucket, file_path, sorted(lines))
+                    cursor.executemany(
+                        f'INSERT INTO {side}_hashes (hash, file_id, occurrences) VALUES (?, ?, ?) '
+                        'ON CONFLICT(hash) DO UPDATE SET occurrences = occurrences + excluded.occurrences',
+                        ((hash_val, file_id, occurrences) for hash_val, occurrences in rows)
+                    )
+                    rehashed_records += sum(occurrences for _, occurrences in lines)
+                except Exception as e:
+                    self.logger.error(f"{label} 불일치 줄 재해시 실패 ({file_path}): {e}")
+                    self._append_file_error(file_path, f"{label} 불일치 줄 재해시 실패: {str(e)}")
+                pbar.update(1)
+        
+        return rehashed_records
     
     def compare_buckets(self, source_prefix: str = "", backup_prefix: str = "",
                        report_path: str = "compare_report.csv") -> bool:
@@ -199,136 +807,157 @@ class S3JSONComparer:
         
         self.logger.info("S3 버킷 비교 시작 (SQLite in-memory + 단일 프로세스)")
         
-        # 파일 목록 가져오기
-        source_files = self.get_file_list(self.source_bucket, source_prefix)
-        backup_files = self.get_file_list(self.backup_bucket, backup_prefix)
+        # 파일 목록 가져오기 (이 시각 이후 직접 조회한 목록만 객체 단위 검증에 그대로 사용)
+        listing_started = time.time()
+        source_objects = self.get_object_list(
+            self.source_bucket, source_prefix, self.source_inventory
+        )
+        backup_objects = self.get_object_list(
+            self.backup_bucket, backup_prefix, self.backup_inventory
+        )
         
-        self.logger.info(f"소스 버킷 파일 수: {len(source_files)}")
-        self.logger.info(f"백업 버킷 파일 수: {len(backup_files)}")
+        self.logger.info(
+            f"소스 버킷 파일 수: {len(source_objects)} "
+            f"({sum(obj.size for obj in source_objects):,} bytes)"
+        )
+        self.logger.info(
+            f"백업 버킷 파일 수: {len(backup_objects)} "
+            f"({sum(obj.size for obj in backup_objects):,} bytes)"
+        )
+        
+        # 객체 단위 사전 검증 (크기/ETag/추가 체크섬이 같은 쌍은 내려받지 않음,
+        # 인벤토리/캐시 목록은 HEAD로 최신 메타데이터를 다시 확인)
+        verified_results = []
+        if self.object_fast_path:
+            source_objects, backup_objects, verified_results = self._verify_objects_by_metadata(
+                source_objects, source_prefix, backup_objects, backup_prefix,
+                refresh_source=not self._listing_is_fresh(
+                    self.source_bucket, source_prefix, self.source_inventory, listing_started
+                ),
+                refresh_backup=not self._listing_is_fresh(
+                    self.backup_bucket, backup_prefix, self.backup_inventory, listing_started
+                )
+            )
+        verified_objects = len(verified_results)
+        verified_bytes = sum(result.verified_bytes for result in verified_results)
+        # 레코드 수를 세지 않았거나 한 객체라도 실패하면 검증된 객체의 레코드 수는 비워 둠
+        verified_record_counts = [result.verified_records for result in verified_results]
+        verified_records = sum(verified_record_counts) \
+            if self.count_verified_records and None not in verified_record_counts else None
+        if verified_objects:
+            self.logger.info(
+                f"메타데이터로 검증된 객체 쌍 {verified_objects}개({verified_bytes:,} bytes)는 "
+                f"내용 비교를 생략합니다 "
+                f"(내용 비교 대상: 소스 {len(source_objects)}개, 백업 {len(backup_objects)}개)"
+            )
         
         # SQLite in-memory 데이터베이스 생성
         conn = sqlite3.connect(':memory:')
         cursor = conn.cursor()
         
-        # 해시 테이블 생성
+        # 파일 경로 테이블 (해시 행마다 경로 문자열을 반복 저장하지 않음)
         cursor.execute('''
-            CREATE TABLE source_hashes (
-                hash TEXT PRIMARY KEY,
-                file_path TEXT,
-                record_count INTEGER
+            CREATE TABLE files (
+                file_id INTEGER PRIMARY KEY,
+                file_path TEXT UNIQUE
             )
         ''')
         
+        # 해시 테이블 생성 (바이너리 다이제스트가 곧 B-tree 키인 WITHOUT ROWID 테이블,
+        # 기본 키 자체가 인덱스이므로 별도 인덱스 없음). 같은 레코드가 여러 번 나오면
+        # occurrences로 개수를 세어, 중복 레코드도 한 번씩 비교/집계
+        cursor.execute('''
+            CREATE TABLE source_hashes (
+                hash BLOB PRIMARY KEY,
+                file_id INTEGER,
+                occurrences INTEGER
+            ) WITHOUT ROWID
+        ''')
+        
         cursor.execute('''
             CREATE TABLE backup_hashes (
-                hash TEXT PRIMARY KEY,
-                file_path TEXT,
-                record_count INTEGER
-            )
+                hash BLOB PRIMARY KEY,
+                file_id INTEGER,
+                occurrences INTEGER
+            ) WITHOUT ROWID
         ''')
         
-        # 인덱스 생성 (성능 향상)
-        cursor.execute('CREATE INDEX idx_source_hash ON source_hashes(hash)')
-        cursor.execute('CREATE INDEX idx_backup_hash ON backup_hashes(hash)')
+        # JSONL 원본 줄 해시 테이블 (1단계, 불일치 줄만 다시 읽기 위해 첫 줄의 시작 위치 기록)
+        for side in ("source", "backup"):
+            cursor.execute(f'''
+                CREATE TABLE {side}_raw (
+                    hash BLOB PRIMARY KEY,
+                    file_id INTEGER,
+                    line_offset INTEGER,
+                    occurrences INTEGER
+                ) WITHOUT ROWID
+            ''')
         
-        # 소스 파일 처리 (단일 프로세스)
-        self.logger.info("소스 버킷 파일 내용 해시화 시작...")
-        source_total_records = 0
+        file_ids: Dict[str, int] = {}
         
-        with tqdm(total=len(source_files), desc="소스 파일 처리") as pbar:
-            for file_path in source_files:
-                try:
-                    file_hashes = self._generate_file_hashes(self.source_bucket, file_path)
-                    source_total_records += len(file_hashes)
-                    
-                    # SQLite에 배치 삽입
-                    if file_hashes:
-                        hash_data = [(hash_val, file_path, 1) for hash_val in file_hashes]
-                        cursor.executemany(
-                            'INSERT OR IGNORE INTO source_hashes (hash, file_path, record_count) VALUES (?, ?, ?)',
-                            hash_data
-                        )
-                    
-                    pbar.set_postfix({'current': file_path, 'records': len(file_hashes)})
-                    
-                except Exception as e:
-                    self.logger.error(f"소스 파일 처리 실패 ({file_path}): {e}")
-                    result = CompareResult(
-                        file_path=file_path,
-                        source_records=0,
-                        backup_records=0,
-                        matched_records=0,
-                        mismatched_records=0,
-                        missing_in_backup=0,
-                        missing_in_source=0,
-                        errors=[f"소스 파일 처리 실패: {str(e)}"],
-                        processing_time=0
-                    )
-                    self.compare_results.append(result)
-                pbar.update(1)
+        # 소스 파일 처리 (다음 객체를 미리 내려받으며 순차 해시)
+        self.logger.info("소스 버킷 파일 내용 해시화 시작...")
+        self._hash_bucket_files(
+            cursor, self.source_bucket, source_objects, "source", "소스", file_ids
+        )
         
-        # 백업 파일 처리 (단일 프로세스)
+        # 백업 파일 처리 (다음 객체를 미리 내려받으며 순차 해시)
         self.logger.info("백업 버킷 파일 내용 해시화 시작...")
-        backup_total_records = 0
-        
-        with tqdm(total=len(backup_files), desc="백업 파일 처리") as pbar:
-            for file_path in backup_files:
-                try:
-                    file_hashes = self._generate_file_hashes(self.backup_bucket, file_path)
-                    backup_total_records += len(file_hashes)
-                    
-                    # SQLite에 배치 삽입
-                    if file_hashes:
-                        hash_data = [(hash_val, file_path, 1) for hash_val in file_hashes]
-                        cursor.executemany(
-                            'INSERT OR IGNORE INTO backup_hashes (hash, file_path, record_count) VALUES (?, ?, ?)',
-                            hash_data
-                        )
-                    
-                    pbar.set_postfix({'current': file_path, 'records': len(file_hashes)})
-                    
-                except Exception as e:
-                    self.logger.error(f"백업 파일 처리 실패 ({file_path}): {e}")
-                    result = CompareResult(
-                        file_path=file_path,
-                        source_records=0,
-                        backup_records=0,
-                        matched_records=0,
-                        mismatched_records=0,
-                        missing_in_backup=0,
-                        missing_in_source=0,
-                        errors=[f"백업 파일 처리 실패: {str(e)}"],
-                        processing_time=0
-                    )
-                    self.compare_results.append(result)
-                pbar.update(1)
+        self._hash_bucket_files(
+            cursor, self.backup_bucket, backup_objects, "backup", "백업", file_ids
+        )
         
         # SQL을 사용한 효율적인 비교
         self.logger.info("SQLite를 사용한 전체 내용 비교 시작...")
         
-        # 일치하는 해시 수
+        # 1단계: 원본 줄이 바이트 단위로 같은 JSONL 레코드 수 (줄마다 양쪽 중 적은 개수)
+        cursor.execute('''
+            SELECT COALESCE(SUM(MIN(s.occurrences, b.occurrences)), 0) FROM source_raw s
+            INNER JOIN backup_raw b ON s.hash = b.hash
+        ''')
+        raw_matched_records = cursor.fetchone()[0]
+        
+        # 2단계: 원본 줄로 짝을 찾지 못한 레코드만 파싱/정규화 해시 (키 순서/공백 차이 확인)
+        rehashed_records = self._rehash_unmatched_lines(
+            cursor, self.source_bucket, "source", "backup", "소스", file_ids
+        )
+        rehashed_records += self._rehash_unmatched_lines(
+            cursor, self.backup_bucket, "backup", "source", "백업", file_ids
+        )
+        if raw_matched_records or rehashed_records:
+            self.logger.info(
+                f"원본 줄 일치 {raw_matched_records}개, 정규화 해시로 다시 비교한 레코드 {rehashed_records}개"
+            )
+        
+        # 일치하는 레코드 수 (원본 줄 일치 + 정규화 해시 일치, 해시마다 양쪽 중 적은 개수)
         cursor.execute('''
-            SELECT COUNT(*) FROM source_hashes s
+            SELECT COALESCE(SUM(MIN(s.occurrences, b.occurrences)), 0) FROM source_hashes s
             INNER JOIN backup_hashes b ON s.hash = b.hash
         ''')
-        matched_records = cursor.fetchone()[0]
+        matched_records = raw_matched_records + cursor.fetchone()[0]
         
-        # 소스에서만 있는 해시 수
+        # 소스에만 있는 (또는 소스에 더 많은) 레코드 수
         cursor.execute('''
-            SELECT COUNT(*) FROM source_hashes s
+            SELECT COALESCE(SUM(s.occurrences - COALESCE(b.occurrences, 0)), 0) FROM source_hashes s
             LEFT JOIN backup_hashes b ON s.hash = b.hash
-            WHERE b.hash IS NULL
+            WHERE s.occurrences > COALESCE(b.occurrences, 0)
         ''')
         missing_in_backup = cursor.fetchone()[0]
         
-        # 백업에서만 있는 해시 수
+        # 백업에만 있는 (또는 백업에 더 많은) 레코드 수
         cursor.execute('''
-            SELECT COUNT(*) FROM backup_hashes b
+            SELECT COALESCE(SUM(b.occurrences - COALESCE(s.occurrences, 0)), 0) FROM backup_hashes b
             LEFT JOIN source_hashes s ON b.hash = s.hash
-            WHERE s.hash IS NULL
+            WHERE b.occurrences > COALESCE(s.occurrences, 0)
         ''')
         missing_in_source = cursor.fetchone()[0]
         
+        # 총 레코드 수 (원본 줄 일치 레코드 + 정규화 해시로 비교한 레코드, 각 레코드를 한 번씩)
+        cursor.execute('SELECT COALESCE(SUM(occurrences), 0) FROM source_hashes')
+        source_total_records = raw_matched_records + cursor.fetchone()[0]
+        cursor.execute('SELECT COALESCE(SUM(occurrences), 0) FROM backup_hashes')
+        backup_total_records = raw_matched_records + cursor.fetchone()[0]
+        
         # 불일치하는 레코드 정보 수집
         mismatched_records = []
         
@@ -338,9 +967,10 @@ class S3JSONComparer:
             # 소스에서만 있는 레코드 샘플 출력 (최대 10개)
             if missing_in_backup > 0:
                 cursor.execute('''
-                    SELECT s.hash, s.file_path FROM source_hashes s
+                    SELECT s.hash, f.file_path FROM source_hashes s
+                    JOIN files f ON f.file_id = s.file_id
                     LEFT JOIN backup_hashes b ON s.hash = b.hash
-                    WHERE b.hash IS NULL
+                    WHERE s.occurrences > COALESCE(b.occurrences, 0)
                     LIMIT 10
                 ''')
                 source_only_hashes = cursor.fetchall()
@@ -350,26 +980,28 @@ class S3JSONComparer:
                     # 해당 해시의 원본 JSON 레코드 찾기
                     original_record = self._find_record_by_hash(self.source_bucket, file_path, hash_val)
                     if original_record:
-                        self.logger.info(f"  해시: {hash_val[:16]}...")
+                        self.logger.info(f"  해시: {hash_val.hex()[:16]}...")
                         self.logger.info(f"  파일: {file_path}")
                         self.logger.info(f"  JSON: {json.dumps(original_record, ensure_ascii=False, indent=2)}")
                         self.logger.info("  " + "-" * 50)
                         
                         # 불일치 레코드 정보 수집
                         mismatched_records.append({
-                            'hash': hash_val,
+                            'hash': hash_val.hex(),
+                            'hash_algorithm': self.hash_algorithm,
                             'file_path': file_path,
                             'bucket_type': 'source_only',
                             'json_content': json.dumps(original_record, ensure_ascii=False),
-                            'hash_short': hash_val[:16] + '...'
+                            'hash_short': hash_val.hex()[:16] + '...'
                         })
             
             # 백업에서만 있는 레코드 샘플 출력 (최대 10개)
             if missing_in_source > 0:
                 cursor.execute('''
-                    SELECT b.hash, b.file_path FROM backup_hashes b
+                    SELECT b.hash, f.file_path FROM backup_hashes b
+                    JOIN files f ON f.file_id = b.file_id
                     LEFT JOIN source_hashes s ON b.hash = s.hash
-                    WHERE s.hash IS NULL
+                    WHERE b.occurrences > COALESCE(s.occurrences, 0)
                     LIMIT 10
                 ''')
                 backup_only_hashes = cursor.fetchall()
@@ -379,18 +1011,19 @@ class S3JSONComparer:
                     # 해당 해시의 원본 JSON 레코드 찾기
                     original_record = self._find_record_by_hash(self.backup_bucket, file_path, hash_val)
                     if original_record:
-                        self.logger.info(f"  해시: {hash_val[:16]}...")
+                        self.logger.info(f"  해시: {hash_val.hex()[:16]}...")
                         self.logger.info(f"  파일: {file_path}")
                         self.logger.info(f"  JSON: {json.dumps(original_record, ensure_ascii=False, indent=2)}")
                         self.logger.info("  " + "-" * 50)
                         
                         # 불일치 레코드 정보 수집
                         mismatched_records.append({
-                            'hash': hash_val,
+                            'hash': hash_val.hex(),
+                            'hash_algorithm': self.hash_algorithm,
                             'file_path': file_path,
                             'bucket_type': 'backup_only',
                             'json_content': json.dumps(original_record, ensure_ascii=False),
-                            'hash_short': hash_val[:16] + '...'
+                            'hash_short': hash_val.hex()[:16] + '...'
                         })
         
         total_mismatched_records = missing_in_backup + missing_in_source
@@ -412,17 +1045,31 @@ class S3JSONComparer:
             missing_in_backup=missing_in_backup,
             missing_in_source=missing_in_source,
             errors=[],
-            processing_time=0
+            processing_time=0,
+            verification_strength=describe_hash_algorithm(self.hash_algorithm),
+            verified_objects=verified_objects,
+            verified_bytes=verified_bytes,
+            verified_records=verified_records
         )
         self.compare_results.append(overall_result)
         
         # 개별 파일 통계 (샘플링)
         cursor.execute('''
-            SELECT file_path, COUNT(*) as record_count 
-            FROM source_hashes 
-            GROUP BY file_path 
-            ORDER BY record_count DESC 
-            LIMIT 10
+            SELECT f.file_path, h.record_count
+            FROM (
+                SELECT file_id, SUM(occurrences) as record_count
+                FROM (
+                    SELECT file_id, occurrences FROM source_raw
+                    UNION ALL
+                    SELECT file_id, occurrences FROM source_hashes
+                    WHERE file_id NOT IN (SELECT file_id FROM source_raw)
+                )
+                GROUP BY file_id
+                ORDER BY record_count DESC
+                LIMIT 10
+            ) h
+            JOIN files f ON f.file_id = h.file_id
+            ORDER BY h.record_count DESC
         ''')
         source_file_stats = cursor.fetchall()
         
@@ -441,11 +1088,21 @@ class S3JSONComparer:
             self.compare_results.append(result)
         
         cursor.execute('''
-            SELECT file_path, COUNT(*) as record_count 
-            FROM backup_hashes 
-            GROUP BY file_path 
-            ORDER BY record_count DESC 
-            LIMIT 10
+            SELECT f.file_path, h.record_count
+            FROM (
+                SELECT file_id, SUM(occurrences) as record_count
+                FROM (
+                    SELECT file_id, occurrences FROM backup_raw
+                    UNION ALL
+                    SELECT file_id, occurrences FROM backup_hashes
+                    WHERE file_id NOT IN (SELECT file_id FROM backup_raw)
+                )
+                GROUP BY file_id
+                ORDER BY record_count DESC
+                LIMIT 10
+            ) h
+            JOIN files f ON f.file_id = h.file_id
+            ORDER BY h.record_count DESC
         ''')
         backup_file_stats = cursor.fetchall()
         
@@ -467,7 +1124,15 @@ class S3JSONComparer:
         conn.close()
         
         # 리포트 생성
-        self.report_generator.generate_report(self.compare_results, report_path)
+        self.report_generator.generate_report(
+            self.compare_results, report_path,
+            metadata={
+                'Hash Algorithm': describe_hash_algorithm(self.hash_algorithm),
+                'Objects Verified by Metadata': verified_objects,
+                'Bytes Verified by Metadata': verified_bytes,
+                'Records in Verified Objects': '' if verified_records is None else verified_records
+            }
+        )
         
         # 불일치하는 레코드 상세 리포트 생성
         if mismatched_records:
@@ -476,40 +1141,252 @@ class S3JSONComparer:
                 mismatched_records, detailed_report_path
             )
         
+        # 연결 풀 사용 현황 (동시성 조정용)
+        if self.s3_handler is not None:
+            pool_stats = self.s3_handler.get_pool_stats()
+            self.logger.info(
+                f"S3 연결 풀: 크기 {pool_stats['pool_size']}, "
+                f"최대 동시 사용 {pool_stats['peak_in_use']}, "
+                f"요청 {pool_stats['total_requests']}, 포화 요청 {pool_stats['saturated_requests']}"
+            )
+            if pool_stats['saturated_requests']:
+                self.logger.warning("S3 연결 풀이 포화되었습니다. max_pool_connections를 늘리세요.")
+            
+            # 접두사별 요청 속도 조절 현황 (503 SlowDown)
+            rate_stats = getattr(self.s3_handler, 'get_rate_stats', dict)()
+            if rate_stats.get('throttled_requests'):
+                self.logger.warning(
+                    f"S3 요청 속도 제한 응답 {rate_stats['throttled_requests']}건, "
+                    f"조절된 접두사별 현재 속도(req/s): {rate_stats['throttled_partitions']}"
+                )
+        
         # 결과 요약
-        self.logger.info(f"비교 완료: 소스 {len(source_files)}개, 백업 {len(backup_files)}개 파일")
+        self.logger.info(f"비교 완료: 소스 {len(source_objects)}개, 백업 {len(backup_objects)}개 파일")
+        if verified_objects:
+            self.logger.info(
+                f"메타데이터로 검증된 객체 쌍: {verified_objects}"
+                + (f" (레코드 {verified_records}개)" if verified_records is not None else "")
+            )
         self.logger.info(f"일치하는 레코드: {matched_records}")
         self.logger.info(f"불일치하는 레코드: {total_mismatched_records}")
         
         return total_mismatched_records == 0
 
 
-def main():
-    """메인 함수 - 메뉴 형태"""
+def parse_s3_url(url: str) -> Tuple[str, str]:
+    """S3 URL을 파싱합니다 (file:// URL이나 로컬 경로는 디렉터리 전체를 버킷으로 사용)"""
+    if url.startswith("file://") or os.path.isdir(os.path.expanduser(url)):
+        if not os.path.isdir(local_root(url)):
+            raise ValueError(f"로컬 디렉터리를 찾을 수 없습니다: {url}")
+        return local_root(url), ""
+    
+    if not url.startswith("s3://"):
+        raise ValueError("S3 URL은 s3:// 또는 file://로 시작해야 합니다")
+    
+    url = url[5:]  # s3:// 제거
+    parts = url.split("/", 1)
+    bucket = parts[0]
+    prefix = parts[1] if len(parts) > 1 else ""
+    
+    return bucket, prefix
+
+
+def parse_csv_column_types(text: str) -> Dict[str, str]:
+    """
+    "열:타입" 목록 문자열을 CSV 열 타입 딕셔너리로 변환합니다 (예: "id:int,meta:json")
+    
+    Raises:
+        ValueError: 형식이 잘못되었거나 지원하지 않는 타입인 경우
+    """
+    csv_column_types = {}
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        column, type_name = item.rsplit(':', 1)
+        if type_name.strip() not in CSV_COLUMN_TYPES:
+            raise ValueError(item)
+        csv_column_types[column.strip()] = type_name.strip()
+    return csv_column_types
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """명령줄 실행용 인자 파서를 만듭니다 (인자 없이 실행하면 메뉴 형태로 입력받음)"""
+    parser = argparse.ArgumentParser(
+        description="S3 JSON 데이터 일치성 비교 프로그램 (인자 없이 실행하면 메뉴 형태로 입력받습니다)"
+    )
+    parser.add_argument("source", help="소스 S3 URL (예: s3://my-bucket/path/, file:///data/mirror/)")
+    parser.add_argument("backup", help="백업 S3 URL (예: s3://my-backup-bucket/path/)")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="청크 크기 (기본값: 20000)")
+    parser.add_argument("--report", default="./detailed_report.csv",
+                        help="리포트 파일 경로 (기본값: ./detailed_report.csv)")
+    parser.add_argument("--log-level", choices=("DEBUG", "INFO", "WARNING", "ERROR"), default="INFO",
+                        help="로그 레벨 (기본값: INFO)")
+    parser.add_argument("--download-mode", choices=("stream", "ranged", "small"), default="stream",
+                        help="다운로드 방식 (stream: 단일 GET 스트리밍, ranged: 바이트 범위 병렬, "
+                             "small: 작은 객체 동시 읽기)")
+    parser.add_argument("--range-threshold", type=int, default=DEFAULT_RANGE_THRESHOLD,
+                        help="ranged 모드에서 범위 병렬 다운로드를 사용할 최소 객체 크기 (바이트)")
+    parser.add_argument("--prefetch-count", type=int, default=DEFAULT_PREFETCH_COUNT,
+                        help=f"해시하는 동안 미리 내려받을 객체 수 (0이면 순차 스트리밍, 기본값: {DEFAULT_PREFETCH_COUNT})")
+    parser.add_argument("--prefetch-bytes", type=int, default=DEFAULT_PREFETCH_BYTES,
+                        help="미리 내려받은 객체가 차지할 수 있는 최대 메모리 (바이트)")
+    parser.add_argument("--prefetch-max-object-bytes", type=int, default=DEFAULT_PREFETCH_MAX_OBJECT_BYTES,
+                        help="미리 통째로 내려받을 최대 객체 크기 (바이트, 이상이면 바로 스트리밍)")
+    parser.add_argument("--max-pool-connections", type=int, default=DEFAULT_MAX_POOL_CONNECTIONS,
+                        help=f"모든 작업 스레드가 공유하는 S3 연결 풀 크기 (기본값: {DEFAULT_MAX_POOL_CONNECTIONS})")
+    parser.add_argument("--no-parallel-listing", dest="parallel_listing", action="store_false",
+                        help="하위 접두사(month=, day= 등)를 병렬로 나열하지 않고 한 번에 순차 나열")
+    parser.add_argument("--source-inventory", default=None,
+                        help="소스 목록으로 사용할 S3 Inventory manifest.json 위치")
+    parser.add_argument("--backup-inventory", default=None,
+                        help="백업 목록으로 사용할 S3 Inventory manifest.json 위치")
+    parser.add_argument("--listing-cache", default=None, help="목록 캐시 SQLite 파일 경로")
+    parser.add_argument("--listing-cache-ttl", type=float, default=DEFAULT_LISTING_CACHE_TTL,
+                        help="목록 조회 없이 캐시를 사용할 시간 (초)")
+    parser.add_argument("--listing-cache-reconcile-interval", type=float,
+                        default=DEFAULT_LISTING_CACHE_RECONCILE_INTERVAL,
+                        help="TTL 이후 증분 갱신 대신 전체 목록으로 다시 맞추는 주기 (초, 0이면 매번 전체 목록)")
+    parser.add_argument("--force-refresh-listing", action="store_true",
+                        help="목록 캐시를 무시하고 전체 목록을 다시 조회")
+    parser.add_argument("--backend", choices=("s3", "async"), default="s3",
+                        help="S3 백엔드 (s3: boto3 스레드 기반, async: aiobotocore 기반)")
+    parser.add_argument("--async-concurrency", type=int, default=DEFAULT_ASYNC_CONCURRENCY,
+                        help=f"async 백엔드의 동시 GET 요청 수 (기본값: {DEFAULT_ASYNC_CONCURRENCY})")
+    parser.add_argument("--endpoint-url", default=None, help="S3 호환 엔드포인트 URL")
+    parser.add_argument("--small-object-concurrency", type=int, default=DEFAULT_SMALL_OBJECT_CONCURRENCY,
+                        help=f"small 모드의 동시 GET 요청 수 (기본값: {DEFAULT_SMALL_OBJECT_CONCURRENCY})")
+    parser.add_argument("--small-object-max-bytes", type=int, default=DEFAULT_SMALL_OBJECT_MAX_BYTES,
+                        help="small 모드에서 메모리로 한 번에 압축 해제할 최대 크기 (바이트, 넘으면 스트리밍)")
+    parser.add_argument("--mode", choices=PROCESS_MODES, default="jsonl",
+                        help="비교 모드 (기본값: jsonl, auto: 객체별 형식/압축 자동 감지)")
+    parser.add_argument("--csv-types", default="",
+                        help="CSV 열 타입 (예: id:int,speed:float,meta:json, 기본값: 모두 문자열)")
+    parser.add_argument("--hash-algorithm", choices=HASH_ALGORITHMS, default=DEFAULT_HASH_ALGORITHM,
+                        help=f"레코드 해시 알고리즘 (기본값: {DEFAULT_HASH_ALGORITHM})")
+    parser.add_argument("--no-raw-line-tier", dest="raw_line_tier", action="store_false",
+                        help="JSONL 원본 줄 해시 단계를 끄고 모든 레코드를 파싱/정규화 해시로 비교")
+    parser.add_argument("--no-object-fast-path", dest="object_fast_path", action="store_false",
+                        help="크기/ETag/체크섬 객체 단위 사전 검증을 끄고 모든 객체를 내용 비교")
+    parser.add_argument("--object-verify-workers", type=int, default=DEFAULT_VERIFY_WORKERS,
+                        help=f"체크섬 HEAD 요청/ETag 재계산을 동시에 수행할 객체 쌍 수 (기본값: {DEFAULT_VERIFY_WORKERS})")
+    parser.add_argument("--count-verified-records", action="store_true",
+                        help="객체 단위로 검증된 객체의 레코드 수도 세어 리포트에 기록")
+    return parser
+
+
+def run_comparison(source_url: str, backup_url: str, report_path: str, log_level: str,
+                   **comparer_options) -> bool:
+    """
+    로그를 설정하고 두 위치를 비교합니다
+    
+    Args:
+        source_url: 소스 S3 URL (또는 file:// URL, 로컬 경로)
+        backup_url: 백업 S3 URL (또는 file:// URL, 로컬 경로)
+        report_path: 리포트 파일 경로
+        log_level: 로그 레벨 이름
+        **comparer_options: S3JSONComparer에 전달할 옵션
+    
+    Returns:
+        모든 데이터가 일치하면 True
+    """
+    source_bucket, source_prefix = parse_s3_url(source_url)
+    backup_bucket, backup_prefix = parse_s3_url(backup_url)
+    
+    # 로그 설정
+    logging.basicConfig(
+        level=getattr(logging, log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    print("\n🚀 S3 JSON 데이터 비교를 시작합니다...")
+    
+    # 비교 프로그램 초기화
+    with S3JSONComparer(
+        source_bucket=source_bucket,
+        backup_bucket=backup_bucket,
+        processes=1,  # 단일 프로세스 사용
+        **comparer_options
+    ) as comparer:
+        # 비교 실행
+        return comparer.compare_buckets(
+            source_prefix=source_prefix,
+            backup_prefix=backup_prefix,
+            report_path=report_path
+        )
+
+
+def exit_with_result(success: bool):
+    """비교 결과를 출력하고 종료합니다 (일치하면 종료 코드 0, 불일치하면 1)"""
+    print("\n" + "=" * 60)
+    if success:
+        print("✅ 모든 데이터가 일치합니다!")
+        sys.exit(0)
+    else:
+        print("❌ 데이터 불일치가 발견되었습니다. 리포트를 확인하세요.")
+        sys.exit(1)
+
+
+def main(argv: Optional[List[str]] = None):
+    """메인 함수 - 명령줄 인자가 있으면 바로 실행하고, 없으면 메뉴 형태로 입력받음"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        parser = build_arg_parser()
+        args = parser.parse_args(argv)
+        try:
+            parse_s3_url(args.source)
+            parse_s3_url(args.backup)
+            csv_column_types = parse_csv_column_types(args.csv_types)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.chunk_size <= 0:
+            parser.error("청크 크기는 0보다 커야 합니다")
+        if args.prefetch_count < 0 or args.prefetch_bytes <= 0:
+            parser.error("프리페치 객체 수는 0 이상, 프리페치 메모리는 0보다 커야 합니다")
+        
+        try:
+            success = run_comparison(
+                args.source, args.backup, args.report, args.log_level,
+                chunk_size=args.chunk_size,
+                download_mode=args.download_mode,
+                range_threshold=args.range_threshold,
+                prefetch_count=args.prefetch_count,
+                prefetch_bytes=args.prefetch_bytes,
+                prefetch_max_object_bytes=args.prefetch_max_object_bytes,
+                max_pool_connections=args.max_pool_connections,
+                parallel_listing=args.parallel_listing,
+                source_inventory=args.source_inventory,
+                backup_inventory=args.backup_inventory,
+                listing_cache_path=args.listing_cache,
+                listing_cache_ttl=args.listing_cache_ttl,
+                listing_cache_reconcile_interval=args.listing_cache_reconcile_interval,
+                force_refresh_listing=args.force_refresh_listing,
+                backend=args.backend,
+                async_concurrency=args.async_concurrency,
+                endpoint_url=args.endpoint_url,
+                small_object_concurrency=args.small_object_concurrency,
+                small_object_max_bytes=args.small_object_max_bytes,
+                compare_mode=args.mode,
+                csv_column_types=csv_column_types,
+                hash_algorithm=args.hash_algorithm,
+                raw_line_tier=args.raw_line_tier,
+                object_fast_path=args.object_fast_path,
+                object_verify_workers=args.object_verify_workers,
+                count_verified_records=args.count_verified_records
+            )
+        except Exception as e:
+            print(f"❌ 프로그램 실행 중 오류 발생: {e}")
+            sys.exit(1)
+        exit_with_result(success)
+    
     print("=" * 60)
     print("🚀 S3 JSON 데이터 일치성 비교 프로그램")
     print("=" * 60)
     
-    # S3 URL 파싱 함수
-    def parse_s3_url(url: str) -> Tuple[str, str]:
-        """S3 URL을 파싱합니다"""
-        if not url.startswith("s3://"):
-            raise ValueError("S3 URL은 s3://로 시작해야 합니다")
-        
-        url = url[5:]  # s3:// 제거
-        parts = url.split("/", 1)
-        bucket = parts[0]
-        prefix = parts[1] if len(parts) > 1 else ""
-        
-        return bucket, prefix
-    
     try:
         # 메뉴 입력 받기
         print("\n📋 설정 정보를 입력해주세요:")
         
         # 소스 버킷 입력
         while True:
-            source_bucket_url = input("\n🔍 소스 S3 버킷 URL을 입력하세요 (예: s3://my-bucket/path/): ").strip()
+            source_bucket_url = input("\n🔍 소스 S3 버킷 URL을 입력하세요 (예: s3://my-bucket/path/, file:///data/mirror/): ").strip()
             if source_bucket_url:
                 try:
                     source_bucket, source_prefix = parse_s3_url(source_bucket_url)
@@ -523,7 +1400,7 @@ def main():
         
         # 백업 버킷 입력
         while True:
-            backup_bucket_url = input("\n💾 백업 S3 버킷 URL을 입력하세요 (예: s3://my-backup-bucket/path/): ").strip()
+            backup_bucket_url = input("\n💾 백업 S3 버킷 URL을 입력하세요 (예: s3://my-backup-bucket/path/, file:///data/mirror/): ").strip()
             if backup_bucket_url:
                 try:
                     backup_bucket, backup_prefix = parse_s3_url(backup_bucket_url)
@@ -540,21 +1417,36 @@ def main():
         print("1. JSONL (JSON Lines) - 한 줄에 하나의 JSON 객체")
         print("2. Array - JSON 배열 형태")
         print("3. CSV - CSV 형태")
+        print("4. Auto - 객체별로 형식(JSONL/Array/단일 JSON/CSV)과 압축 자동 감지")
         
         while True:
-            mode_choice = input("선택 (1-3, 기본값: 1): ").strip()
+            mode_choice = input("선택 (1-4, 기본값: 1): ").strip()
             if not mode_choice:
                 compare_mode = "jsonl"
                 break
-            elif mode_choice in ["1", "2", "3"]:
-                mode_map = {"1": "jsonl", "2": "array", "3": "csv"}
+            elif mode_choice in ["1", "2", "3", "4"]:
+                mode_map = {"1": "jsonl", "2": "array", "3": "csv", "4": "auto"}
                 compare_mode = mode_map[mode_choice]
                 break
             else:
-                print("❌ 1, 2, 3 중에서 선택해주세요.")
+                print("❌ 1, 2, 3, 4 중에서 선택해주세요.")
         
         print(f"✅ 비교 모드: {compare_mode}")
         
+        # CSV 열 타입 입력 (지정하지 않은 열은 문자열로 비교)
+        csv_column_types = {}
+        if compare_mode in ("csv", "auto"):
+            while True:
+                types_input = input("\n🔢 CSV 열 타입을 입력하세요 (예: id:int,speed:float,meta:json, 기본값: 모두 문자열): ").strip()
+                try:
+                    csv_column_types = parse_csv_column_types(types_input)
+                    break
+                except ValueError:
+                    print(f"❌ '열:타입' 형식으로 입력해주세요. (타입: {', '.join(CSV_COLUMN_TYPES)})")
+            
+            if csv_column_types:
+                print(f"✅ CSV 열 타입: {csv_column_types}")
+        
         # 청크 크기 입력
         while True:
             chunk_size_input = input("\n📦 청크 크기를 입력하세요 (기본값: 20000): ").strip()
@@ -616,36 +1508,14 @@ def main():
             print("❌ 비교가 취소되었습니다.")
             sys.exit(0)
         
-        # 로그 설정
-        logging.basicConfig(
-            level=getattr(logging, log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        success = run_comparison(
+            source_bucket_url, backup_bucket_url, report_path, log_level,
+            chunk_size=chunk_size,
+            compare_mode=compare_mode,
+            csv_column_types=csv_column_types
         )
         
-        print("\n🚀 S3 JSON 데이터 비교를 시작합니다...")
-        
-        # 비교 프로그램 초기화
-        comparer = S3JSONComparer(
-            source_bucket=source_bucket,
-            backup_bucket=backup_bucket,
-            processes=1,  # 단일 프로세스 사용
-            chunk_size=chunk_size
-        )
-        
-        # 비교 실행
-        success = comparer.compare_buckets(
-            source_prefix=source_prefix,
-            backup_prefix=backup_prefix,
-            report_path=report_path
-        )
-        
-        print("\n" + "=" * 60)
-        if success:
-            print("✅ 모든 데이터가 일치합니다!")
-            sys.exit(0)
-        else:
-            print("❌ 데이터 불일치가 발견되었습니다. 리포트를 확인하세요.")
-            sys.exit(1)
+        exit_with_result(success)
             
     except Exception as e:
         print(f"❌ 프로그램 실행 중 오류 발생: {e}")
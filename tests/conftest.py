@@ -0,0 +1,35 @@
+"""
+테스트 공통 설정
+
+저장소 루트를 import 경로에 추가하고, moto로 가짜 S3 버킷을 만드는 fixture를 제공합니다
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def aws_env(monkeypatch):
+    """moto가 실제 AWS 자격 증명을 사용하지 않도록 환경 변수를 설정합니다"""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.delenv('AWS_PROFILE', raising=False)
+
+
+@pytest.fixture
+def s3_client(aws_env):
+    """moto 가짜 S3 클라이언트 (src, bak 버킷 생성)"""
+    moto = pytest.importorskip('moto')
+    import boto3
+    
+    with moto.mock_aws():
+        client = boto3.client('s3', region_name='us-east-1')
+        client.create_bucket(Bucket='src')
+        client.create_bucket(Bucket='bak')
+        yield client
@@ -0,0 +1,51 @@
+"""배열 모드 파싱 테스트"""
+
+import io
+import json
+
+from utils.json_processor import JSONProcessor
+
+RECORDS = [
+    {"id": 1, "v": 1.5, "n": {"xs": [2.25, 3, {"deep": 0.1}]}},
+    {"id": 123456789012345678901234, "ts": 1675209600123456789, "e": 1e5},
+    {"id": 3, "neg": -18446744073709551616, "tiny": 5e-324},
+]
+
+
+class NonSeekableStream(io.RawIOBase):
+    """S3 스트리밍처럼 되감을 수 없는 바이너리 스트림"""
+    
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return False
+    
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+    
+    def readinto(self, buffer):
+        data = self._stream.read(min(len(buffer), 7))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def test_big_integers_stream_from_non_seekable_array():
+    data = json.dumps(RECORDS).encode()
+    records = list(JSONProcessor().process_stream(NonSeekableStream(data), "array"))
+    
+    expected = [json.loads(json.dumps(record)) for record in RECORDS]
+    assert records == expected
+    assert [type(record["id"]) for record in records] == [int, int, int]
+    assert type(records[0]["n"]["xs"][2]["deep"]) is float
+    assert records[1]["id"] == 123456789012345678901234
+
+
+def test_big_integers_fall_back_on_seekable_stream():
+    data = json.dumps(RECORDS).encode()
+    records = [record for batch in JSONProcessor().process_bytes_batches(data, "array")
+               for record in batch]
+    assert records == [json.loads(json.dumps(record)) for record in RECORDS]
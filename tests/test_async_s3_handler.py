@@ -0,0 +1,64 @@
+"""AsyncS3Handler 및 비동기 백엔드 조합 테스트 (moto 서버 사용)"""
+
+import gc
+import json
+import warnings
+
+import pytest
+
+pytest.importorskip('aiobotocore')
+moto_server = pytest.importorskip('moto.server')
+
+from s3_json_compare import S3JSONComparer
+from utils.async_s3_handler import AsyncS3Handler
+
+
+@pytest.fixture
+def moto_endpoint(aws_env):
+    """로컬 moto 서버를 띄우고 src/bak 버킷에 같은 JSONL 객체를 올립니다"""
+    import boto3
+    
+    server = moto_server.ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    endpoint = f"http://{host}:{port}"
+    
+    client = boto3.client('s3', region_name='us-east-1', endpoint_url=endpoint)
+    body = '\n'.join(json.dumps({"id": i}) for i in range(1000)).encode()
+    for bucket in ('src', 'bak'):
+        client.create_bucket(Bucket=bucket)
+        client.put_object(Bucket=bucket, Key='p/a.jsonl', Body=body)
+    
+    yield endpoint, body
+    server.stop()
+
+
+def test_stream_reads_in_chunks_and_close_releases_clients(moto_endpoint):
+    endpoint, body = moto_endpoint
+    handler = AsyncS3Handler(endpoint_url=endpoint, max_concurrency=4)
+    
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        with handler.open_file_stream('src', 'p/a.jsonl', buffer_size=1024) as stream:
+            assert stream.read(10) == body[:10]
+            assert stream.read() == body[10:]
+        assert handler.get_file_bytes('bak', 'p/a.jsonl') == body
+        assert handler.get_pool_stats()['in_use'] == 0
+        
+        handler.close()
+        gc.collect()
+    
+    assert not [w for w in caught if 'Unclosed' in str(w.message)]
+
+
+def test_comparer_context_manager_with_async_stream_mode(moto_endpoint, tmp_path):
+    endpoint, _ = moto_endpoint
+    with S3JSONComparer('src', 'bak', backend="async", endpoint_url=endpoint,
+                        object_fast_path=False) as comparer:
+        assert comparer.compare_buckets('p/', 'p/', str(tmp_path / 'report.csv'))
+    assert comparer.s3_handler._loop.is_closed()
+
+
+def test_async_backend_rejects_ranged_mode():
+    with pytest.raises(ValueError, match="ranged"):
+        S3JSONComparer('src', 'bak', backend="async", download_mode="ranged")
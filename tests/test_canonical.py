@@ -0,0 +1,28 @@
+"""정규화 직렬화 테스트"""
+
+import json
+
+import pytest
+
+from utils.canonical import get_canonical_encoder
+
+ENCODERS = [get_canonical_encoder(use_orjson=False), get_canonical_encoder(use_orjson=True)]
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_key_order_and_whitespace_are_ignored(encode):
+    assert encode(json.loads('{"b": 1, "a": {"d": [1, 2], "c": "x"}}')) == \
+        encode(json.loads('{"a":{"c":"x","d":[1,2]},"b":1}'))
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+@pytest.mark.parametrize("literal", ["NaN", "Infinity", "-Infinity"])
+def test_non_finite_floats_differ_from_null(encode, literal):
+    value = json.loads(f'{{"a": [{literal}]}}')
+    assert encode(value) != encode({"a": [None]})
+    assert encode(value) == ENCODERS[0](value)
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_large_integers_are_kept(encode):
+    assert encode({"n": 2 ** 70}) == b'{"n":1180591620717411303424}'
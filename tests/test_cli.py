@@ -0,0 +1,79 @@
+"""명령줄 인자 실행 테스트"""
+
+import pytest
+
+import s3_json_compare
+from s3_json_compare import main
+
+# (명령줄 인자, S3JSONComparer에 전달되어야 하는 옵션)
+FLAG_CASES = [
+    ([], {'chunk_size': 20000}),
+    (['--chunk-size', '500'], {'chunk_size': 500}),
+    (['--download-mode', 'ranged', '--range-threshold', '1024'],
+     {'download_mode': 'ranged', 'range_threshold': 1024}),
+    (['--prefetch-count', '0', '--prefetch-bytes', '4096', '--prefetch-max-object-bytes', '1024'],
+     {'prefetch_count': 0, 'prefetch_bytes': 4096, 'prefetch_max_object_bytes': 1024}),
+    (['--max-pool-connections', '16'], {'max_pool_connections': 16}),
+    (['--no-parallel-listing'], {'parallel_listing': False}),
+    ([], {'source_inventory': None, 'backup_inventory': None}),
+    (['--listing-cache-ttl', '60', '--listing-cache-reconcile-interval', '600',
+      '--force-refresh-listing'],
+     {'listing_cache_path': None, 'listing_cache_ttl': 60.0,
+      'listing_cache_reconcile_interval': 600.0, 'force_refresh_listing': True}),
+    (['--async-concurrency', '8'], {'backend': 's3', 'async_concurrency': 8, 'endpoint_url': None}),
+    (['--download-mode', 'small', '--small-object-concurrency', '4', '--small-object-max-bytes', '1024'],
+     {'download_mode': 'small', 'small_object_concurrency': 4, 'small_object_max_bytes': 1024}),
+    (['--mode', 'auto'], {'compare_mode': 'auto'}),
+    (['--mode', 'csv', '--csv-types', 'id:int, meta:json'],
+     {'compare_mode': 'csv', 'csv_column_types': {'id': 'int', 'meta': 'json'}}),
+    (['--hash-algorithm', 'sha256'], {'hash_algorithm': 'sha256'}),
+    (['--no-raw-line-tier'], {'raw_line_tier': False}),
+    (['--no-object-fast-path', '--object-verify-workers', '2', '--count-verified-records'],
+     {'object_fast_path': False, 'object_verify_workers': 2, 'count_verified_records': True}),
+]
+
+
+@pytest.fixture
+def dirs(tmp_path, aws_env):
+    source, backup = tmp_path / 'src', tmp_path / 'bak'
+    source.mkdir()
+    backup.mkdir()
+    (source / 'a.jsonl').write_bytes(b'{"id": 1}\n{"id": 2}\n')
+    (backup / 'a.jsonl').write_bytes(b'{"id": 1}\n')
+    return str(source), str(backup)
+
+
+@pytest.mark.parametrize('flags, expected', FLAG_CASES)
+def test_flags_are_passed_to_comparer(dirs, tmp_path, monkeypatch, flags, expected):
+    options = {}
+    original = s3_json_compare.S3JSONComparer
+    
+    def capture(**kwargs):
+        options.update(kwargs)
+        return original(**kwargs)
+    
+    monkeypatch.setattr(s3_json_compare, 'S3JSONComparer', capture)
+    with pytest.raises(SystemExit) as exit_info:
+        main([*dirs, *flags, '--report', str(tmp_path / 'report.csv')])
+    
+    assert exit_info.value.code == 1
+    assert (tmp_path / 'report.csv').exists()
+    assert {key: options[key] for key in expected} == expected
+
+
+def test_invalid_arguments_exit_with_usage_error(dirs, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main([*dirs, '--csv-types', 'id:decimal'])
+    assert exit_info.value.code == 2
+    
+    with pytest.raises(SystemExit) as exit_info:
+        main([*dirs, '--chunk-size', '0'])
+    assert exit_info.value.code == 2
+    
+    with pytest.raises(SystemExit) as exit_info:
+        main([dirs[0]])
+    assert exit_info.value.code == 2
+    
+    with pytest.raises(SystemExit) as exit_info:
+        main([*dirs, '--backend', 'gcs'])
+    assert exit_info.value.code == 2
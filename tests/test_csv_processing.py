@@ -0,0 +1,30 @@
+"""CSV 처리 경계 사례 테스트"""
+
+import io
+
+from utils.json_processor import JSONProcessor
+
+
+def _records(data: bytes, column_types=None):
+    processor = JSONProcessor(csv_column_types=column_types)
+    return list(processor.process_stream(io.BytesIO(data), mode="csv"))
+
+
+def test_leading_blank_lines_before_header_are_skipped():
+    records = _records(b"\n\r\n\nid,name\n1,a\n2,b\n")
+    assert records == [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+
+
+def test_bom_and_quoted_cells():
+    records = _records('﻿id,note\n1,"a,b\nc"\n'.encode('utf-8'))
+    assert records == [{"id": "1", "note": "a,b\nc"}]
+
+
+def test_bool_column_keeps_unrecognised_tokens():
+    records = _records(b"flag\ntrue\nNo\nmaybe\nfalse\n\n", {"flag": "bool"})
+    assert [r["flag"] for r in records] == [True, False, "maybe", False]
+
+
+def test_empty_cell_is_null_and_bad_int_row_is_skipped():
+    records = _records(b"id,v\n1,\nx,2\n3,4\n", {"id": "int", "v": "int"})
+    assert records == [{"id": 1, "v": None}, {"id": 3, "v": 4}]
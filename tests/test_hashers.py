@@ -0,0 +1,27 @@
+"""레코드 해시 알고리즘 테스트"""
+
+import hashlib
+
+import pytest
+
+from utils import hashers
+from utils.hashers import DEFAULT_HASH_ALGORITHM, HASH_ALGORITHMS, HASH_DIGEST_SIZES, get_hasher
+
+DATA = b'{"id":1,"name":"\xed\x95\x9c\xea\xb8\x80"}'
+
+
+@pytest.mark.parametrize('algorithm', HASH_ALGORITHMS)
+def test_digest_sizes_match_table(algorithm):
+    try:
+        hasher = get_hasher(algorithm)
+    except ImportError:
+        pytest.skip(f"{algorithm} 패키지가 설치되지 않음")
+    assert len(hasher(DATA)) == HASH_DIGEST_SIZES[algorithm]
+
+
+def test_default_is_xxh3_or_truncated_sha256():
+    if hashers.xxhash is not None:
+        assert DEFAULT_HASH_ALGORITHM == 'xxh3_128'
+    else:
+        assert DEFAULT_HASH_ALGORITHM == 'sha256_128'
+    assert get_hasher('sha256_128')(DATA) == hashlib.sha256(DATA).digest()[:16]
@@ -0,0 +1,42 @@
+"""JSONProcessor 배치 읽기 테스트"""
+
+import gc
+import io
+
+from utils.json_processor import MAX_PARSED_BATCH_SIZE, JSONProcessor
+
+LINES = [b'{"id": %d}' % i for i in range(1000)]
+DATA = b'\n'.join(LINES[:500] + [b'', b'not json'] + LINES[500:])
+
+
+def test_parsed_batches_are_capped_and_keep_all_records():
+    processor = JSONProcessor(chunk_size=600)
+    batches = list(processor.process_bytes_batches(DATA))
+    assert max(len(batch) for batch in batches) <= MAX_PARSED_BATCH_SIZE
+    assert [record["id"] for batch in batches for record in batch] == list(range(1000))
+    assert gc.isenabled()
+
+
+def test_raw_batches_use_chunk_size_and_report_line_offsets():
+    processor = JSONProcessor(chunk_size=600)
+    data = DATA.replace(b'{"id": 7}', b'  {"id": 7}\r')
+    stream_batches = list(processor.process_stream_batches(io.BytesIO(data), raw=True))
+    assert [len(lines) for _, lines in stream_batches] == [598, 402]  # 빈 줄, 파싱할 수 없는 줄 제외
+    assert b'not json' not in [line for _, lines in stream_batches for line in lines]
+    assert list(processor.process_bytes_batches(data, raw=True)) == stream_batches
+    
+    for offsets, lines in stream_batches:
+        for offset, line in zip(offsets, lines):
+            assert data[offset:].split(b'\n', 1)[0].strip() == line
+
+
+def test_integer_boundaries_parse_exactly_in_batches():
+    values = [1675209600123456789, 18446744073709551615, 18446744073709551616,
+              -9223372036854775808, -9223372036854775809, 123456789012345678901234]
+    lines = [b'{"v": %d}' % value for value in values] + [b'{"v": NaN}']
+    processor = JSONProcessor()
+    
+    batch = [record for batch in processor.process_bytes_batches(b'\n'.join(lines)) for record in batch]
+    assert batch[:-1] == [{"v": value} for value in values]
+    assert [type(record["v"]) for record in batch[:-1]] == [int] * len(values)
+    assert [processor.parse_line(line) for line in lines[:-1]] == batch[:-1]
@@ -0,0 +1,92 @@
+"""ListingCache 재검증 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utils.listing_cache import ListingCache
+from utils.object_info import ObjectInfo
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_cache(tmp_path, ttl_seconds=0, reconcile_interval=0):
+    return ListingCache(str(tmp_path / 'cache.db'), ttl_seconds, reconcile_interval)
+
+
+def test_reconcile_relists_and_picks_up_overwrite_and_delete(tmp_path):
+    cache = make_cache(tmp_path)
+    first = [
+        ObjectInfo('p/a.jsonl', 10, 'etag-a', NOW),
+        ObjectInfo('p/b.jsonl', 20, 'etag-b', NOW),
+    ]
+    cache.get_objects('bkt', 'p/', lambda start_after: first)
+    
+    # 같은 키에 덮어쓰기(a), 삭제(b), 앞쪽 키에 추가(0)
+    second = [
+        ObjectInfo('p/0.jsonl', 5, 'etag-0', NOW),
+        ObjectInfo('p/a.jsonl', 11, 'etag-a2', NOW + timedelta(minutes=1)),
+    ]
+    objects = cache.get_objects('bkt', 'p/', lambda start_after: second)
+    
+    assert [(obj.key, obj.size, obj.etag) for obj in objects] == [
+        ('p/0.jsonl', 5, 'etag-0'),
+        ('p/a.jsonl', 11, 'etag-a2'),
+    ]
+    cache.close()
+
+
+def test_within_ttl_serves_snapshot_without_listing(tmp_path):
+    cache = make_cache(tmp_path, ttl_seconds=3600)
+    cache.get_objects('bkt', 'p/', lambda start_after: [ObjectInfo('p/a.jsonl', 10, 'e', NOW)])
+    reconciled_at = cache.reconciled_at('bkt', 'p/')
+    
+    def fail(start_after):
+        raise AssertionError("TTL 이내에는 목록을 조회하지 않아야 함")
+    
+    objects = cache.get_objects('bkt', 'p/', fail)
+    assert [obj.key for obj in objects] == ['p/a.jsonl']
+    assert cache.reconciled_at('bkt', 'p/') == reconciled_at
+    assert cache.reconciled_at('bkt', 'other/') is None
+    cache.close()
+
+
+def test_expired_ttl_lists_after_last_key_until_reconcile(tmp_path):
+    cache = make_cache(tmp_path, reconcile_interval=3600)
+    cache.get_objects('bkt', 'p/', lambda start_after: [ObjectInfo('p/a.jsonl', 10, 'e', NOW)])
+    reconciled_at = cache.reconciled_at('bkt', 'p/')
+    
+    calls = []
+    
+    def list_after(start_after):
+        calls.append(start_after)
+        return [ObjectInfo('p/b.jsonl', 20, 'e2', NOW)]
+    
+    objects = cache.get_objects('bkt', 'p/', list_after)
+    assert calls == ['p/a.jsonl']
+    assert [obj.key for obj in objects] == ['p/a.jsonl', 'p/b.jsonl']
+    assert cache.reconciled_at('bkt', 'p/') == reconciled_at
+    
+    cache.get_objects('bkt', 'p/', list_after)
+    assert calls == ['p/a.jsonl', 'p/b.jsonl']
+    cache.close()
+
+
+def test_failed_listing_leaves_cache_unchanged(tmp_path):
+    cache = make_cache(tmp_path, ttl_seconds=3600)
+    cache.get_objects('bkt', 'p/', lambda start_after: [ObjectInfo('p/a.jsonl', 10, 'e', NOW)])
+    
+    def fail(start_after):
+        raise RuntimeError("목록 조회 실패")
+    
+    with pytest.raises(RuntimeError):
+        cache.get_objects('bkt', 'p/', fail, force_refresh=True)
+    
+    # 다른 접두사의 커밋이 실패한 갱신의 삭제를 함께 커밋하지 않아야 함
+    cache.get_objects('bkt', 'q/', lambda start_after: [])
+    cache.close()
+    
+    reopened = make_cache(tmp_path, ttl_seconds=3600)
+    objects = reopened.get_objects('bkt', 'p/', fail)
+    assert [obj.key for obj in objects] == ['p/a.jsonl']
+    reopened.close()
@@ -0,0 +1,107 @@
+"""객체 단위 검증(ETag 재계산, 오래된 목록 재조회, 검증 객체 집계) 테스트"""
+
+import hashlib
+import io
+import os
+
+from boto3.s3.transfer import TransferConfig
+
+from s3_json_compare import S3JSONComparer
+from utils.object_verifier import ObjectVerifier, compute_etag
+from utils.report_generator import ReportGenerator
+
+MIB = 1024 * 1024
+
+
+def _upload(client, bucket, key, data, part_size=None):
+    config = TransferConfig(multipart_threshold=part_size or 64 * MIB,
+                            multipart_chunksize=part_size or 64 * MIB)
+    client.upload_fileobj(io.BytesIO(data), bucket, key, Config=config)
+
+
+def _etag(client, bucket, key):
+    return client.head_object(Bucket=bucket, Key=key)['ETag'].strip('"')
+
+
+def _verify(comparer, **kwargs):
+    verifier = ObjectVerifier(comparer._handler_for)
+    pairs = verifier.pair_objects(
+        comparer.get_object_list('src'), '',
+        comparer.get_object_list('bak'), ''
+    )
+    return verifier.verify_pairs('src', 'bak', pairs, **kwargs)
+
+
+def test_compute_etag_matches_s3_single_and_multipart(s3_client):
+    data = os.urandom(13 * MIB)
+    _upload(s3_client, 'src', 'single', data[:MIB])
+    _upload(s3_client, 'src', 'multi', data, part_size=5 * MIB)
+    
+    assert compute_etag(io.BytesIO(data[:MIB])) == hashlib.md5(data[:MIB]).hexdigest()
+    assert compute_etag(io.BytesIO(data[:MIB])) == _etag(s3_client, 'src', 'single')
+    assert compute_etag(io.BytesIO(data), 5 * MIB) == _etag(s3_client, 'src', 'multi')
+    assert compute_etag(io.BytesIO(data), 8 * MIB).endswith('-2')
+
+
+def test_different_part_sizes_are_verified_by_recomputed_etag(s3_client):
+    data = os.urandom(13 * MIB)
+    _upload(s3_client, 'src', 'data.jsonl', data, part_size=5 * MIB)
+    _upload(s3_client, 'bak', 'data.jsonl', data, part_size=8 * MIB)
+    _upload(s3_client, 'src', 'other.jsonl', data, part_size=5 * MIB)
+    _upload(s3_client, 'bak', 'other.jsonl', os.urandom(13 * MIB), part_size=8 * MIB)
+    
+    comparer = S3JSONComparer('src', 'bak')
+    verified = {source.key: method for source, _, method in _verify(comparer)}
+    assert verified == {'data.jsonl': 'etag-recomputed'}
+
+
+def test_cached_listing_is_rechecked_before_fast_path(s3_client, tmp_path):
+    record = b'{"id": 1, "v": "aaaa"}\n'
+    for bucket in ('src', 'bak'):
+        s3_client.put_object(Bucket=bucket, Key='a.jsonl', Body=record)
+    
+    cache_path = str(tmp_path / 'cache.db')
+    first = S3JSONComparer('src', 'bak', listing_cache_path=cache_path, listing_cache_ttl=3600)
+    assert [source.key for source, _, _ in _verify(first)] == ['a.jsonl']
+    
+    # 목록 캐시 이후 같은 크기의 다른 내용으로 덮어쓰기
+    s3_client.put_object(Bucket='bak', Key='a.jsonl', Body=b'{"id": 1, "v": "bbbb"}\n')
+    
+    second = S3JSONComparer('src', 'bak', listing_cache_path=cache_path, listing_cache_ttl=3600)
+    assert len(_verify(second)) == 1  # 캐시된 ETag만 보면 잘못 검증됨
+    assert _verify(second, refresh_source=True, refresh_backup=True) == []
+    
+    second.compare_buckets(report_path=str(tmp_path / 'report.csv'))
+    overall = next(r for r in second.compare_results if r.file_path == 'OVERALL_COMPARISON')
+    assert overall.verified_objects == 0
+    assert (overall.missing_in_backup, overall.missing_in_source) == (1, 1)
+
+
+def test_overall_totals_stay_comparable_with_fast_path(s3_client, tmp_path):
+    same = b''.join(b'{"id": %d}\n' % i for i in range(50))
+    s3_client.put_object(Bucket='src', Key='same.jsonl', Body=same)
+    s3_client.put_object(Bucket='bak', Key='same.jsonl', Body=same)
+    s3_client.put_object(Bucket='src', Key='diff.jsonl', Body=b'{"id": 1}\n{"id": 2}\n')
+    s3_client.put_object(Bucket='bak', Key='diff.jsonl', Body=b'{"id": 1}\n')
+    s3_client.put_object(Bucket='src', Key='gone.jsonl', Body=b'{"id": 3}\n')
+    
+    def overall(**kwargs):
+        comparer = S3JSONComparer('src', 'bak', **kwargs)
+        comparer.compare_buckets(report_path=str(tmp_path / 'report.csv'))
+        return next(r for r in comparer.compare_results if r.file_path == 'OVERALL_COMPARISON')
+    
+    full = overall(object_fast_path=False)
+    fast = overall(count_verified_records=True)
+    
+    assert (full.source_records, full.missing_in_backup, full.missing_in_source) == (53, 2, 0)
+    assert (fast.missing_in_backup, fast.missing_in_source) == (2, 0)
+    assert fast.verified_objects == 1
+    assert fast.verified_bytes == len(same)
+    assert fast.verified_records == 50
+    assert fast.source_records + fast.verified_records == full.source_records
+    assert fast.matched_records + fast.verified_records == full.matched_records
+    
+    assert overall().verified_records is None
+    
+    rate = ReportGenerator()._calculate_match_rate
+    assert rate(fast) == rate(full)
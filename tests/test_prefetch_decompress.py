@@ -0,0 +1,53 @@
+"""프리페치/작은 객체 모드의 압축 해제 메모리 제한 테스트"""
+
+import gzip
+import json
+
+import pytest
+
+import s3_json_compare
+from s3_json_compare import S3JSONComparer
+from utils.compression import decompress_bytes
+
+LINES = [json.dumps({"id": i, "pad": "x" * 50}).encode() for i in range(5000)]
+BODY = b'\n'.join(LINES)
+
+
+def test_decompress_bytes_respects_max_size():
+    compressed = gzip.compress(BODY)
+    assert decompress_bytes(compressed) == BODY
+    assert decompress_bytes(compressed, max_size=len(BODY)) == BODY
+    assert decompress_bytes(compressed, max_size=len(BODY) - 1) is None
+    # 압축되지 않은 객체는 그대로
+    assert decompress_bytes(BODY, max_size=10) is BODY
+
+
+@pytest.fixture
+def gzip_buckets(s3_client):
+    for bucket in ('src', 'bak'):
+        s3_client.put_object(Bucket=bucket, Key='p/a.jsonl.gz', Body=gzip.compress(BODY))
+    return s3_client
+
+
+def test_prefetched_objects_are_stream_decompressed(gzip_buckets, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("프리페치된 객체를 통째로 압축 해제하면 안 됨")
+    
+    monkeypatch.setattr(s3_json_compare, 'decompress_bytes', fail)
+    comparer = S3JSONComparer('src', 'bak', download_mode="stream", object_fast_path=False)
+    
+    offsets, digests = comparer._generate_file_digests(
+        'src', 'p/a.jsonl.gz', gzip_buckets.get_object(Bucket='src', Key='p/a.jsonl.gz')['Body'].read()
+    )
+    assert len(offsets) == len(digests) == len(LINES)
+
+
+def test_small_mode_falls_back_to_streaming_above_cap(gzip_buckets, tmp_path):
+    comparer = S3JSONComparer('src', 'bak', download_mode="small",
+                              small_object_max_bytes=1024, object_fast_path=False)
+    data = gzip_buckets.get_object(Bucket='src', Key='p/a.jsonl.gz')['Body'].read()
+    
+    assert comparer._generate_file_digests('src', 'p/a.jsonl.gz', data)[1] == \
+        S3JSONComparer('src', 'bak', object_fast_path=False)._generate_file_digests(
+            'src', 'p/a.jsonl.gz')[1]
+    assert comparer.compare_buckets('p/', 'p/', str(tmp_path / 'report.csv'))
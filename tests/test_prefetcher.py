@@ -0,0 +1,43 @@
+"""객체 프리페처 테스트"""
+
+from s3_json_compare import S3JSONComparer
+from utils.prefetcher import ObjectPrefetcher
+
+SMALL = b'{"id": 1}\n' * 10
+LARGE = b'{"id": 2}\n' * 1000
+
+
+def test_large_objects_are_streamed_instead_of_buffered():
+    fetched = []
+    
+    def fetch(key):
+        fetched.append(key)
+        return key.encode()
+    
+    prefetcher = ObjectPrefetcher(fetch, max_prefetch=2, max_inflight_bytes=1 << 20,
+                                  stream_threshold=100)
+    items = [('a', 10), ('big', 100), ('b', 99), ('unknown', None)]
+    
+    assert list(prefetcher.iter_objects(items)) == [
+        ('a', b'a', None), ('big', None, None), ('b', b'b', None), ('unknown', b'unknown', None)
+    ]
+    assert sorted(fetched) == ['a', 'b', 'unknown']
+
+
+def test_comparer_prefetches_only_small_objects(s3_client, tmp_path):
+    for bucket in ('src', 'bak'):
+        s3_client.put_object(Bucket=bucket, Key='small.jsonl', Body=SMALL)
+        s3_client.put_object(Bucket=bucket, Key='large.jsonl', Body=LARGE)
+    
+    comparer = S3JSONComparer('src', 'bak', object_fast_path=False,
+                              prefetch_max_object_bytes=len(LARGE))
+    buffered = []
+    get_file_bytes = comparer.s3_handler.get_file_bytes
+    
+    def spy(bucket, key):
+        buffered.append(key)
+        return get_file_bytes(bucket, key)
+    
+    comparer.s3_handler.get_file_bytes = spy
+    assert comparer.compare_buckets(report_path=str(tmp_path / 'report.csv'))
+    assert buffered == ['small.jsonl', 'small.jsonl']
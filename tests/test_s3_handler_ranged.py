@@ -0,0 +1,78 @@
+"""바이트 범위 병렬 다운로드 테스트 (S3Handler.open_file_stream_ranged)"""
+
+import pytest
+from botocore.exceptions import ClientError, ReadTimeoutError
+
+from utils.s3_handler import S3Handler
+
+PART_SIZE = 1000
+
+
+class RangeRecordingClient:
+    """범위 요청을 기록하고, 지정한 범위의 첫 요청만 본문 읽기에서 끊기게 하는 S3 클라이언트"""
+    
+    def __init__(self, client, fail_range=None):
+        self._client = client
+        self._fail_range = fail_range
+        self.ranges = []
+    
+    def get_object(self, **params):
+        self.ranges.append(params.get('Range'))
+        response = self._client.get_object(**params)
+        if params.get('Range') == self._fail_range:
+            self._fail_range = None
+            
+            def fail():
+                raise ReadTimeoutError(endpoint_url="moto")
+            response['Body'].read = fail
+        return response
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def make_handler(fail_range=None):
+    handler = S3Handler(request_rate=None)
+    client = RangeRecordingClient(handler._client_for('src'), fail_range)
+    handler._client_for = lambda bucket_name: client
+    return handler, client
+
+
+@pytest.mark.parametrize('size', [0, 1, PART_SIZE - 1, PART_SIZE, PART_SIZE * 5, PART_SIZE * 5 + 7])
+def test_ranged_stream_reassembles_parts_in_order(s3_client, size):
+    body = bytes(i % 251 for i in range(size))
+    s3_client.put_object(Bucket='src', Key='obj.bin', Body=body)
+    handler, client = make_handler()
+    
+    with handler.open_file_stream_ranged('src', 'obj.bin', part_size=PART_SIZE, max_concurrency=3,
+                                         max_inflight_bytes=PART_SIZE * 4, buffer_size=333) as stream:
+        assert stream.read() == body
+    
+    expected_parts = max(1, -(-size // PART_SIZE))
+    assert len(client.ranges) == expected_parts
+    assert handler.get_pool_stats()['in_use'] == 0
+
+
+def test_ranged_stream_retries_interrupted_part(s3_client):
+    body = bytes(i % 251 for i in range(PART_SIZE * 3))
+    s3_client.put_object(Bucket='src', Key='obj.bin', Body=body)
+    handler, client = make_handler(fail_range=f'bytes={PART_SIZE}-{2 * PART_SIZE - 1}')
+    
+    with handler.open_file_stream_ranged('src', 'obj.bin', part_size=PART_SIZE) as stream:
+        assert stream.read() == body
+    assert client.ranges.count(f'bytes={PART_SIZE}-{2 * PART_SIZE - 1}') == 2
+
+
+def test_ranged_stream_fails_when_object_changes(s3_client):
+    body = bytes(i % 251 for i in range(PART_SIZE * 10))
+    s3_client.put_object(Bucket='src', Key='obj.bin', Body=body)
+    handler, _ = make_handler()
+    
+    # 동시에 한 파트만 미리 받도록 제한한 뒤 다운로드 도중 객체를 덮어씀
+    with handler.open_file_stream_ranged('src', 'obj.bin', part_size=PART_SIZE, max_concurrency=1,
+                                         max_inflight_bytes=PART_SIZE * 2) as stream:
+        assert stream.read(PART_SIZE) == body[:PART_SIZE]
+        s3_client.put_object(Bucket='src', Key='obj.bin', Body=body[::-1])
+        with pytest.raises(ClientError) as error:
+            stream.read()
+    assert error.value.response['Error']['Code'] == 'PreconditionFailed'
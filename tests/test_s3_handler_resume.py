@@ -0,0 +1,86 @@
+"""끊긴 다운로드 이어 받기 테스트 (S3Handler.open_file_stream / get_file_bytes)"""
+
+import pytest
+from botocore.exceptions import ReadTimeoutError
+
+from utils.s3_handler import S3Handler
+
+BODY = bytes(range(256)) * 4096  # 1 MiB
+
+
+class FlakyBody:
+    """처음 fail_after 바이트를 넘겨준 뒤 한 번 연결 끊김 오류를 내는 본문"""
+    
+    def __init__(self, body, fail_after):
+        self._body = body
+        self._remaining = fail_after
+    
+    def read(self, size=None):
+        if self._remaining is not None and self._remaining <= 0:
+            self._remaining = None
+            raise ReadTimeoutError(endpoint_url="moto")
+        if self._remaining is not None and size is not None:
+            size = min(size, self._remaining)
+        data = self._body.read(size)
+        if self._remaining is not None:
+            self._remaining -= len(data)
+        return data
+    
+    def close(self):
+        self._body.close()
+
+
+class FlakyClient:
+    """첫 번째 전체 GET의 본문만 중간에 끊기도록 감싼 S3 클라이언트"""
+    
+    def __init__(self, client, fail_after):
+        self._client = client
+        self._fail_after = fail_after
+        self.ranges = []
+    
+    def get_object(self, **params):
+        response = self._client.get_object(**params)
+        self.ranges.append(params.get('Range'))
+        if self._fail_after is not None and 'Range' not in params:
+            response['Body'] = FlakyBody(response['Body'], self._fail_after)
+            self._fail_after = None
+        return response
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+@pytest.fixture
+def flaky_handler(s3_client):
+    s3_client.put_object(Bucket='src', Key='big.bin', Body=BODY)
+    handler = S3Handler(request_rate=None)
+    flaky = FlakyClient(handler._client_for('src'), fail_after=300_000)
+    handler._client_for = lambda bucket_name: flaky
+    return handler, flaky
+
+
+def test_get_file_bytes_resumes_after_transient_error(flaky_handler):
+    handler, flaky = flaky_handler
+    
+    assert handler.get_file_bytes('src', 'big.bin') == BODY
+    assert flaky.ranges == [None, 'bytes=300000-']
+    assert handler.get_pool_stats()['in_use'] == 0
+
+
+def test_open_file_stream_resumes_without_rereading(flaky_handler):
+    handler, flaky = flaky_handler
+    
+    with handler.open_file_stream('src', 'big.bin', buffer_size=64 * 1024) as stream:
+        assert stream.read() == BODY
+    assert flaky.ranges == [None, 'bytes=300000-']
+
+
+def test_resume_gives_up_after_max_attempts(s3_client):
+    s3_client.put_object(Bucket='src', Key='big.bin', Body=BODY)
+    handler = S3Handler(request_rate=None, max_resume_attempts=0)
+    flaky = FlakyClient(handler._client_for('src'), fail_after=1000)
+    handler._client_for = lambda bucket_name: flaky
+    
+    with pytest.raises(ReadTimeoutError):
+        handler.get_file_bytes('src', 'big.bin')
+    assert handler.get_pool_stats()['in_use'] == 0
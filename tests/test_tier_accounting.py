@@ -0,0 +1,115 @@
+"""JSONL 원본 줄 1단계/정규화 해시 2단계 집계 테스트"""
+
+import gzip
+import json
+from collections import Counter
+
+import pytest
+
+from s3_json_compare import S3JSONComparer
+
+SOURCE_FILES = {
+    'a.jsonl': [
+        '{"id": 1, "v": "x"}',
+        '{"v": "x", "id": 1}',          # 키 순서만 다른 중복
+        '{"id": 2, "v": [1, 2]}',
+        '',
+        '{"id": 3, "v": null}',
+        '{"id": 3, "v": null}',         # 같은 줄 중복 (백업에는 한 번)
+        '{"id": 4, "v": "only source"}',
+    ],
+    'b.jsonl.gz': [
+        '{"id": 10, "n": {"b": 1, "a": 2}}',
+        '{"id": 11}',
+        '{"id": 12, "moved": true}',
+    ],
+}
+
+BACKUP_FILES = {
+    'a.jsonl': [
+        '{"id": 1, "v": "x"}',
+        '{"id": 1, "v": "x"}',          # 소스의 키 순서 변형과 짝
+        '{"id":2,"v":[1,2]}',           # 공백만 다름
+        '{"id": 3, "v": null}',
+        '{"id": 5, "v": "only backup"}',
+    ],
+    'b.jsonl.gz': [
+        '{"id": 10, "n": {"a": 2, "b": 1}}',
+        '   {"id": 11}   ',
+    ],
+    'c.json': '[{"moved": true, "id": 12}]',  # 다른 파일/형식으로 옮겨진 레코드
+}
+
+
+def _write(root, files):
+    for name, lines in files.items():
+        body = (lines if isinstance(lines, str) else '\n'.join(lines)).encode()
+        (root / name).write_bytes(gzip.compress(body) if name.endswith('.gz') else body)
+
+
+def _canonical_counts(files):
+    counts = Counter()
+    for lines in files.values():
+        records = json.loads(lines) if isinstance(lines, str) else \
+            [json.loads(line) for line in lines if line.strip()]
+        counts.update(json.dumps(record, sort_keys=True) for record in records)
+    return counts
+
+
+@pytest.fixture
+def local_dirs(tmp_path, aws_env):
+    source, backup = tmp_path / 'src', tmp_path / 'bak'
+    source.mkdir()
+    backup.mkdir()
+    _write(source, SOURCE_FILES)
+    _write(backup, BACKUP_FILES)
+    return source, backup
+
+
+def _overall(source, backup, tmp_path, **kwargs):
+    comparer = S3JSONComparer(str(source), str(backup), compare_mode="auto", **kwargs)
+    comparer.compare_buckets(report_path=str(tmp_path / 'report.csv'))
+    result = next(r for r in comparer.compare_results if r.file_path == 'OVERALL_COMPARISON')
+    return (result.source_records, result.backup_records, result.matched_records,
+            result.missing_in_backup, result.missing_in_source)
+
+
+def test_totals_are_identical_with_and_without_raw_line_tier(local_dirs, tmp_path):
+    source_counts = _canonical_counts(SOURCE_FILES)
+    backup_counts = _canonical_counts(BACKUP_FILES)
+    expected = (
+        sum(source_counts.values()),
+        sum(backup_counts.values()),
+        sum((source_counts & backup_counts).values()),
+        sum((source_counts - backup_counts).values()),
+        sum((backup_counts - source_counts).values()),
+    )
+    assert expected == (9, 8, 7, 2, 1)
+    
+    with_tier = _overall(*local_dirs, tmp_path, raw_line_tier=True)
+    without_tier = _overall(*local_dirs, tmp_path, raw_line_tier=False)
+    assert with_tier == without_tier == expected
+
+
+def test_unmatched_lines_are_read_from_recorded_offsets(local_dirs, tmp_path, monkeypatch):
+    source, backup = local_dirs
+    comparer = S3JSONComparer(str(source), str(backup), compare_mode="auto")
+    offsets, _ = comparer._generate_file_digests(str(source), 'a.jsonl')
+    
+    rows = comparer._hash_lines_at(str(source), 'a.jsonl', [(offsets[1], 2), (offsets[-1], 1)])
+    assert rows == [
+        (comparer._generate_record_hash({"id": 1, "v": "x"}), 2),
+        (comparer._generate_record_hash({"id": 4, "v": "only source"}), 1),
+    ]
+
+
+def test_invalid_lines_are_excluded_in_both_tiers(tmp_path, aws_env):
+    source, backup = tmp_path / 'src', tmp_path / 'bak'
+    source.mkdir()
+    backup.mkdir()
+    for root in (source, backup):
+        (root / 'a.jsonl').write_bytes(b'{"id":1}\nnot json\n{"big": 123456789012345678901234}\n')
+    
+    with_tier = _overall(source, backup, tmp_path, raw_line_tier=True)
+    without_tier = _overall(source, backup, tmp_path, raw_line_tier=False)
+    assert with_tier == without_tier == (2, 2, 2, 0, 0)
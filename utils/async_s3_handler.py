@@ -0,0 +1,566 @@
+"""
+비동기 S3 핸들러 모듈
+
+aiobotocore 기반으로 수천 개의 동시 GET을 처리하는 S3Handler 대체 구현
+"""
+
+import asyncio
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple, TypeVar
+
+from botocore.exceptions import ClientError
+
+from .object_info import ObjectInfo, head_object_options, metadata_from_head
+from .rate_limiter import DEFAULT_REQUEST_RATE, RequestRateGovernor
+from .s3_handler import (DEFAULT_CONNECT_TIMEOUT, DEFAULT_MAX_ATTEMPTS,
+                         DEFAULT_MAX_RESUME_ATTEMPTS, DEFAULT_READ_TIMEOUT,
+                         DEFAULT_RETRY_MODE, DEFAULT_STREAM_BUFFER_SIZE,
+                         TRANSIENT_STREAM_ERRORS, ConnectionPoolMonitor,
+                         _StreamingBodyReader)
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:  # aiobotocore는 선택 의존성
+    AioConfig = None
+    get_session = None
+
+try:
+    import aiohttp
+    # aiohttp 본문 읽기 중 연결이 끊기는 오류도 이어 받기로 복구
+    ASYNC_TRANSIENT_STREAM_ERRORS = TRANSIENT_STREAM_ERRORS + (
+        aiohttp.ClientPayloadError, aiohttp.ClientConnectionError
+    )
+except ImportError:
+    ASYNC_TRANSIENT_STREAM_ERRORS = TRANSIENT_STREAM_ERRORS
+
+# 비동기 백엔드 기본값
+DEFAULT_ASYNC_CONCURRENCY = 256
+DEFAULT_ASYNC_PROCESS_WORKERS = 8
+
+T = TypeVar('T')
+
+
+class _SyncBody:
+    """이벤트 루프 스레드에서 읽는 aiobotocore 본문을 동기 read/close로 감싸는 어댑터"""
+    
+    def __init__(self, handler: "AsyncS3Handler", body):
+        """
+        _SyncBody 초기화
+        
+        Args:
+            handler: 이벤트 루프를 가진 AsyncS3Handler
+            body: get_object 응답의 aiobotocore StreamingBody
+        """
+        self._handler = handler
+        self._body = body
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._handler._run(self._body.read(size if size >= 0 else None))
+    
+    def close(self):
+        self._body.close()
+
+
+class AsyncS3Handler:
+    """aiobotocore 기반 비동기 S3 핸들러 (S3Handler와 같은 동기 인터페이스 제공)"""
+    
+    def __init__(self, aws_access_key_id: Optional[str] = None,
+                 aws_secret_access_key: Optional[str] = None,
+                 region_name: str = "us-east-1",
+                 max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+                 process_workers: int = DEFAULT_ASYNC_PROCESS_WORKERS,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 retry_mode: str = DEFAULT_RETRY_MODE,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 endpoint_url: Optional[str] = None,
+                 request_rate: Optional[float] = DEFAULT_REQUEST_RATE,
+                 max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS):
+        """
+        AsyncS3Handler 초기화
+        
+        전용 스레드에서 이벤트 루프를 실행하고, 동기 메서드는 그 루프에
+        코루틴을 제출한 뒤 결과를 기다립니다. S3Handler와 마찬가지로 버킷 리전별
+        클라이언트, 접두사별 요청 속도 조절, 끊긴 다운로드 이어 받기를 지원합니다.
+        사용 후 close()해야 합니다.
+        
+        Args:
+            aws_access_key_id: AWS 액세스 키 ID
+            aws_secret_access_key: AWS 시크릿 액세스 키
+            region_name: AWS 리전명
+            max_concurrency: 동시에 진행할 최대 GET 요청 수 (연결 풀 크기와 동일)
+            process_workers: 압축 해제/해시를 수행할 스레드 수
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기 타임아웃 (초)
+            retry_mode: 재시도 모드 ("adaptive", "standard", "legacy")
+            max_attempts: 최대 시도 횟수 (첫 요청 포함)
+            endpoint_url: S3 호환 엔드포인트 URL (로컬 moto 서버 등)
+            request_rate: 버킷/접두사별 시작 요청 속도 (초당 요청 수, None이면 속도 조절 안 함)
+            max_resume_attempts: 다운로드 도중 연결이 끊겼을 때 이어 받을 최대 횟수
+        """
+        if get_session is None:
+            raise ImportError("비동기 백엔드를 사용하려면 aiobotocore를 설치하세요")
+        
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency = max_concurrency
+        self.max_resume_attempts = max_resume_attempts
+        self.pool_monitor = ConnectionPoolMonitor(max_concurrency)
+        self.rate_governor = (
+            RequestRateGovernor(rate=request_rate) if request_rate else None
+        )
+        self._process_executor = ThreadPoolExecutor(
+            max_workers=process_workers,
+            thread_name_prefix="s3-async-process"
+        )
+        
+        # 이벤트 루프 스레드 시작
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="s3-async-loop",
+            daemon=True
+        )
+        self._loop_thread.start()
+        
+        self._client_config = AioConfig(
+            max_pool_connections=max_concurrency,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries={'mode': retry_mode, 'max_attempts': max_attempts}
+        )
+        self._endpoint_url = endpoint_url
+        self._credentials = (aws_access_key_id, aws_secret_access_key)
+        self._session = get_session()
+        
+        # 리전별 클라이언트 (async with 컨텍스트, 클라이언트)와 버킷별 리전 캐시
+        self._region_name = region_name
+        self._regional_clients: Dict[str, Tuple[Any, Any]] = {}
+        self._bucket_regions: Dict[str, str] = {}
+        self._client_lock: Optional[asyncio.Lock] = None
+        
+        try:
+            self._client = self._run(self._get_regional_client(region_name))
+            self.logger.info("비동기 S3 클라이언트 초기화 완료")
+        except Exception as e:
+            self.logger.error(f"비동기 S3 클라이언트 초기화 실패: {e}")
+            self._stop_loop()
+            raise
+    
+    def _run(self, coroutine):
+        """
+        이벤트 루프 스레드에서 코루틴을 실행하고 결과를 기다립니다
+        
+        Args:
+            coroutine: 실행할 코루틴
+        
+        Returns:
+            코루틴 결과
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    async def _get_regional_client(self, region_name: str):
+        """
+        리전별 비동기 S3 클라이언트를 반환합니다 (없으면 생성, 이벤트 루프 안에서 실행)
+        
+        Args:
+            region_name: AWS 리전명
+        
+        Returns:
+            해당 리전의 aiobotocore S3 클라이언트
+        """
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+        
+        async with self._client_lock:
+            entry = self._regional_clients.get(region_name)
+            if entry is None:
+                aws_access_key_id, aws_secret_access_key = self._credentials
+                context = self._session.create_client(
+                    's3',
+                    region_name=region_name,
+                    endpoint_url=self._endpoint_url,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    config=self._client_config
+                )
+                client = await context.__aenter__()
+                if self.rate_governor is not None:
+                    self.rate_governor.register_async(client)
+                entry = self._regional_clients[region_name] = (context, client)
+            return entry[1]
+    
+    async def _client_for(self, bucket_name: str):
+        """
+        버킷 리전에 맞는 클라이언트를 반환합니다 (버킷별로 HeadBucket 한 번, S3Handler와 동일)
+        
+        Args:
+            bucket_name: S3 버킷명
+        
+        Returns:
+            aiobotocore S3 클라이언트
+        """
+        region = self._bucket_regions.get(bucket_name)
+        if region is None:
+            try:
+                response = await self._client.head_bucket(Bucket=bucket_name)
+                headers = response['ResponseMetadata']['HTTPHeaders']
+            except ClientError as e:
+                # 리전이 다른 경우의 301이나 403 응답에도 리전 헤더가 포함됨
+                headers = e.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+                if 'x-amz-bucket-region' not in headers:
+                    raise
+            region = headers.get('x-amz-bucket-region') or self._region_name
+            self._bucket_regions[bucket_name] = region
+            self.logger.info(f"버킷 '{bucket_name}' 리전: {region}")
+        return await self._get_regional_client(region)
+    
+    async def _read_object(self, bucket_name: str, file_path: str) -> bytes:
+        """
+        객체 전체를 읽습니다 (이벤트 루프 안에서 실행)
+        
+        읽는 도중 연결이 끊기면 읽은 위치부터 Range 요청(ETag로 고정)으로 이어 받습니다.
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+        
+        Returns:
+            파일 내용
+        """
+        client = await self._client_for(bucket_name)
+        chunks = []
+        offset = 0
+        etag = None
+        
+        for attempt in range(self.max_resume_attempts + 1):
+            params = {'Bucket': bucket_name, 'Key': file_path}
+            if etag is not None:
+                params.update(Range=f"bytes={offset}-", IfMatch=etag)
+            try:
+                with self.pool_monitor.track():
+                    response = await client.get_object(**params)
+                    etag = response['ETag']
+                    async with response['Body'] as body:
+                        # 끊겨도 받은 청크는 유지하도록 나누어 읽음
+                        while True:
+                            chunk = await body.read(DEFAULT_STREAM_BUFFER_SIZE)
+                            if not chunk:
+                                return b''.join(chunks)
+                            chunks.append(chunk)
+                            offset += len(chunk)
+            except ASYNC_TRANSIENT_STREAM_ERRORS as e:
+                if etag is None or attempt >= self.max_resume_attempts:
+                    raise
+                self.logger.warning(
+                    f"객체 읽기 중단, {offset:,} 바이트부터 이어 받기 ({file_path}): {e}"
+                )
+    
+    def iter_processed(self, bucket_name: str, file_paths: Iterable[str],
+                       process: Callable[[str, bytes], T],
+                       concurrency: Optional[int] = None
+                       ) -> Generator[Tuple[str, Optional[T], Optional[Exception]], None, None]:
+        """
+        객체를 비동기로 내려받고(fetch) 스레드 풀에서 압축 해제/해시(process)하는
+        파이프라인을 실행하고 결과를 완료 순서대로 반환합니다
+        
+        동시 GET 수는 concurrency로, 소비되지 않은 결과 수는 내부 큐 크기로
+        제한되므로 메모리 사용량이 일정합니다.
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_paths: 파일 경로 목록
+            process: (파일 경로, 내용)을 받아 결과를 반환하는 함수 (작업 스레드에서 실행)
+            concurrency: 동시 GET 요청 수 (기본값: max_concurrency)
+        
+        Yields:
+            (파일 경로, 처리 결과 또는 None, 오류 또는 None)
+        """
+        concurrency = concurrency or self.max_concurrency
+        file_iterator = iter(file_paths)
+        done = object()
+        
+        async def start_pipeline() -> Tuple[asyncio.Queue, asyncio.Task]:
+            results = asyncio.Queue(maxsize=concurrency * 2)
+            loop = asyncio.get_running_loop()
+            
+            async def worker():
+                # 여러 작업자가 하나의 반복자에서 키를 꺼내므로 키 수와 무관하게 태스크 수가 일정
+                for file_path in file_iterator:
+                    try:
+                        data = await self._read_object(bucket_name, file_path)
+                        result = await loop.run_in_executor(
+                            self._process_executor, process, file_path, data
+                        )
+                        await results.put((file_path, result, None))
+                    except Exception as e:
+                        await results.put((file_path, None, e))
+            
+            async def run_workers():
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+                await results.put(done)
+            
+            return results, loop.create_task(run_workers())
+        
+        results, pipeline = self._run(start_pipeline())
+        
+        try:
+            while True:
+                item = self._run(results.get())
+                if item is done:
+                    break
+                yield item
+        finally:
+            # 소비자가 중간에 멈춘 경우 대기 중인 작업자를 정리
+            self._loop.call_soon_threadsafe(pipeline.cancel)
+    
+    def list_objects(self, bucket_name: str, prefix: str = "",
+                     suffix: str = "", parallel: bool = False,
+                     start_after: Optional[str] = None,
+                     **kwargs) -> List[ObjectInfo]:
+        """
+        S3 버킷에서 객체 정보 목록을 가져옵니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사 필터
+            suffix: 접미사 필터
+            parallel: S3Handler와의 호환용 (비동기 백엔드는 순차 페이지 조회)
+            start_after: 이 키 이후의 객체만 나열
+        
+        Returns:
+            키 순으로 정렬된 객체 정보 목록
+        """
+        async def list_pages() -> List[ObjectInfo]:
+            objects = []
+            params = {'Bucket': bucket_name, 'Prefix': prefix}
+            if start_after:
+                params['StartAfter'] = start_after
+            
+            client = await self._client_for(bucket_name)
+            paginator = client.get_paginator('list_objects_v2')
+            with self.pool_monitor.track():
+                async for page in paginator.paginate(**params):
+                    for obj in page.get('Contents', []):
+                        file_path = obj['Key']
+                        if suffix and not file_path.endswith(suffix):
+                            continue
+                        if not file_path.endswith('/'):
+                            objects.append(ObjectInfo.from_listing(obj))
+            return objects
+        
+        try:
+            objects = self._run(list_pages())
+        except ClientError as e:
+            self.logger.error(f"파일 목록 가져오기 실패: {e}")
+            raise
+        
+        self.logger.info(f"버킷 '{bucket_name}'에서 {len(objects)}개 파일 발견")
+        return objects
+    
+    def list_files(self, bucket_name: str, prefix: str = "",
+                   suffix: str = "", **kwargs) -> List[str]:
+        """
+        S3 버킷에서 파일 목록을 가져옵니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사 필터
+            suffix: 접미사 필터
+        
+        Returns:
+            파일 경로 목록
+        """
+        return [obj.key for obj in self.list_objects(bucket_name, prefix, suffix)]
+    
+    def get_file_bytes(self, bucket_name: str, file_path: str) -> bytes:
+        """
+        S3 파일 전체를 바이트로 가져옵니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+        
+        Returns:
+            파일 내용
+        """
+        try:
+            return self._run(self._read_object(bucket_name, file_path))
+        except ClientError as e:
+            self.logger.error(f"파일 가져오기 실패 ({file_path}): {e}")
+            raise
+    
+    def get_file_stream(self, bucket_name: str, file_path: str) -> io.BytesIO:
+        """
+        S3 파일 전체를 메모리로 읽어 스트림으로 가져옵니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+        
+        Returns:
+            파일 스트림
+        """
+        return io.BytesIO(self.get_file_bytes(bucket_name, file_path))
+    
+    def open_file_stream(self, bucket_name: str, file_path: str,
+                         buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE) -> io.BufferedReader:
+        """
+        S3 파일을 메모리에 적재하지 않고 스트리밍으로 엽니다
+        
+        S3Handler.open_file_stream과 같이 버퍼 크기만큼씩 읽으므로 객체 크기와 관계없이
+        메모리 사용량이 일정하고, 연결이 끊기면 읽은 위치부터 Range 요청(ETag로 고정)으로
+        이어 받습니다. 사용 후 close()해야 합니다.
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+            buffer_size: 읽기 버퍼 크기 (바이트)
+        
+        Returns:
+            바이너리 스트림
+        """
+        async def get(**params):
+            client = await self._client_for(bucket_name)
+            return await client.get_object(Bucket=bucket_name, Key=file_path, **params)
+        
+        # 스트림이 닫힐 때까지 연결을 점유하므로 close 시점에 반환 기록
+        self.pool_monitor.acquire()
+        try:
+            response = self._run(get())
+            etag = response['ETag']
+            total_size = response['ContentLength']
+            
+            def reopen(offset: int):
+                if offset >= total_size:
+                    return io.BytesIO(b'')
+                # 다운로드 도중 객체가 바뀌었으면 412(PreconditionFailed)로 실패
+                return _SyncBody(self, self._run(
+                    get(Range=f"bytes={offset}-", IfMatch=etag)
+                )['Body'])
+            
+            return io.BufferedReader(
+                _StreamingBodyReader(
+                    _SyncBody(self, response['Body']),
+                    on_close=self.pool_monitor.release,
+                    reopen=reopen,
+                    max_resume_attempts=self.max_resume_attempts,
+                    transient_errors=ASYNC_TRANSIENT_STREAM_ERRORS
+                ),
+                buffer_size=buffer_size
+            )
+        except ClientError as e:
+            self.pool_monitor.release()
+            self.logger.error(f"파일 스트림 열기 실패 ({file_path}): {e}")
+            raise
+        except Exception:
+            self.pool_monitor.release()
+            raise
+    
+    def get_file_metadata(self, bucket_name: str, file_path: str,
+                          checksum_mode: bool = False,
+                          part_number: Optional[int] = None) -> dict:
+        """
+        S3 파일의 메타데이터를 가져옵니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+            checksum_mode: 추가 체크섬(ChecksumSHA256/CRC32C 등)도 조회할지 여부
+            part_number: 멀티파트 객체의 파트 번호 (지정하면 size가 해당 파트 크기)
+        
+        Returns:
+            파일 메타데이터
+        """
+        async def head() -> dict:
+            with self.pool_monitor.track():
+                client = await self._client_for(bucket_name)
+                return await client.head_object(
+                    Bucket=bucket_name, Key=file_path,
+                    **head_object_options(checksum_mode, part_number)
+                )
+        
+        try:
+            response = self._run(head())
+        except ClientError as e:
+            self.logger.error(f"파일 메타데이터 가져오기 실패 ({file_path}): {e}")
+            raise
+        
+        return metadata_from_head(response)
+    
+    def get_file_size(self, bucket_name: str, file_path: str) -> int:
+        """
+        S3 파일의 크기를 가져옵니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+        
+        Returns:
+            파일 크기 (바이트)
+        """
+        return self.get_file_metadata(bucket_name, file_path)['size']
+    
+    def file_exists(self, bucket_name: str, file_path: str) -> bool:
+        """
+        S3 파일이 존재하는지 확인합니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+        
+        Returns:
+            파일 존재 여부
+        """
+        try:
+            self.get_file_metadata(bucket_name, file_path)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                return False
+            raise
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        연결 풀 사용 통계를 반환합니다
+        
+        Returns:
+            연결 풀 사용 통계
+        """
+        return self.pool_monitor.get_stats()
+    
+    def get_rate_stats(self) -> Dict[str, Any]:
+        """
+        접두사별 요청 속도 조절 통계를 반환합니다
+        
+        Returns:
+            속도 조절 통계 (속도 조절을 사용하지 않으면 빈 딕셔너리)
+        """
+        if self.rate_governor is None:
+            return {}
+        return self.rate_governor.get_stats()
+    
+    def _stop_loop(self):
+        """이벤트 루프 스레드를 멈춥니다"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._process_executor.shutdown(wait=False)
+    
+    def close(self):
+        """클라이언트를 닫고 이벤트 루프를 종료합니다"""
+        if self._loop.is_closed():
+            return
+        
+        async def close_clients():
+            for context, _ in self._regional_clients.values():
+                await context.__aexit__(None, None, None)
+            self._regional_clients.clear()
+        
+        try:
+            self._run(close_clients())
+        finally:
+            self._stop_loop()
@@ -0,0 +1,75 @@
+"""
+정규화 직렬화 모듈
+
+레코드를 키 순서와 공백에 무관한 정규화 바이트로 직렬화하는 함수
+(정렬된 dict 사본을 만들지 않고 해시 함수에 바로 넘길 수 있는 bytes를 생성)
+"""
+
+import json
+import math
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS if orjson is not None else 0
+_json_encoder = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def _canonical_bytes_json(record: Any) -> bytes:
+    """표준 라이브러리로 정규화 바이트를 만듭니다 (키 정렬, 공백 없음, UTF-8)"""
+    return _json_encoder.encode(record).encode('utf-8')
+
+
+def _has_non_finite(value: Any) -> bool:
+    """값 안에 NaN/Infinity float가 있는지 확인합니다"""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _canonical_bytes_orjson(record: Any) -> bytes:
+    """
+    orjson OPT_SORT_KEYS로 정규화 바이트를 만듭니다
+    
+    직렬화할 수 없는 값(64비트 범위를 넘는 정수 등)이 있거나, orjson이 null로 바꾸는
+    NaN/Infinity가 있으면 표준 라이브러리로 직렬화합니다. NaN 확인은 출력에 null이
+    있는 레코드에만 수행합니다.
+    """
+    try:
+        encoded = orjson.dumps(record, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return _canonical_bytes_json(record)
+    if b'null' in encoded and _has_non_finite(record):
+        return _canonical_bytes_json(record)
+    return encoded
+
+
+def get_canonical_encoder(use_orjson: bool = True) -> Callable[[Any], bytes]:
+    """
+    레코드를 정규화 바이트로 직렬화하는 함수를 반환합니다
+    
+    모든 깊이의 dict 키를 정렬하고 공백 없이 UTF-8로 직렬화하므로 키 순서나
+    들여쓰기만 다른 레코드는 같은 바이트가 됩니다. 리스트 순서는 유지합니다.
+    NaN/Infinity는 orjson 사용 여부와 관계없이 null과 다른 값으로 직렬화됩니다
+    (한 번의 비교 안에서는 항상 같은 함수를 사용해야 함).
+    
+    Args:
+        use_orjson: orjson이 설치되어 있으면 사용할지 여부
+    
+    Returns:
+        레코드 → 정규화 바이트 함수
+    """
+    if use_orjson and orjson is not None:
+        return _canonical_bytes_orjson
+    return _canonical_bytes_json
+
+
+canonical_bytes = get_canonical_encoder()
+
@@ -0,0 +1,144 @@
+"""
+압축 해제 모듈
+
+객체 앞부분의 매직 바이트로 압축 형식(gzip, zstd, bz2, xz)을 판단하고,
+스트림 또는 메모리의 바이트를 압축 해제하는 함수
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+from typing import IO, Optional
+
+from .json_processor import peek_head
+
+# gzip은 ISA-L(isal) 또는 zlib-ng 바인딩이 있으면 사용 (표준 zlib보다 inflate가 수 배 빠름)
+try:
+    from isal import igzip as gzip_module
+except ImportError:
+    try:
+        from zlib_ng import gzip_ng as gzip_module
+    except ImportError:
+        gzip_module = gzip
+
+# zstd는 Python 3.14 표준 라이브러리 또는 zstandard 패키지 (선택 의존성)
+try:
+    from compression import zstd as stdlib_zstd
+except ImportError:
+    stdlib_zstd = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축 형식별 매직 바이트
+COMPRESSION_MAGIC = {
+    'gzip': b'\x1f\x8b',
+    'zstd': b'\x28\xb5\x2f\xfd',
+    'bz2': b'BZh',
+    'xz': b'\xfd7zXZ\x00',
+}
+MAGIC_HEAD_SIZE = max(len(magic) for magic in COMPRESSION_MAGIC.values())
+
+# 압축 해제 스트림의 읽기 버퍼 크기
+DEFAULT_DECOMPRESS_BUFFER_SIZE = 1024 * 1024
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """
+    앞부분 바이트로 압축 형식을 판단합니다
+    
+    Args:
+        head: 객체의 앞부분 바이트 (MAGIC_HEAD_SIZE 이상 권장)
+    
+    Returns:
+        압축 형식 ("gzip", "zstd", "bz2", "xz"), 압축되지 않았으면 None
+    """
+    for codec, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def _require_zstd():
+    """zstd 압축 해제 구현이 없으면 예외를 발생시킵니다"""
+    if stdlib_zstd is None and zstandard is None:
+        raise ImportError("zstd 압축 객체를 읽으려면 zstandard를 설치하세요")
+
+
+def open_decompressed(stream: IO, codec: Optional[str] = None,
+                      buffer_size: int = DEFAULT_DECOMPRESS_BUFFER_SIZE) -> IO:
+    """
+    스트림을 압축 해제하며 읽는 바이너리 스트림을 엽니다
+    
+    반환된 스트림을 닫아도 원본 스트림은 닫히지 않으므로 호출 측에서 닫아야 합니다.
+    
+    Args:
+        stream: 원본 바이너리 스트림 (S3 StreamingBody, 로컬 파일 등)
+        codec: 압축 형식 (None이면 스트림 앞부분의 매직 바이트로 판단)
+        buffer_size: zstd 압축 해제 스트림의 읽기 버퍼 크기
+    
+    Returns:
+        압축 해제된 바이너리 스트림 (압축되지 않았으면 원본 스트림)
+    """
+    if codec is None:
+        codec = detect_compression(peek_head(stream, MAGIC_HEAD_SIZE))
+    
+    if codec is None:
+        return stream
+    if codec == 'gzip':
+        return gzip_module.open(stream, 'rb')
+    if codec == 'bz2':
+        return bz2.BZ2File(stream)
+    if codec == 'xz':
+        return lzma.LZMAFile(stream)
+    if codec == 'zstd':
+        _require_zstd()
+        if stdlib_zstd is not None:
+            return stdlib_zstd.ZstdFile(stream)
+        # 여러 프레임을 이어 붙인 객체도 끝까지 읽고, 줄 단위 읽기를 위해 버퍼로 감쌈
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            stream, read_across_frames=True, closefd=False
+        )
+        return io.BufferedReader(reader, buffer_size=buffer_size)
+    
+    raise ValueError(f"지원하지 않는 압축 형식: {codec}")
+
+
+def decompress_bytes(data: bytes, max_size: Optional[int] = None) -> Optional[bytes]:
+    """
+    메모리에 올라온 객체 전체를 압축 해제합니다 (압축 형식은 매직 바이트로 판단)
+    
+    압축률이 높은 객체는 압축 해제 크기가 훨씬 크므로, max_size를 지정하면 그 크기까지만
+    압축 해제하고 넘으면 None을 반환합니다 (호출 측에서 스트리밍으로 처리).
+    
+    Args:
+        data: 객체 내용
+        max_size: 압축 해제된 내용의 최대 크기 (None이면 제한 없음)
+    
+    Returns:
+        압축 해제된 내용 (압축되지 않았으면 원본 그대로, max_size를 넘으면 None)
+    """
+    codec = detect_compression(data[:MAGIC_HEAD_SIZE])
+    
+    if codec is None:
+        return data
+    if max_size is not None:
+        with open_decompressed(io.BytesIO(data), codec) as stream:
+            decompressed = stream.read(max_size + 1)
+        return decompressed if len(decompressed) <= max_size else None
+    if codec == 'gzip':
+        return gzip_module.decompress(data)
+    if codec == 'bz2':
+        return bz2.decompress(data)
+    if codec == 'xz':
+        return lzma.decompress(data)
+    
+    _require_zstd()
+    if stdlib_zstd is not None:
+        return stdlib_zstd.decompress(data)
+    # 프레임 헤더에 원본 크기가 없는 스트리밍 압축 객체도 처리
+    with zstandard.ZstdDecompressor().stream_reader(data, read_across_frames=True) as reader:
+        return reader.read()
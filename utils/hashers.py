@@ -0,0 +1,78 @@
+"""
+레코드 해시 알고리즘 모듈
+
+정규화 바이트를 고정 길이 바이너리 다이제스트로 만드는 해시 함수를 선택하는 함수
+(비교에는 암호학적 강도가 필요 없으므로 기본값은 xxh3_128, xxhash가 없으면 128비트로 줄인 sha256)
+"""
+
+import hashlib
+from typing import Callable, Dict
+
+try:
+    import xxhash
+except ImportError:  # xxhash는 선택 의존성
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:  # blake3는 선택 의존성
+    blake3 = None
+
+# 알고리즘별 다이제스트 크기 (바이트)
+HASH_DIGEST_SIZES: Dict[str, int] = {
+    'xxh3_128': 16,
+    'blake2b': 16,
+    'blake3': 16,
+    'sha256_128': 16,
+    'sha256': 32,
+}
+HASH_ALGORITHMS = tuple(HASH_DIGEST_SIZES)
+
+# xxhash가 없으면 표준 라이브러리 sha256 (SHA-NI 등 하드웨어 가속이 있는 CPU에서 blake2b와 같거나 빠름)을
+# 128비트로 줄여 사용
+DEFAULT_HASH_ALGORITHM = 'xxh3_128' if xxhash is not None else 'sha256_128'
+
+
+def get_hasher(algorithm: str = DEFAULT_HASH_ALGORITHM) -> Callable[[bytes], bytes]:
+    """
+    바이트를 바이너리 다이제스트로 만드는 해시 함수를 반환합니다
+    
+    - xxh3_128: 비암호학적 128비트 해시, 가장 빠름 (xxhash 패키지 필요, 설치되어 있으면 기본값)
+    - blake2b: 128비트로 줄인 blake2b (표준 라이브러리)
+    - blake3: 128비트로 줄인 blake3 (blake3 패키지 필요)
+    - sha256_128: 128비트로 줄인 SHA-256 (표준 라이브러리, xxhash가 없을 때 기본값)
+    - sha256: 256비트 SHA-256 (이전 버전과 같은 강도)
+    
+    128비트 다이제스트는 레코드 10억 개에서도 충돌 확률이 약 10^-21 수준입니다.
+    
+    Args:
+        algorithm: 해시 알고리즘 이름
+    
+    Returns:
+        바이트 → 다이제스트(bytes) 함수
+    """
+    if algorithm == 'xxh3_128':
+        if xxhash is None:
+            raise ImportError("xxh3_128 해시를 사용하려면 xxhash를 설치하세요")
+        return xxhash.xxh3_128_digest
+    if algorithm == 'blake2b':
+        blake2b = hashlib.blake2b
+        return lambda data: blake2b(data, digest_size=16).digest()
+    if algorithm == 'blake3':
+        if blake3 is None:
+            raise ImportError("blake3 해시를 사용하려면 blake3를 설치하세요")
+        blake3_hasher = blake3.blake3
+        return lambda data: blake3_hasher(data).digest(length=16)
+    if algorithm == 'sha256_128':
+        sha256 = hashlib.sha256
+        return lambda data: sha256(data).digest()[:16]
+    if algorithm == 'sha256':
+        sha256 = hashlib.sha256
+        return lambda data: sha256(data).digest()
+    
+    raise ValueError(f"지원하지 않는 해시 알고리즘: {algorithm}")
+
+
+def describe_hash_algorithm(algorithm: str) -> str:
+    """리포트에 기록할 해시 알고리즘 설명을 반환합니다 (예: "blake2b (128-bit)")"""
+    return f"{algorithm} ({HASH_DIGEST_SIZES[algorithm] * 8}-bit)"
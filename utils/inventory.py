@@ -0,0 +1,269 @@
+"""
+S3 Inventory 모듈
+
+S3 Inventory 매니페스트(manifest.json)를 읽어 목록 조회 대신 객체 정보 목록을 만드는 클래스
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote_plus
+
+from .object_info import ObjectInfo
+
+# Parquet 인벤토리 컬럼명 (CSV fileSchema 필드명 → Parquet 컬럼명)
+PARQUET_COLUMNS = {
+    'Bucket': 'bucket',
+    'Key': 'key',
+    'Size': 'size',
+    'LastModifiedDate': 'last_modified_date',
+    'ETag': 'e_tag',
+    'StorageClass': 'storage_class',
+    'IsLatest': 'is_latest',
+    'IsDeleteMarker': 'is_delete_marker',
+    'ChecksumAlgorithm': 'checksum_algorithm'
+}
+
+# 인벤토리 데이터 파일을 동시에 읽을 수
+DEFAULT_INVENTORY_WORKERS = 4
+
+
+class InventoryReader:
+    """S3 Inventory 매니페스트를 객체 정보 목록으로 변환하는 클래스"""
+    
+    def __init__(self, s3_handler: Optional[Any] = None,
+                 max_workers: int = DEFAULT_INVENTORY_WORKERS):
+        """
+        InventoryReader 초기화
+        
+        Args:
+            s3_handler: s3:// 매니페스트를 읽을 때 사용할 S3Handler
+            max_workers: 데이터 파일을 동시에 읽을 수
+        """
+        self.s3_handler = s3_handler
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+    
+    def list_objects(self, manifest_location: str, prefix: str = "",
+                     suffix: str = "") -> List[ObjectInfo]:
+        """
+        매니페스트가 가리키는 인벤토리 파일에서 객체 정보 목록을 만듭니다
+        
+        Args:
+            manifest_location: manifest.json 경로 (로컬 경로 또는 s3://bucket/key)
+            prefix: 접두사 필터
+            suffix: 접미사 필터
+        
+        Returns:
+            키 순으로 정렬된 객체 정보 목록
+        """
+        manifest = json.loads(self._read_bytes(manifest_location))
+        
+        file_format = manifest.get('fileFormat', 'CSV').upper()
+        if file_format not in ('CSV', 'PARQUET'):
+            raise ValueError(f"지원하지 않는 인벤토리 형식: {file_format}")
+        
+        schema = [name.strip() for name in manifest.get('fileSchema', '').split(',')]
+        data_files = [
+            self._resolve_data_file(manifest_location, manifest, entry['key'])
+            for entry in manifest.get('files', [])
+        ]
+        
+        self.logger.info(
+            f"인벤토리 매니페스트 로드: {manifest_location} "
+            f"({file_format}, 데이터 파일 {len(data_files)}개)"
+        )
+        
+        def read_data_file(location: str) -> List[ObjectInfo]:
+            data = self._read_bytes(location)
+            if file_format == 'CSV':
+                return self._parse_csv(data, schema, prefix, suffix)
+            return self._parse_parquet(data, prefix, suffix)
+        
+        objects = []
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="inventory") as executor:
+            for file_objects in executor.map(read_data_file, data_files):
+                objects.extend(file_objects)
+        
+        # 목록 조회와 같은 키 순서로 정렬
+        objects.sort(key=lambda obj: obj.key)
+        
+        self.logger.info(f"인벤토리에서 {len(objects)}개 파일 발견 (접두사: '{prefix}')")
+        return objects
+    
+    def _resolve_data_file(self, manifest_location: str, manifest: Dict[str, Any],
+                           data_key: str) -> str:
+        """
+        매니페스트의 데이터 파일 키를 읽을 수 있는 위치로 변환합니다
+        
+        Args:
+            manifest_location: manifest.json 위치
+            manifest: 매니페스트 내용
+            data_key: 데이터 파일 키
+        
+        Returns:
+            데이터 파일 위치 (로컬 경로 또는 s3://bucket/key)
+        """
+        if manifest_location.startswith('s3://'):
+            # destinationBucket은 arn:aws:s3:::bucket-name 형식
+            destination = manifest.get('destinationBucket', '')
+            bucket = destination.split(':::')[-1] if destination else \
+                _parse_s3_location(manifest_location)[0]
+            return f"s3://{bucket}/{data_key}"
+        
+        # 로컬 사본: 매니페스트 기준 상대 경로, data/ 디렉터리, 같은 디렉터리 순으로 탐색
+        base_dir = Path(manifest_location).parent
+        file_name = Path(data_key).name
+        for candidate in (base_dir / data_key, base_dir / 'data' / file_name,
+                          base_dir / file_name):
+            if candidate.exists():
+                return str(candidate)
+        
+        raise FileNotFoundError(f"인벤토리 데이터 파일을 찾을 수 없습니다: {data_key}")
+    
+    def _read_bytes(self, location: str) -> bytes:
+        """
+        로컬 경로 또는 s3:// 위치의 파일 내용을 읽습니다
+        
+        Args:
+            location: 파일 위치
+        
+        Returns:
+            파일 내용
+        """
+        if location.startswith('s3://'):
+            if self.s3_handler is None:
+                raise ValueError("s3:// 인벤토리를 읽으려면 s3_handler가 필요합니다")
+            bucket, key = _parse_s3_location(location)
+            return self.s3_handler.get_file_bytes(bucket, key)
+        
+        with open(location, 'rb') as f:
+            return f.read()
+    
+    def _parse_csv(self, data: bytes, schema: List[str], prefix: str,
+                   suffix: str) -> List[ObjectInfo]:
+        """
+        CSV(gzip) 인벤토리 파일을 객체 정보로 변환합니다 (키는 URL 인코딩되어 있음)
+        
+        Args:
+            data: 인벤토리 파일 내용
+            schema: fileSchema 필드명 목록
+            prefix: 접두사 필터
+            suffix: 접미사 필터
+        
+        Returns:
+            객체 정보 목록
+        """
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+        
+        columns = {name: index for index, name in enumerate(schema)}
+        key_index = columns['Key']
+        objects = []
+        
+        for row in csv.reader(io.StringIO(data.decode('utf-8'))):
+            key = unquote_plus(row[key_index])
+            if not _matches(key, prefix, suffix):
+                continue
+            
+            values = {name: row[index] for name, index in columns.items() if index < len(row)}
+            if values.get('IsDeleteMarker', 'false').lower() == 'true':
+                continue
+            if values.get('IsLatest', 'true').lower() == 'false':
+                continue
+            
+            objects.append(ObjectInfo(
+                key=key,
+                size=int(values.get('Size') or 0),
+                etag=values.get('ETag', '').strip('"'),
+                last_modified=_parse_timestamp(values.get('LastModifiedDate')),
+                storage_class=values.get('StorageClass', ''),
+                checksum_algorithm=values.get('ChecksumAlgorithm', '')
+            ))
+        
+        return objects
+    
+    def _parse_parquet(self, data: bytes, prefix: str, suffix: str) -> List[ObjectInfo]:
+        """
+        Parquet 인벤토리 파일을 객체 정보로 변환합니다 (pyarrow 필요)
+        
+        Args:
+            data: 인벤토리 파일 내용
+            prefix: 접두사 필터
+            suffix: 접미사 필터
+        
+        Returns:
+            객체 정보 목록
+        """
+        import pandas as pd
+        
+        try:
+            df = pd.read_parquet(io.BytesIO(data))
+        except ImportError as e:
+            raise ImportError("Parquet 인벤토리를 읽으려면 pyarrow를 설치하세요") from e
+        
+        keys = df[PARQUET_COLUMNS['Key']]
+        mask = keys.str.startswith(prefix) & ~keys.str.endswith('/')
+        if suffix:
+            mask &= keys.str.endswith(suffix)
+        if PARQUET_COLUMNS['IsDeleteMarker'] in df:
+            mask &= ~df[PARQUET_COLUMNS['IsDeleteMarker']].fillna(False).astype(bool)
+        if PARQUET_COLUMNS['IsLatest'] in df:
+            mask &= df[PARQUET_COLUMNS['IsLatest']].fillna(True).astype(bool)
+        df = df[mask]
+        
+        def column(name: str, default: Any) -> List[Any]:
+            parquet_name = PARQUET_COLUMNS[name]
+            if parquet_name not in df:
+                return [default] * len(df)
+            return df[parquet_name].tolist()
+        
+        return [
+            ObjectInfo(
+                key=key,
+                size=int(size or 0),
+                etag=(etag or '').strip('"'),
+                last_modified=_to_datetime(last_modified),
+                storage_class=storage_class or '',
+                checksum_algorithm=checksum_algorithm or ''
+            )
+            for key, size, etag, last_modified, storage_class, checksum_algorithm in zip(
+                column('Key', ''), column('Size', 0), column('ETag', ''),
+                column('LastModifiedDate', None), column('StorageClass', ''),
+                column('ChecksumAlgorithm', '')
+            )
+        ]
+
+
+def _parse_s3_location(location: str) -> Tuple[str, str]:
+    """s3://bucket/key 위치를 (버킷, 키)로 나눕니다"""
+    bucket, _, key = location[5:].partition('/')
+    return bucket, key
+
+
+def _matches(key: str, prefix: str, suffix: str) -> bool:
+    """키가 접두사/접미사 필터를 통과하는지 (디렉터리 제외) 확인합니다"""
+    if not key.startswith(prefix) or key.endswith('/'):
+        return False
+    return not suffix or key.endswith(suffix)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """인벤토리 CSV의 ISO 8601 시각(예: 2023-02-01T12:34:56.000Z)을 변환합니다"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Parquet 시각 값(pandas Timestamp)을 datetime으로 변환합니다"""
+    if value is None or value != value:  # NaT/NaN
+        return None
+    return value.to_pydatetime() if hasattr(value, 'to_pydatetime') else value
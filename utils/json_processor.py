@@ -4,45 +4,241 @@ JSON 처리기 모듈
 대용량 JSON 파일을 메모리 효율적으로 처리하는 클래스
 """
 
+import csv
+import io
 import json
 import logging
-from typing import Any, Dict, Generator, List, TextIO, Union
+import re
+from decimal import Decimal
+from itertools import accumulate, islice
+from operator import itemgetter
+from typing import IO, Any, Callable, Dict, Generator, Iterator, List, Optional, TextIO, Tuple, Union
 
 import ijson
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson은 -2^63 ~ 2^64-1 범위를 넘는 정수를 경고 없이 float로 바꾸므로, 20자리 이상
+# 숫자나 19자리 음수가 있는 줄은 표준 라이브러리로 파싱 (19자리 양수는 2^64-1보다 작아
+# orjson이 정확히 파싱). bytes는 숫자를 '0'으로 바꾼 뒤 부분 문자열 검색이 정규식보다
+# 훨씬 빠르고, 배치는 줄을 이어 붙여 한 번에 검사
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_LONG_ZEROS = b'0' * 20
+_NEGATIVE_LONG_ZEROS = b'-' + b'0' * 19
+_LONG_DIGITS_STR = re.compile(r'\d{20}|-\d{19}')
+
+# 배열 모드 파서: C 확장(yajl2_c)이 있으면 사용하고, 없으면 ijson이 고른 백엔드 사용
+try:
+    IJSON_BACKEND = ijson.get_backend('yajl2_c')
+except ImportError:
+    IJSON_BACKEND = ijson
+
+
+def _has_lossy_integers(data: bytes) -> bool:
+    """orjson이 float로 바꿀 수 있는 정수(20자리 이상, 19자리 음수)가 있는지 확인합니다"""
+    digits = data.translate(_DIGITS_TO_ZERO)
+    return _LONG_ZEROS in digits or _NEGATIVE_LONG_ZEROS in digits
+
+
+def _decimals_to_float(value: Union[Dict, List]) -> Union[Dict, List]:
+    """
+    ijson이 만든 dict/list 안의 Decimal을 제자리에서 float로 바꿉니다
+    
+    JSONL 모드(json.loads)와 같은 값/해시가 나오도록 하며, 새 객체를 만들지 않고
+    Decimal이 있는 자리만 바꿉니다.
+    
+    Args:
+        value: 배열 요소 (dict 또는 list)
+    
+    Returns:
+        같은 객체
+    """
+    entries = value.items() if type(value) is dict else enumerate(value)
+    for key, item in entries:
+        item_type = type(item)
+        if item_type is Decimal:
+            value[key] = float(item)
+        elif item_type is dict or item_type is list:
+            _decimals_to_float(item)
+    return value
+
+
+# 형식 자동 감지에 사용할 객체 앞부분 크기
+DETECT_HEAD_SIZE = 4096
+
+# CSV 열 타입 지정에 사용할 수 있는 타입명
+CSV_COLUMN_TYPES = ("str", "int", "float", "bool", "json")
+_CSV_TRUE_VALUES = frozenset(('true', 't', 'yes', 'y', '1'))
+_CSV_FALSE_VALUES = frozenset(('false', 'f', 'no', 'n', '0'))
+
+
+def _csv_bool(value: str) -> Union[bool, str]:
+    """
+    CSV bool 셀을 변환합니다
+    
+    알 수 없는 값("maybe" 등)은 False로 바꾸지 않고 원래 문자열을 그대로 두어,
+    "false"와 같은 값으로 비교되지 않도록 합니다.
+    """
+    token = value.strip().lower()
+    if token in _CSV_TRUE_VALUES:
+        return True
+    if token in _CSV_FALSE_VALUES:
+        return False
+    return value
+
+
+# 큰 CSV 셀(JSON 문자열 등)도 읽을 수 있도록 필드 크기 제한을 늘림
+csv.field_size_limit(2 ** 31 - 1)
+
+# 자동 감지 모드를 포함한 처리 모드 목록
+PROCESS_MODES = ("jsonl", "array", "single", "csv", "auto")
+
+# 파싱한 레코드 배치의 최대 크기. 살아 있는 dict가 수천 개 쌓이면 순환 참조 GC가
+# 할당마다 이를 다시 검사해 배치 파싱이 레코드별 파싱보다 느려지므로, chunk_size가
+# 커도 파싱 배치는 이 크기로 제한합니다 (원본 줄 배치는 GC 대상이 아니므로 제한 없음)
+MAX_PARSED_BATCH_SIZE = 256
+
+
+def peek_head(stream: IO, size: int = DETECT_HEAD_SIZE) -> bytes:
+    """
+    스트림 위치를 옮기지 않고 앞부분 바이트를 읽습니다
+    
+    BufferedReader/GzipFile은 어차피 읽을 첫 버퍼를 미리 채워 돌려주고,
+    BytesIO처럼 peek이 없는 스트림은 읽은 뒤 원래 위치로 되돌립니다.
+    
+    Args:
+        stream: 바이너리 스트림
+        size: 읽을 최대 크기 (바이트)
+    
+    Returns:
+        앞부분 바이트 (size보다 짧을 수 있음)
+    """
+    if hasattr(stream, 'peek'):
+        return stream.peek(size)[:size]
+    
+    position = stream.tell()
+    head = stream.read(size)
+    stream.seek(position)
+    return head
+
 
 class JSONProcessor:
     """JSON 데이터를 처리하는 클래스"""
     
-    def __init__(self, chunk_size: int = 10000):
+    def __init__(self, chunk_size: int = 10000, use_orjson: bool = True,
+                 csv_column_types: Optional[Dict[str, str]] = None):
         """
         JSONProcessor 초기화
         
         Args:
             chunk_size: 청크 크기 (레코드 수)
+            use_orjson: orjson이 설치되어 있으면 JSONL 줄 파싱에 사용할지 여부
+            csv_column_types: CSV 열별 타입 ({열 이름: "str"/"int"/"float"/"bool"/"json"}).
+                지정하지 않은 열은 문자열 그대로 두고, 타입을 지정한 열의 빈 셀은 None이 됩니다.
         """
         self.chunk_size = chunk_size
+        self._parsed_batch_size = min(chunk_size, MAX_PARSED_BATCH_SIZE)
         self.logger = logging.getLogger(__name__)
+        self._fast_loads = orjson.loads if use_orjson and orjson is not None else None
+        
+        self.csv_column_types = dict(csv_column_types or {})
+        for column, type_name in self.csv_column_types.items():
+            if type_name not in CSV_COLUMN_TYPES:
+                raise ValueError(f"지원하지 않는 CSV 열 타입: {column}={type_name}")
+        
+        # 헤더 행별 레코드 생성 계획 캐시 (같은 헤더의 객체는 계획을 다시 만들지 않음)
+        self._csv_plans: Dict[Tuple[str, ...], Tuple] = {}
+    
+    def parse_line(self, line: Union[bytes, str]) -> Any:
+        """
+        JSON 한 줄을 파싱합니다 (orjson 우선, 실패하면 표준 라이브러리로 재시도)
+        
+        orjson은 NaN/Infinity를 거부하고 -2^63 ~ 2^64-1 범위를 넘는 정수를 float로
+        바꾸므로, 그런 줄은 json.loads로 파싱하여 결과를 표준 라이브러리와 같게 유지합니다.
+        
+        Args:
+            line: JSON 한 줄 (bytes 또는 str)
+            
+        Returns:
+            파싱된 값
+        """
+        if self._fast_loads is not None:
+            if isinstance(line, bytes):
+                has_long_digits = _has_lossy_integers(line)
+            else:
+                has_long_digits = _LONG_DIGITS_STR.search(line) is not None
+            
+            if not has_long_digits:
+                try:
+                    return self._fast_loads(line)
+                except ValueError:
+                    pass
+        return json.loads(line)
+    
+    @staticmethod
+    def detect_mode(head: bytes) -> str:
+        """
+        객체 앞부분(압축 해제된 바이트)으로 처리 모드를 추정합니다
+        
+        - '['로 시작하면 JSON 배열
+        - '{'로 시작하고 첫 줄이 완전한 JSON이면 JSONL (한 줄짜리 객체 포함)
+        - '{'로 시작하지만 첫 줄이 불완전하면 여러 줄에 걸친 단일 JSON 객체
+        - 그 밖에는 헤더 행으로 시작하는 CSV
+        
+        Args:
+            head: 객체의 앞부분 바이트
+            
+        Returns:
+            처리 모드 ("jsonl", "array", "single", "csv")
+        """
+        if head.startswith(b'\xef\xbb\xbf'):
+            head = head[3:]
+        text = head.lstrip()
+        
+        if not text or text.startswith(b'{'):
+            first_line, newline, _ = text.partition(b'\n')
+            if not newline:
+                # 첫 줄이 확인한 범위보다 길면 한 줄짜리 JSON으로 간주
+                return "jsonl"
+            try:
+                json.loads(first_line)
+                return "jsonl"
+            except ValueError:
+                return "single"
+        
+        if text.startswith(b'['):
+            return "array"
+        
+        return "csv"
     
-    def process_stream(self, stream: TextIO, 
+    def process_stream(self, stream: IO, 
                       mode: str = "jsonl") -> Generator[Dict[str, Any], None, None]:
         """
         스트림에서 JSON 레코드를 읽어 처리합니다
         
         Args:
-            stream: 입력 스트림
-            mode: 처리 모드 ("jsonl", "array", "single")
+            stream: 입력 스트림 (압축 해제된 바이너리 스트림 권장, 텍스트 스트림도 가능)
+            mode: 처리 모드 ("jsonl", "array", "single", "csv", "auto": 앞부분으로 자동 감지)
             
         Yields:
             JSON 레코드
         """
         try:
+            if mode == "auto":
+                mode = self.detect_mode(peek_head(stream))
+                self.logger.debug(f"자동 감지된 처리 모드: {mode}")
+            
             if mode == "jsonl":
                 yield from self._process_jsonl_stream(stream)
             elif mode == "array":
                 yield from self._process_array_stream(stream)
             elif mode == "single":
                 yield from self._process_single_stream(stream)
+            elif mode == "csv":
+                yield from self._process_csv_stream(stream)
             else:
                 raise ValueError(f"지원하지 않는 모드: {mode}")
                 
@@ -50,25 +246,283 @@ class JSONProcessor:
             self.logger.error(f"JSON 스트림 처리 중 오류: {e}")
             raise
     
-    def _process_jsonl_stream(self, stream: TextIO) -> Generator[Dict[str, Any], None, None]:
+    def process_bytes(self, data: bytes,
+                      mode: str = "jsonl") -> Generator[Dict[str, Any], None, None]:
+        """
+        메모리에 올라온 객체 전체(압축 해제된 바이트)에서 JSON 레코드를 읽습니다
+        
+        작은 객체는 스트림 래퍼(BytesIO/TextIOWrapper)를 거치지 않고 바이트 줄을
+        바로 파싱하는 편이 빠릅니다.
+        
+        Args:
+            data: 객체 내용
+            mode: 처리 모드 ("jsonl", "array", "single", "csv", "auto": 앞부분으로 자동 감지)
+        
+        Yields:
+            JSON 레코드
+        """
+        if mode == "auto":
+            mode = self.detect_mode(data[:DETECT_HEAD_SIZE])
+        
+        if mode != "jsonl":
+            yield from self.process_stream(io.BytesIO(data), mode)
+            return
+        
+        # orjson은 bytes를 바로 파싱하고, 표준 라이브러리는 한 번에 디코딩한 뒤 파싱
+        lines = data.splitlines() if self._fast_loads is not None else \
+            data.decode('utf-8').split('\n')
+        
+        for line_number, line in enumerate(lines, 1):
+            if line.isspace() or not line:
+                continue
+            
+            try:
+                yield self.parse_line(line)
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"JSON 파싱 오류 (line {line_number}): {e}")
+                continue
+    
+    def process_stream_batches(self, stream: IO, mode: str = "jsonl",
+                               raw: bool = False) -> Generator[List[Any], None, None]:
+        """
+        스트림에서 레코드를 배치 단위 리스트로 읽습니다
+        
+        JSONL은 배치 크기만큼 줄을 읽어 리스트 컴프리헨션으로 한 번에 파싱하므로 레코드마다
+        제너레이터를 오가는 비용이 없고, 호출 측도 정규화/해시를 배치로 처리할 수 있습니다.
+        다른 모드는 레코드를 같은 크기로 묶어 반환합니다. 배치 크기는 원본 줄이면
+        chunk_size, 파싱한 레코드면 chunk_size와 MAX_PARSED_BATCH_SIZE 중 작은 값입니다.
+        
+        Args:
+            stream: 입력 스트림 (압축 해제된 바이너리 스트림 권장)
+            mode: 처리 모드 ("jsonl", "array", "single", "csv", "auto": 앞부분으로 자동 감지)
+            raw: True이면 JSONL 줄을 파싱하지 않고 앞뒤 공백을 제거한 원본 줄(bytes)을
+                줄 시작 위치와 함께 반환 (jsonl 모드에서만 지원)
+            
+        Yields:
+            레코드 리스트 (raw=True이면 (줄 시작 위치 목록, 줄 목록), 빈 줄을 제외하므로
+            배치 크기보다 짧을 수 있음)
+        """
+        if mode == "auto":
+            mode = self.detect_mode(peek_head(stream))
+        
+        if mode != "jsonl":
+            if raw:
+                raise ValueError(f"원본 줄 배치는 jsonl 모드에서만 지원합니다: {mode}")
+            records = self.process_stream(stream, mode)
+            while True:
+                batch = list(islice(records, self._parsed_batch_size))
+                if not batch:
+                    return
+                yield batch
+        
+        if raw:
+            yield from self._iter_raw_line_batches(iter(stream))
+            return
+        
+        if self._fast_loads is None and not isinstance(stream, io.TextIOBase):
+            # 표준 라이브러리는 줄마다 bytes를 디코딩하는 것보다 str 파싱이 빠름
+            stream = io.TextIOWrapper(stream, encoding='utf-8')
+        
+        yield from self._iter_jsonl_batches(iter(stream))
+    
+    def process_bytes_batches(self, data: bytes, mode: str = "jsonl",
+                              raw: bool = False) -> Generator[List[Any], None, None]:
+        """
+        메모리에 올라온 객체 전체(압축 해제된 바이트)에서 레코드를 배치 단위 리스트로 읽습니다
+        
+        Args:
+            data: 객체 내용
+            mode: 처리 모드 ("jsonl", "array", "single", "csv", "auto": 앞부분으로 자동 감지)
+            raw: True이면 JSONL 줄을 파싱하지 않고 원본 줄(bytes)을 줄 시작 위치와 함께 반환
+        
+        Yields:
+            레코드 리스트 (raw=True이면 (줄 시작 위치 목록, 줄 목록))
+        """
+        if mode == "auto":
+            mode = self.detect_mode(data[:DETECT_HEAD_SIZE])
+        
+        if mode != "jsonl":
+            yield from self.process_stream_batches(io.BytesIO(data), mode, raw)
+            return
+        
+        if raw:
+            # 줄 시작 위치를 계산하도록 줄 끝 문자를 유지한 채 분리
+            yield from self._iter_raw_line_batches(iter(io.BytesIO(data)))
+            return
+        
+        # orjson은 bytes 그대로, 표준 라이브러리는 한 번에 디코딩한 뒤 파싱
+        lines = data.splitlines() if self._fast_loads is not None else \
+            data.decode('utf-8').split('\n')
+        yield from self._iter_jsonl_batches(iter(lines))
+    
+    def _iter_raw_line_batches(self, lines: Iterator[bytes]
+                               ) -> Generator[Tuple[List[int], List[bytes]], None, None]:
+        """
+        JSONL 줄을 chunk_size줄씩 묶어 (줄 시작 위치, 앞뒤 공백을 제거한 줄) 목록으로 반환합니다
+        
+        시작 위치는 압축 해제된 내용 기준 바이트 오프셋으로, 호출 측이 특정 줄만 다시 읽을 때
+        파싱/해시 없이 그 위치로 건너뛸 수 있습니다. 빈 줄은 제외하고, 파싱 경로와 같은 줄이
+        집계되도록 JSON으로 파싱할 수 없는 줄도 경고 후 제외합니다 (파싱 결과는 버리므로
+        정규화/해시 비용은 들지 않음).
+        
+        Args:
+            lines: 줄 끝 문자를 포함한 줄 이터레이터
+        
+        Yields:
+            (줄 시작 위치 목록, 줄 목록)
+        """
+        position = 0
+        line_number = 1
+        
+        while True:
+            chunk = list(islice(lines, self.chunk_size))
+            if not chunk:
+                return
+            
+            offsets = list(accumulate(map(len, chunk), initial=position))
+            position = offsets.pop()
+            stripped = list(map(bytes.strip, chunk))
+            kept = self._valid_line_indices(stripped, line_number)
+            line_number += len(chunk)
+            if kept is not None:
+                offsets = [offsets[index] for index in kept]
+                stripped = [stripped[index] for index in kept]
+            
+            if stripped:
+                yield offsets, stripped
+    
+    def _valid_line_indices(self, lines: List[bytes],
+                            first_line_number: int) -> Optional[List[int]]:
+        """
+        JSONL 원본 줄 묶음에서 비어 있지 않고 JSON으로 파싱할 수 있는 줄의 위치를 찾습니다
+        
+        _parse_batch와 같은 parse_line으로 확인하므로 원본 줄 단계와 파싱 경로에서
+        제외되는 줄이 같습니다. 모든 줄이 유효하면 목록을 만들지 않습니다.
+        
+        Args:
+            lines: 앞뒤 공백을 제거한 줄 목록
+            first_line_number: 첫 줄의 줄 번호 (경고 메시지용)
+        
+        Returns:
+            유지할 줄 위치 목록 (모든 줄을 유지하면 None)
+        """
+        if all(lines):
+            try:
+                self._parse_lines(lines)
+                return None
+            except json.JSONDecodeError:
+                pass
+        
+        parse = self.parse_line
+        kept = []
+        for index, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                parse(line)
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"JSON 파싱 오류 (line {first_line_number + index}): {e}")
+                continue
+            kept.append(index)
+        return kept
+    
+    def _iter_jsonl_batches(self, lines: Iterator[Union[bytes, str]]
+                            ) -> Generator[List[Any], None, None]:
+        """JSONL 줄을 배치 크기만큼 묶어 파싱한 리스트를 반환합니다"""
+        line_number = 1
+        
+        while True:
+            chunk = list(islice(lines, self._parsed_batch_size))
+            if not chunk:
+                return
+            
+            batch = self._parse_batch(chunk, line_number)
+            line_number += len(chunk)
+            
+            if batch:
+                self.logger.debug(f"JSONL 레코드 {len(batch)}개 배치 처리됨 (line {line_number - 1}까지)")
+                yield batch
+    
+    def _parse_lines(self, lines: List[Union[bytes, str]]) -> List[Any]:
+        """
+        JSONL 줄 묶음을 한 번에 파싱합니다 (빈 줄 제외)
+        
+        bytes 줄은 이어 붙여 orjson이 float로 바꿀 정수가 있는지 한 번만 검사하고, 없으면
+        줄마다 검사하지 않고 orjson으로 바로 파싱합니다.
+        
+        Args:
+            lines: 줄 목록
+        
+        Returns:
+            파싱된 레코드 목록
+        
+        Raises:
+            json.JSONDecodeError: 파싱할 수 없는 줄이나 orjson이 거부한 줄(NaN 등)이 있는 경우
+                (호출 측이 줄마다 parse_line으로 다시 파싱)
+        """
+        loads = self._fast_loads
+        if loads is None or not isinstance(lines[0], bytes) or \
+                _has_lossy_integers(b'\n'.join(lines)):
+            loads = self.parse_line
+        return [loads(line) for line in lines if line and not line.isspace()]
+    
+    def _parse_batch(self, lines: List[Union[bytes, str]],
+                     first_line_number: int) -> List[Any]:
+        """
+        JSONL 줄 묶음을 파싱합니다 (빈 줄 제외)
+        
+        오류가 없으면 한 번의 리스트 컴프리헨션으로 끝나고, 파싱할 수 없는 줄이 있으면
+        줄마다 다시 파싱하여 그 줄만 경고 후 건너뜁니다.
+        
+        Args:
+            lines: 줄 목록
+            first_line_number: 첫 줄의 줄 번호 (경고 메시지용)
+        
+        Returns:
+            파싱된 레코드 목록
+        """
+        try:
+            return self._parse_lines(lines)
+        except json.JSONDecodeError:
+            pass
+        
+        parse = self.parse_line
+        records = []
+        for line_number, line in enumerate(lines, first_line_number):
+            if line.isspace() or not line:
+                continue
+            
+            try:
+                records.append(parse(line))
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"JSON 파싱 오류 (line {line_number}): {e}")
+        return records
+    
+    def _process_jsonl_stream(self, stream: IO) -> Generator[Dict[str, Any], None, None]:
         """
         JSONL (JSON Lines) 형식의 스트림을 처리합니다
         
+        바이너리 스트림이면 텍스트 디코딩 없이 바이트 줄을 그대로 파싱합니다.
+        앞뒤 공백/개행은 파서가 무시하므로 줄마다 strip()으로 복사하지 않습니다.
+        
         Args:
-            stream: 입력 스트림
+            stream: 입력 스트림 (바이너리 또는 텍스트)
             
         Yields:
             JSON 레코드
         """
         line_count = 0
         
+        if self._fast_loads is None and not isinstance(stream, io.TextIOBase):
+            # 표준 라이브러리는 줄마다 bytes를 디코딩하는 것보다 str 파싱이 빠름
+            stream = io.TextIOWrapper(stream, encoding='utf-8')
+        
         for line in stream:
-            line = line.strip()
-            if not line:
+            if line.isspace() or not line:
                 continue
                 
             try:
-                record = json.loads(line)
+                record = self.parse_line(line)
                 yield record
                 line_count += 1
                 
@@ -80,56 +534,101 @@ class JSONProcessor:
                 self.logger.warning(f"JSON 파싱 오류 (line {line_count + 1}): {e}")
                 continue
     
-    def _process_array_stream(self, stream: TextIO) -> Generator[Dict[str, Any], None, None]:
+    def _process_array_stream(self, stream: IO) -> Generator[Dict[str, Any], None, None]:
         """
         JSON 배열 형식의 스트림을 처리합니다
         
+        ijson.items로 배열 요소를 하나씩 완성된 객체로 만들므로 중첩된 객체/배열이
+        그대로 유지되며, yajl2_c 백엔드가 있으면 C 속도로 파싱합니다. 소수는
+        JSONL 모드(json.loads)와 같은 해시가 나오도록 Decimal 대신 float로 바꿉니다.
+        
         Args:
-            stream: 입력 스트림
+            stream: 입력 스트림 (바이너리 권장)
             
         Yields:
             JSON 레코드
         """
         try:
-            # ijson을 사용하여 메모리 효율적으로 배열 처리
-            parser = ijson.parse(stream)
-            
             record_count = 0
-            current_record = {}
-            in_array = False
-            current_key = None
+            skipped_count = 0
             
-            for prefix, event, value in parser:
-                if prefix == '' and event == 'start_array':
-                    in_array = True
+            for item in self._iter_array_items(stream):
+                if not isinstance(item, dict):
+                    skipped_count += 1
                     continue
-                elif prefix == '' and event == 'end_array':
-                    in_array = False
-                    break
                 
-                if in_array:
-                    if event == 'start_map':
-                        current_record = {}
-                    elif event == 'end_map':
-                        if current_record:
-                            yield current_record
-                            record_count += 1
-                            
-                            # 메모리 효율을 위해 주기적으로 로그 출력
-                            if record_count % self.chunk_size == 0:
-                                self.logger.debug(f"배열 레코드 {record_count}개 처리됨")
-                                
-                    elif event == 'map_key':
-                        current_key = value
-                    elif event in ['string', 'number', 'boolean', 'null']:
-                        if current_key:
-                            current_record[current_key] = value
-                            current_key = None
+                yield item
+                record_count += 1
+                
+                # 메모리 효율을 위해 주기적으로 로그 출력
+                if record_count % self.chunk_size == 0:
+                    self.logger.debug(f"배열 레코드 {record_count}개 처리됨")
+            
+            if skipped_count:
+                self.logger.warning(f"객체가 아닌 배열 요소 {skipped_count}개를 건너뜀")
                             
         except Exception as e:
             self.logger.error(f"JSON 배열 처리 중 오류: {e}")
             raise
     
+    def _iter_array_items(self, stream: IO) -> Generator[Any, None, None]:
+        """
+        최상위 배열의 요소를 차례로 반환합니다
+        
+        yajl2_c는 use_float=True일 때 64비트를 넘는 정수에서 실패합니다. 되감을 수 있는
+        스트림(프리페치한 바이트, 로컬 파일)은 빠른 float 모드로 읽다가 실패하면 처음부터
+        Decimal 모드로 다시 읽어 이미 반환한 요소 다음부터 이어서 반환하고, 되감을 수 없는
+        S3 스트림은 처음부터 Decimal 모드로 읽습니다.
+        
+        Args:
+            stream: 입력 스트림
+            
+        Yields:
+            배열 요소
+        """
+        seekable = getattr(stream, 'seekable', None)
+        if seekable is None or not seekable():
+            yield from self._iter_exact_array_items(stream)
+            return
+        
+        item_count = 0
+        try:
+            for item in IJSON_BACKEND.items(stream, 'item', use_float=True):
+                yield item
+                item_count += 1
+            return
+        except ijson.JSONError as e:
+            if 'integer overflow' not in str(e):
+                raise
+        
+        self.logger.debug("64비트를 넘는 정수가 있어 Decimal 모드로 다시 파싱")
+        stream.seek(0)
+        for index, item in enumerate(self._iter_exact_array_items(stream)):
+            if index >= item_count:
+                yield item
+    
+    @staticmethod
+    def _iter_exact_array_items(stream: IO) -> Generator[Any, None, None]:
+        """
+        최상위 배열의 요소를 기본(Decimal) 모드로 읽고 Decimal만 float로 바꿔 반환합니다
+        
+        정수는 크기와 관계없이 int로 유지되므로 64비트를 넘는 정수도 실패하지 않습니다.
+        
+        Args:
+            stream: 입력 스트림
+            
+        Yields:
+            배열 요소
+        """
+        for item in IJSON_BACKEND.items(stream, 'item'):
+            item_type = type(item)
+            if item_type is dict or item_type is list:
+                yield _decimals_to_float(item)
+            elif item_type is Decimal:
+                yield float(item)
+            else:
+                yield item
+    
     def _process_single_stream(self, stream: TextIO) -> Generator[Dict[str, Any], None, None]:
         """
         단일 JSON 객체 형식의 스트림을 처리합니다
@@ -143,7 +642,7 @@ class JSONProcessor:
         try:
             # 전체 JSON을 메모리에 로드
             content = stream.read()
-            data = json.loads(content)
+            data = self.parse_line(content)
             
             if isinstance(data, dict):
                 yield data
@@ -161,6 +660,101 @@ class JSONProcessor:
             self.logger.error(f"단일 JSON 처리 중 오류: {e}")
             raise
     
+    def _csv_converter(self, type_name: str) -> Optional[Callable[[str], Any]]:
+        """CSV 열 타입에 맞는 셀 변환 함수를 반환합니다 (문자열이면 None)"""
+        if type_name == "int":
+            convert = int
+        elif type_name == "float":
+            convert = float
+        elif type_name == "bool":
+            convert = _csv_bool
+        elif type_name == "json":
+            convert = self.parse_line
+        else:
+            return None
+        
+        return lambda value: convert(value) if value != '' else None
+    
+    def _csv_plan(self, header: List[str]) -> Tuple:
+        """
+        헤더 행에 대한 레코드 생성 계획을 반환합니다 (헤더별로 캐시)
+        
+        열을 키 이름 순서로 미리 정렬해 두어, 행마다 정렬된 dict를 바로 만들고
+        정규화 단계에서 다시 정렬할 일이 없도록 합니다.
+        
+        Args:
+            header: 헤더 행
+        
+        Returns:
+            (정렬된 키, 정렬된 순서로 셀을 꺼내는 함수, 정렬된 순서의 변환 함수 목록 또는 None)
+        """
+        header_key = tuple(header)
+        plan = self._csv_plans.get(header_key)
+        if plan is not None:
+            return plan
+        
+        order = sorted(range(len(header)), key=header.__getitem__)
+        keys = tuple(header[i] for i in order)
+        getter = itemgetter(*order) if len(order) > 1 else (lambda row: (row[order[0]],))
+        converters = [self._csv_converter(self.csv_column_types.get(key, "str")) for key in keys]
+        
+        plan = (keys, getter, converters if any(converters) else None)
+        self._csv_plans[header_key] = plan
+        return plan
+    
+    def _process_csv_stream(self, stream: IO) -> Generator[Dict[str, Any], None, None]:
+        """
+        헤더 행이 있는 CSV 스트림을 처리합니다
+        
+        행 분리와 따옴표 처리는 C로 구현된 csv.reader가 맡고, 행마다 헤더 기준
+        계획(_csv_plan)으로 키가 정렬된 레코드를 만듭니다. 열 수가 헤더와 다르거나
+        타입 변환에 실패한 행은 경고 후 건너뜁니다.
+        
+        Args:
+            stream: 입력 스트림 (바이너리 또는 텍스트)
+            
+        Yields:
+            레코드 (열 이름 → 값)
+        """
+        if not isinstance(stream, io.TextIOBase):
+            # utf-8-sig: 엑셀 등에서 내보낸 CSV의 BOM 제거
+            stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        
+        reader = csv.reader(stream)
+        # 맨 앞의 빈 줄은 건너뛰고 첫 번째 비어 있지 않은 행을 헤더로 사용
+        header = next((row for row in reader if row), None)
+        if header is None:
+            return
+        
+        keys, getter, converters = self._csv_plan(header)
+        width = len(header)
+        record_count = 0
+        
+        for row in reader:
+            if len(row) != width:
+                if row:
+                    self.logger.warning(
+                        f"CSV 열 수 불일치 (line {reader.line_num}): "
+                        f"헤더 {width}개, 행 {len(row)}개"
+                    )
+                continue
+            
+            values = getter(row)
+            if converters is not None:
+                try:
+                    values = [convert(value) if convert else value
+                              for convert, value in zip(converters, values)]
+                except ValueError as e:
+                    self.logger.warning(f"CSV 타입 변환 오류 (line {reader.line_num}): {e}")
+                    continue
+            
+            yield dict(zip(keys, values))
+            record_count += 1
+            
+            # 메모리 효율을 위해 주기적으로 로그 출력
+            if record_count % self.chunk_size == 0:
+                self.logger.debug(f"CSV 레코드 {record_count}개 처리됨")
+    
     def process_file_chunks(self, file_path: str, 
                           mode: str = "jsonl") -> Generator[List[Dict[str, Any]], None, None]:
         """
@@ -174,20 +768,9 @@ class JSONProcessor:
             레코드 청크 (리스트)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                chunk = []
-                
-                for record in self.process_stream(file, mode):
-                    chunk.append(record)
-                    
-                    if len(chunk) >= self.chunk_size:
-                        yield chunk
-                        chunk = []
-                
-                # 남은 레코드 처리
-                if chunk:
-                    yield chunk
-                    
+            with open(file_path, 'rb') as file:
+                yield from self.process_stream_batches(file, mode)
+            
         except Exception as e:
             self.logger.error(f"파일 청크 처리 중 오류 ({file_path}): {e}")
             raise
@@ -0,0 +1,267 @@
+"""
+목록 캐시 모듈
+
+버킷/접두사별 객체 목록을 로컬 SQLite에 저장하고, TTL이 지나면 마지막 키 이후만
+증분 조회하며, 주기적으로 전체 목록으로 다시 맞추는(덮어쓰기/삭제 반영) 클래스
+"""
+
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from .object_info import ObjectInfo
+
+# 캐시 기본 설정
+DEFAULT_LISTING_CACHE_PATH = "listing_cache.db"
+DEFAULT_LISTING_CACHE_TTL = 3600
+DEFAULT_LISTING_CACHE_RECONCILE_INTERVAL = 24 * 3600
+
+
+class ListingCache:
+    """객체 목록을 로컬 SQLite에 캐시하는 클래스"""
+    
+    def __init__(self, db_path: str = DEFAULT_LISTING_CACHE_PATH,
+                 ttl_seconds: float = DEFAULT_LISTING_CACHE_TTL,
+                 reconcile_interval: float = DEFAULT_LISTING_CACHE_RECONCILE_INTERVAL):
+        """
+        ListingCache 초기화
+        
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+            ttl_seconds: 목록 조회 없이 캐시를 그대로 사용할 시간 (초)
+            reconcile_interval: 증분 갱신 대신 전체 목록으로 다시 맞추는 주기 (초,
+                0이면 TTL이 지날 때마다 전체 목록 조회)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.reconcile_interval = reconcile_interval
+        self.logger = logging.getLogger(__name__)
+        
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS listings (
+                bucket TEXT NOT NULL,
+                prefix TEXT NOT NULL,
+                refreshed_at REAL NOT NULL,
+                last_key TEXT,
+                max_last_modified TEXT,
+                reconciled_at REAL,
+                PRIMARY KEY (bucket, prefix)
+            ) WITHOUT ROWID;
+            
+            CREATE TABLE IF NOT EXISTS objects (
+                bucket TEXT NOT NULL,
+                prefix TEXT NOT NULL,
+                key TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                storage_class TEXT,
+                checksum_algorithm TEXT,
+                PRIMARY KEY (bucket, prefix, key)
+            ) WITHOUT ROWID;
+        ''')
+        
+        # 이전 버전 캐시 파일에는 전체 조회 시각 열이 없음 (NULL이면 다음 갱신 때 전체 조회)
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(listings)')}
+        if 'reconciled_at' not in columns:
+            with self.conn:
+                self.conn.execute('ALTER TABLE listings ADD COLUMN reconciled_at REAL')
+    
+    def get_objects(self, bucket: str, prefix: str,
+                    list_objects: Callable[[Optional[str]], List[ObjectInfo]],
+                    force_refresh: bool = False) -> List[ObjectInfo]:
+        """
+        캐시된 객체 목록을 반환하고, 필요하면 목록 조회로 갱신합니다
+        
+        - 캐시가 없거나 force_refresh이면 전체 목록을 다시 조회합니다
+        - TTL 이내이면 목록 조회 없이 캐시를 반환합니다
+        - TTL이 지났고 마지막 전체 조회 후 reconcile_interval이 지났으면 전체 목록을 다시
+          조회해 캐시를 교체합니다 (추가/덮어쓰기/삭제된 객체 반영)
+        - 그 밖에는 마지막 키 이후(StartAfter)만 조회하여 추가합니다
+        
+        증분 갱신은 새 객체가 기존 키보다 뒤에 추가되는 파티션(시간순 키)을 가정하므로
+        그 사이 덮어써지거나 삭제된 객체, 앞쪽 키에 추가된 객체는 다음 전체 조회 때
+        반영됩니다. 기존 객체 메타데이터의 신선도는 reconciled_at으로 확인하세요.
+        
+        목록 조회가 끝난 뒤에 한 트랜잭션으로 캐시를 바꾸므로, 조회가 실패하면 캐시는
+        이전 상태로 남습니다.
+        
+        Args:
+            bucket: 버킷명
+            prefix: 접두사
+            list_objects: start_after를 받아 그 이후의 객체 정보 목록을 반환하는 함수
+                (None이면 접두사 아래 전체 목록)
+            force_refresh: 캐시를 무시하고 전체 목록을 다시 조회할지 여부
+        
+        Returns:
+            키 순으로 정렬된 객체 정보 목록
+        """
+        row = self.conn.execute(
+            'SELECT refreshed_at, reconciled_at, last_key, max_last_modified FROM listings '
+            'WHERE bucket = ? AND prefix = ?',
+            (bucket, prefix)
+        ).fetchone()
+        now = time.time()
+        
+        if force_refresh or row is None:
+            self.logger.info(f"목록 캐시 전체 갱신: {bucket}/{prefix}")
+            self._store(bucket, prefix, list_objects(None), now, replace=True)
+            return self._load(bucket, prefix)
+        
+        refreshed_at, reconciled_at, last_key, max_last_modified = row
+        if now - refreshed_at < self.ttl_seconds:
+            self.logger.info(f"목록 캐시 사용 (TTL 이내): {bucket}/{prefix}")
+        
+        elif reconciled_at is None or now - reconciled_at >= self.reconcile_interval:
+            self._reconcile(bucket, prefix, list_objects(None), max_last_modified, now)
+        
+        else:
+            new_objects = list_objects(last_key)
+            self.logger.info(
+                f"목록 캐시 증분 갱신: {bucket}/{prefix} "
+                f"('{last_key}' 이후 {len(new_objects)}개 추가)"
+            )
+            self._store(bucket, prefix, new_objects, now, replace=False,
+                        last_key=last_key, max_last_modified=max_last_modified,
+                        reconciled_at=reconciled_at)
+        
+        return self._load(bucket, prefix)
+    
+    def reconciled_at(self, bucket: str, prefix: str) -> Optional[float]:
+        """
+        마지막으로 전체 목록 조회 결과를 반영한 시각을 반환합니다
+        
+        증분 갱신은 기존 객체의 덮어쓰기/삭제를 반영하지 않으므로 포함하지 않습니다.
+        
+        Args:
+            bucket: 버킷명
+            prefix: 접두사
+        
+        Returns:
+            전체 조회 시각 (time.time() 기준, 캐시가 없으면 None)
+        """
+        row = self.conn.execute(
+            'SELECT reconciled_at FROM listings WHERE bucket = ? AND prefix = ?',
+            (bucket, prefix)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _reconcile(self, bucket: str, prefix: str, objects: List[ObjectInfo],
+                   max_last_modified: Optional[str], now: float):
+        """
+        전체 목록 조회 결과로 캐시를 다시 맞추고 교체합니다
+        
+        Args:
+            bucket: 버킷명
+            prefix: 접두사
+            objects: 전체 목록 조회 결과
+            max_last_modified: 이전 갱신 시점의 최신 LastModified (ISO 형식)
+            now: 목록 조회 시각
+        """
+        cached = {obj.key: obj for obj in self._load(bucket, prefix)}
+        listed_keys = {obj.key for obj in objects}
+        
+        added = modified = 0
+        for obj in objects:
+            old = cached.get(obj.key)
+            if old is None:
+                added += 1
+            elif (old.etag, old.size) != (obj.etag, obj.size) or (
+                    obj.last_modified and max_last_modified
+                    and obj.last_modified.isoformat() > max_last_modified):
+                # 이전 갱신 이후 같은 키에 덮어쓴 객체
+                modified += 1
+        removed = len(cached.keys() - listed_keys)
+        
+        self.logger.info(
+            f"목록 캐시 전체 재조회: {bucket}/{prefix} "
+            f"(추가 {added}개, 변경 {modified}개, 삭제 {removed}개)"
+        )
+        self._store(bucket, prefix, objects, now, replace=True)
+    
+    def _store(self, bucket: str, prefix: str, objects: List[ObjectInfo], now: float,
+               replace: bool, last_key: Optional[str] = None,
+               max_last_modified: Optional[str] = None,
+               reconciled_at: Optional[float] = None):
+        """
+        객체 정보와 목록 갱신 시각/마지막 키/최신 LastModified를 한 트랜잭션으로 저장합니다
+        
+        Args:
+            bucket: 버킷명
+            prefix: 접두사
+            objects: 저장할 객체 정보 목록
+            now: 목록 조회 시각
+            replace: 기존 객체를 지우고 전체 목록으로 교체할지 여부 (False이면 증분 추가)
+            last_key: 기존 마지막 키 (증분 추가 시)
+            max_last_modified: 기존 최신 LastModified (ISO 형식, 증분 추가 시)
+            reconciled_at: 기존 전체 조회 시각 (증분 추가 시)
+        """
+        if replace:
+            last_key = max_last_modified = None
+            reconciled_at = now
+        
+        for obj in objects:
+            if last_key is None or obj.key > last_key:
+                last_key = obj.key
+            if obj.last_modified:
+                modified = obj.last_modified.isoformat()
+                if max_last_modified is None or modified > max_last_modified:
+                    max_last_modified = modified
+        
+        with self.conn:
+            if replace:
+                self.conn.execute(
+                    'DELETE FROM objects WHERE bucket = ? AND prefix = ?', (bucket, prefix)
+                )
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO objects (bucket, prefix, key, size, etag, '
+                'last_modified, storage_class, checksum_algorithm) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (bucket, prefix, obj.key, obj.size, obj.etag,
+                     obj.last_modified.isoformat() if obj.last_modified else None,
+                     obj.storage_class, obj.checksum_algorithm)
+                    for obj in objects
+                ]
+            )
+            self.conn.execute(
+                'INSERT OR REPLACE INTO listings (bucket, prefix, refreshed_at, '
+                'last_key, max_last_modified, reconciled_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (bucket, prefix, now, last_key, max_last_modified, reconciled_at)
+            )
+    
+    def _load(self, bucket: str, prefix: str) -> List[ObjectInfo]:
+        """
+        캐시된 객체 정보를 키 순으로 읽습니다
+        
+        Args:
+            bucket: 버킷명
+            prefix: 접두사
+        
+        Returns:
+            객체 정보 목록
+        """
+        cursor = self.conn.execute(
+            'SELECT key, size, etag, last_modified, storage_class, checksum_algorithm '
+            'FROM objects WHERE bucket = ? AND prefix = ? ORDER BY key',
+            (bucket, prefix)
+        )
+        
+        return [
+            ObjectInfo(
+                key=key,
+                size=size,
+                etag=etag or '',
+                last_modified=datetime.fromisoformat(last_modified) if last_modified else None,
+                storage_class=storage_class or '',
+                checksum_algorithm=checksum_algorithm or ''
+            )
+            for key, size, etag, last_modified, storage_class, checksum_algorithm in cursor
+        ]
+    
+    def close(self):
+        """캐시 연결을 닫습니다"""
+        self.conn.close()
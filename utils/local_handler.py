@@ -0,0 +1,215 @@
+"""
+로컬 파일 시스템 처리 모듈
+
+로컬 디렉터리(또는 file:// URL)를 S3Handler와 같은 인터페이스로 다루는 클래스
+"""
+
+import io
+import logging
+import os
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from .object_info import ObjectInfo
+from .s3_handler import DEFAULT_STREAM_BUFFER_SIZE
+
+
+def is_local_location(location: str) -> bool:
+    """
+    버킷 위치가 로컬 디렉터리인지 확인합니다
+    
+    file:// URL이나 경로 구분자가 들어간 위치는 S3 버킷명이 될 수 없으므로 로컬로 봅니다.
+    
+    Args:
+        location: 버킷명 또는 로컬 디렉터리 위치
+    
+    Returns:
+        로컬 디렉터리 여부
+    """
+    return location.startswith('file://') or '/' in location or os.sep in location
+
+
+def local_root(location: str) -> str:
+    """file:// URL 또는 로컬 경로를 디렉터리 경로로 변환합니다"""
+    if location.startswith('file://'):
+        location = location[7:]
+    return os.path.abspath(os.path.expanduser(location))
+
+
+class LocalFileHandler:
+    """로컬 디렉터리를 S3 버킷처럼 다루는 클래스 (버킷명 = 루트 디렉터리)"""
+    
+    def __init__(self, buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE):
+        """
+        LocalFileHandler 초기화
+        
+        Args:
+            buffer_size: 파일 스트림의 읽기 버퍼 크기 (바이트)
+        """
+        self.buffer_size = buffer_size
+        self.logger = logging.getLogger(__name__)
+    
+    def _path(self, bucket_name: str, file_path: str) -> str:
+        """버킷(루트 디렉터리)과 키로 로컬 파일 경로를 만듭니다"""
+        return os.path.join(local_root(bucket_name), *file_path.split('/'))
+    
+    def list_files(self, bucket_name: str, prefix: str = "",
+                   suffix: str = "") -> List[str]:
+        """
+        디렉터리의 파일 목록을 가져옵니다
+        
+        Args:
+            bucket_name: 루트 디렉터리 (로컬 경로 또는 file:// URL)
+            prefix: 접두사 (루트 기준 상대 경로)
+            suffix: 접미사 (예: .json)
+        
+        Returns:
+            파일 경로 목록
+        """
+        return [obj.key for obj in self.list_objects(bucket_name, prefix, suffix)]
+    
+    def list_objects(self, bucket_name: str, prefix: str = "",
+                     suffix: str = "", parallel: bool = False,
+                     start_after: Optional[str] = None,
+                     **kwargs) -> List[ObjectInfo]:
+        """
+        디렉터리를 재귀적으로 탐색하여 객체 정보 목록을 가져옵니다
+        
+        키는 루트 기준 상대 경로('/' 구분)이며, S3 목록 조회처럼 키 순으로 정렬됩니다.
+        parallel 등 S3 목록 조회 옵션은 무시합니다.
+        
+        Args:
+            bucket_name: 루트 디렉터리 (로컬 경로 또는 file:// URL)
+            prefix: 접두사 (루트 기준 상대 경로)
+            suffix: 접미사 (예: .json)
+            parallel: S3Handler와의 호환용 (사용하지 않음)
+            start_after: 이 키 이후의 객체만 반환
+        
+        Returns:
+            객체 정보 목록
+        """
+        root = local_root(bucket_name)
+        
+        # 접두사의 디렉터리 부분부터 탐색하여 불필요한 하위 트리를 건너뜀
+        start_dir = os.path.join(root, *prefix.split('/')[:-1])
+        objects = []
+        
+        def scan(directory: str, key_prefix: str):
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                return
+            
+            for entry in entries:
+                key = key_prefix + entry.name
+                if entry.is_dir(follow_symlinks=True):
+                    # 하위 디렉터리 키가 접두사와 겹칠 때만 내려감
+                    if (key + '/').startswith(prefix) or prefix.startswith(key + '/'):
+                        scan(entry.path, key + '/')
+                    continue
+                
+                if not key.startswith(prefix) or (suffix and not key.endswith(suffix)):
+                    continue
+                if start_after is not None and key <= start_after:
+                    continue
+                
+                stat = entry.stat(follow_symlinks=True)
+                objects.append(ObjectInfo(
+                    key=key,
+                    size=stat.st_size,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                ))
+        
+        start_key = os.path.relpath(start_dir, root).replace(os.sep, '/')
+        scan(start_dir, '' if start_key == '.' else start_key + '/')
+        objects.sort(key=lambda obj: obj.key)
+        
+        self.logger.info(f"{len(objects)}개 파일 발견 (디렉터리: {root}, 접두사: '{prefix}')")
+        return objects
+    
+    def open_file_stream(self, bucket_name: str, file_path: str,
+                         buffer_size: Optional[int] = None, **kwargs) -> io.BufferedReader:
+        """
+        로컬 파일을 큰 읽기 버퍼로 엽니다 (메모리에 복사하지 않음)
+        
+        Args:
+            bucket_name: 루트 디렉터리
+            file_path: 파일 경로
+            buffer_size: 읽기 버퍼 크기 (바이트)
+        
+        Returns:
+            바이너리 스트림
+        """
+        return open(self._path(bucket_name, file_path), 'rb',
+                    buffering=buffer_size or self.buffer_size)
+    
+    # 로컬 파일은 범위 병렬 읽기가 필요 없으므로 같은 스트림을 사용
+    open_file_stream_ranged = open_file_stream
+    get_file_stream = open_file_stream
+    
+    def get_file_bytes(self, bucket_name: str, file_path: str) -> bytes:
+        """
+        로컬 파일 전체를 바이트로 읽습니다 (버퍼를 거치지 않고 한 번에 읽음)
+        
+        Args:
+            bucket_name: 루트 디렉터리
+            file_path: 파일 경로
+        
+        Returns:
+            파일 내용
+        """
+        with open(self._path(bucket_name, file_path), 'rb', buffering=0) as f:
+            return f.read()
+    
+    def file_exists(self, bucket_name: str, file_path: str) -> bool:
+        """
+        로컬 파일이 존재하는지 확인합니다
+        
+        Args:
+            bucket_name: 루트 디렉터리
+            file_path: 파일 경로
+        
+        Returns:
+            파일 존재 여부
+        """
+        return os.path.isfile(self._path(bucket_name, file_path))
+    
+    def get_file_size(self, bucket_name: str, file_path: str) -> int:
+        """
+        로컬 파일의 크기를 가져옵니다
+        
+        Args:
+            bucket_name: 루트 디렉터리
+            file_path: 파일 경로
+        
+        Returns:
+            파일 크기 (바이트)
+        """
+        return os.path.getsize(self._path(bucket_name, file_path))
+    
+    def get_file_metadata(self, bucket_name: str, file_path: str,
+                          checksum_mode: bool = False,
+                          part_number: Optional[int] = None) -> dict:
+        """
+        로컬 파일의 메타데이터를 가져옵니다 (S3Handler와 같은 형식, ETag/체크섬 없음)
+        
+        Args:
+            bucket_name: 루트 디렉터리
+            file_path: 파일 경로
+            checksum_mode: S3Handler와 인터페이스를 맞추기 위한 인자 (무시)
+            part_number: S3Handler와 인터페이스를 맞추기 위한 인자 (무시)
+        
+        Returns:
+            파일 메타데이터
+        """
+        stat = os.stat(self._path(bucket_name, file_path))
+        return {
+            'size': stat.st_size,
+            'last_modified': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            'etag': '',
+            'content_type': '',
+            'metadata': {},
+            'checksums': {},
+            'parts_count': None
+        }
+
@@ -0,0 +1,92 @@
+"""
+객체 정보 모듈
+
+목록 조회 결과에서 얻은 객체 메타데이터를 담는 경량 레코드
+"""
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class ObjectInfo(NamedTuple):
+    """목록 조회로 얻은 객체 정보 (HEAD 요청 없이 사용)"""
+    key: str
+    size: int
+    etag: str = ""
+    last_modified: Optional[datetime] = None
+    storage_class: str = ""
+    checksum_algorithm: str = ""
+    
+    @classmethod
+    def from_listing(cls, obj: dict) -> "ObjectInfo":
+        """
+        list_objects_v2 응답의 Contents 항목으로 객체 정보를 만듭니다
+        
+        Args:
+            obj: Contents 항목
+        
+        Returns:
+            객체 정보
+        """
+        return cls(
+            key=obj['Key'],
+            size=obj.get('Size', 0),
+            etag=obj.get('ETag', '').strip('"'),
+            last_modified=obj.get('LastModified'),
+            storage_class=obj.get('StorageClass', ''),
+            checksum_algorithm=','.join(obj.get('ChecksumAlgorithm', []))
+        )
+
+
+# HEAD 응답에서 추가 체크섬을 읽을 필드 (알고리즘 → 응답 키)
+CHECKSUM_FIELDS = {
+    'SHA256': 'ChecksumSHA256',
+    'SHA1': 'ChecksumSHA1',
+    'CRC64NVME': 'ChecksumCRC64NVME',
+    'CRC32C': 'ChecksumCRC32C',
+    'CRC32': 'ChecksumCRC32',
+}
+
+
+def head_object_options(checksum_mode: bool = False,
+                        part_number: Optional[int] = None) -> dict:
+    """
+    head_object에 추가로 넘길 인자를 만듭니다
+    
+    Args:
+        checksum_mode: 추가 체크섬을 응답에 포함할지 여부 (ChecksumMode=ENABLED)
+        part_number: 조회할 멀티파트 파트 번호
+    
+    Returns:
+        head_object 키워드 인자
+    """
+    options = {}
+    if checksum_mode:
+        options['ChecksumMode'] = 'ENABLED'
+    if part_number is not None:
+        options['PartNumber'] = part_number
+    return options
+
+
+def metadata_from_head(response: dict) -> dict:
+    """
+    head_object 응답을 핸들러 공통 메타데이터 형식으로 변환합니다
+    
+    Args:
+        response: head_object 응답
+    
+    Returns:
+        파일 메타데이터 (checksums: 알고리즘 → 값, parts_count: 멀티파트 파트 수)
+    """
+    return {
+        'size': response['ContentLength'],
+        'last_modified': response['LastModified'],
+        'etag': response['ETag'].strip('"'),
+        'content_type': response.get('ContentType', ''),
+        'metadata': response.get('Metadata', {}),
+        'checksums': {
+            algorithm: response[field]
+            for algorithm, field in CHECKSUM_FIELDS.items() if response.get(field)
+        },
+        'parts_count': response.get('PartsCount')
+    }
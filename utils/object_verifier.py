@@ -0,0 +1,344 @@
+"""
+객체 단위 검증 모듈
+
+크기와 ETag, S3 추가 체크섬(ChecksumSHA256/CRC32C 등)이 같은 소스/백업 객체 쌍을
+내용을 내려받아 해시하지 않고 객체 단위로 검증하는 클래스
+"""
+
+import concurrent.futures
+import hashlib
+import logging
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+from tqdm import tqdm
+
+from .local_handler import is_local_location
+from .object_info import ObjectInfo
+
+# 검증 방식별 검증 강도 (리포트의 verification_strength 열)
+VERIFICATION_STRENGTHS: Dict[str, str] = {
+    'etag': 'MD5 (128-bit)',
+    'etag-multipart': 'multipart MD5 (128-bit)',
+    'etag-recomputed': 'recomputed MD5 (128-bit)',
+    'checksum-sha256': 'SHA-256 (256-bit)',
+    'checksum-sha1': 'SHA-1 (160-bit)',
+    'checksum-crc64nvme': 'CRC64NVME (64-bit)',
+    'checksum-crc32c': 'CRC32C (32-bit)',
+    'checksum-crc32': 'CRC32 (32-bit)',
+}
+
+# 두 객체에 공통 체크섬이 여러 개 있을 때 비교할 순서 (강한 것부터)
+CHECKSUM_PREFERENCE = ('SHA256', 'SHA1', 'CRC64NVME', 'CRC32C', 'CRC32')
+
+# HEAD 요청/ETag 재계산을 동시에 수행할 객체 쌍 수
+DEFAULT_VERIFY_WORKERS = 16
+
+# ETag 재계산 시 한 번에 읽을 크기
+_READ_SIZE = 1024 * 1024
+
+
+def is_multipart_etag(etag: str) -> bool:
+    """멀티파트 업로드 ETag("<md5>-<파트 수>")인지 확인합니다"""
+    return '-' in etag
+
+
+def compute_etag(stream: IO, part_size: Optional[int] = None) -> str:
+    """
+    스트림 내용으로 S3 ETag를 계산합니다
+    
+    단일 업로드 ETag는 내용의 MD5이고, 멀티파트 ETag는 part_size 단위로 자른 각 파트
+    MD5를 이어 붙인 바이트의 MD5 뒤에 "-<파트 수>"를 붙인 값입니다.
+    
+    Args:
+        stream: 압축 해제하지 않은 원본 바이너리 스트림
+        part_size: 멀티파트 파트 크기 (None이면 단일 업로드 ETag)
+    
+    Returns:
+        ETag (따옴표 없음)
+    """
+    if not part_size:
+        md5 = hashlib.md5(usedforsecurity=False)
+        for chunk in iter(lambda: stream.read(_READ_SIZE), b''):
+            md5.update(chunk)
+        return md5.hexdigest()
+    
+    part_digests = []
+    while True:
+        part_md5 = hashlib.md5(usedforsecurity=False)
+        remaining = part_size
+        while remaining:
+            chunk = stream.read(min(remaining, _READ_SIZE))
+            if not chunk:
+                break
+            part_md5.update(chunk)
+            remaining -= len(chunk)
+        if remaining == part_size:
+            break
+        part_digests.append(part_md5.digest())
+        if remaining:
+            break
+    
+    combined = hashlib.md5(b''.join(part_digests), usedforsecurity=False).hexdigest()
+    return f"{combined}-{len(part_digests)}"
+
+
+def common_checksums(source_obj: ObjectInfo, backup_obj: ObjectInfo) -> set:
+    """목록 조회 결과에서 두 객체에 공통으로 있는 추가 체크섬 알고리즘을 반환합니다"""
+    source_algorithms = set(filter(None, source_obj.checksum_algorithm.split(',')))
+    backup_algorithms = set(filter(None, backup_obj.checksum_algorithm.split(',')))
+    return source_algorithms & backup_algorithms
+
+
+class ObjectVerifier:
+    """크기/ETag/추가 체크섬으로 객체 쌍을 검증하는 클래스"""
+    
+    def __init__(self, handler_for: Callable[[str], Any],
+                 max_workers: int = DEFAULT_VERIFY_WORKERS):
+        """
+        ObjectVerifier 초기화
+        
+        Args:
+            handler_for: 버킷 위치 → 핸들러 (S3Handler, AsyncS3Handler, LocalFileHandler)
+            max_workers: HEAD 요청/ETag 재계산을 동시에 수행할 객체 쌍 수
+        """
+        self.handler_for = handler_for
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+    
+    @staticmethod
+    def pair_objects(source_objects: List[ObjectInfo], source_prefix: str,
+                     backup_objects: List[ObjectInfo], backup_prefix: str
+                     ) -> List[Tuple[ObjectInfo, ObjectInfo]]:
+        """
+        접두사를 뺀 상대 키가 같은 소스/백업 객체를 짝지어 반환합니다
+        
+        Args:
+            source_objects: 소스 객체 목록
+            source_prefix: 소스 접두사
+            backup_objects: 백업 객체 목록
+            backup_prefix: 백업 접두사
+        
+        Returns:
+            (소스 객체, 백업 객체) 목록
+        """
+        backup_by_key = {obj.key[len(backup_prefix):]: obj for obj in backup_objects}
+        pairs = []
+        for source_obj in source_objects:
+            backup_obj = backup_by_key.get(source_obj.key[len(source_prefix):])
+            if backup_obj is not None:
+                pairs.append((source_obj, backup_obj))
+        return pairs
+    
+    def verify_pairs(self, source_bucket: str, backup_bucket: str,
+                     pairs: List[Tuple[ObjectInfo, ObjectInfo]],
+                     refresh_source: bool = False,
+                     refresh_backup: bool = False
+                     ) -> List[Tuple[ObjectInfo, ObjectInfo, str]]:
+        """
+        객체 쌍을 메타데이터로 검증하고, 검증된 쌍과 검증 방식을 반환합니다
+        
+        목록 조회 결과만으로 판단할 수 있는 쌍(같은 ETag)은 바로 검증하고,
+        HEAD 요청이나 ETag 재계산이 필요한 쌍만 스레드 풀에서 처리합니다.
+        인벤토리나 TTL 이내의 목록 캐시처럼 오래되었을 수 있는 목록은 refresh_*로
+        지정하면, 검증 후보 쌍의 해당 쪽 메타데이터를 HEAD로 다시 조회한 뒤 판단합니다.
+        
+        Args:
+            source_bucket: 소스 버킷 (또는 로컬 디렉터리)
+            backup_bucket: 백업 버킷 (또는 로컬 디렉터리)
+            pairs: pair_objects로 짝지은 객체 쌍
+            refresh_source: 소스 메타데이터를 HEAD로 다시 조회할지 여부
+            refresh_backup: 백업 메타데이터를 HEAD로 다시 조회할지 여부
+        
+        Returns:
+            (소스 객체, 백업 객체, 검증 방식) 목록 (재조회했으면 최신 메타데이터의 객체 정보)
+        """
+        if refresh_source or refresh_backup:
+            pairs = self._refresh_pairs(
+                source_bucket, backup_bucket,
+                [pair for pair in pairs if self._is_candidate(source_bucket, backup_bucket, *pair)],
+                refresh_source, refresh_backup
+            )
+        
+        verified = []
+        candidates = []
+        for source_obj, backup_obj in pairs:
+            if source_obj.size != backup_obj.size:
+                continue
+            if source_obj.etag and source_obj.etag == backup_obj.etag:
+                method = 'etag-multipart' if is_multipart_etag(source_obj.etag) else 'etag'
+                verified.append((source_obj, backup_obj, method))
+            elif self._needs_remote_check(source_bucket, source_obj, backup_bucket, backup_obj):
+                candidates.append((source_obj, backup_obj))
+        
+        if not candidates:
+            return verified
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._verify_remote, source_bucket, source_obj, backup_bucket, backup_obj
+                ): (source_obj, backup_obj)
+                for source_obj, backup_obj in candidates
+            }
+            with tqdm(total=len(futures), desc="객체 메타데이터 검증") as pbar:
+                for future in concurrent.futures.as_completed(futures):
+                    method = future.result()
+                    if method is not None:
+                        verified.append((*futures[future], method))
+                    pbar.update(1)
+        
+        return verified
+    
+    def _is_candidate(self, source_bucket: str, backup_bucket: str,
+                      source_obj: ObjectInfo, backup_obj: ObjectInfo) -> bool:
+        """메타데이터로 검증될 수 있는 쌍인지 확인합니다 (크기가 같고 ETag가 같거나 원격 확인 가능)"""
+        if source_obj.size != backup_obj.size:
+            return False
+        return bool(source_obj.etag and source_obj.etag == backup_obj.etag) or \
+            self._needs_remote_check(source_bucket, source_obj, backup_bucket, backup_obj)
+    
+    def _refresh_pairs(self, source_bucket: str, backup_bucket: str,
+                       pairs: List[Tuple[ObjectInfo, ObjectInfo]],
+                       refresh_source: bool, refresh_backup: bool
+                       ) -> List[Tuple[ObjectInfo, ObjectInfo]]:
+        """
+        객체 쌍의 메타데이터를 HEAD로 다시 조회합니다 (조회에 실패한 쌍은 제외 → 내용 비교)
+        
+        Returns:
+            최신 메타데이터로 바꾼 객체 쌍 목록
+        """
+        if not pairs:
+            return []
+        
+        def refresh(source_obj: ObjectInfo, backup_obj: ObjectInfo) -> Tuple[ObjectInfo, ObjectInfo]:
+            if refresh_source:
+                source_obj = self._head_object(source_bucket, source_obj)
+            if refresh_backup:
+                backup_obj = self._head_object(backup_bucket, backup_obj)
+            return source_obj, backup_obj
+        
+        refreshed = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(refresh, *pair): pair for pair in pairs}
+            with tqdm(total=len(futures), desc="객체 메타데이터 재조회") as pbar:
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        refreshed.append(future.result())
+                    except Exception as e:
+                        self.logger.warning(
+                            f"객체 메타데이터 재조회 실패, 내용 비교로 진행 ({futures[future][0].key}): {e}"
+                        )
+                    pbar.update(1)
+        
+        return refreshed
+    
+    def _head_object(self, bucket: str, obj: ObjectInfo) -> ObjectInfo:
+        """HEAD 요청(추가 체크섬 포함)으로 객체의 최신 크기/ETag/체크섬 알고리즘을 조회합니다"""
+        metadata = self.handler_for(bucket).get_file_metadata(bucket, obj.key, checksum_mode=True)
+        return obj._replace(
+            size=metadata['size'],
+            etag=metadata['etag'],
+            last_modified=metadata['last_modified'],
+            checksum_algorithm=','.join(metadata['checksums'])
+        )
+    
+    @staticmethod
+    def _can_recompute_etag(source_bucket: str, source_obj: ObjectInfo,
+                            backup_bucket: str, backup_obj: ObjectInfo) -> bool:
+        """
+        한쪽 내용으로 반대편 ETag를 다시 계산해 검증할 수 있는 쌍인지 확인합니다
+        
+        둘 다 S3의 단일 업로드 ETag인데 값이 다르면 내용이 다르므로(SSE-KMS 객체 제외)
+        다시 계산하지 않습니다.
+        """
+        source_local = is_local_location(source_bucket)
+        backup_local = is_local_location(backup_bucket)
+        if source_local and backup_local:
+            return False
+        if source_local or backup_local:
+            # 로컬 파일로 S3 객체의 ETag를 계산
+            return bool(backup_obj.etag if source_local else source_obj.etag)
+        return is_multipart_etag(source_obj.etag) or is_multipart_etag(backup_obj.etag)
+    
+    def _needs_remote_check(self, source_bucket: str, source_obj: ObjectInfo,
+                            backup_bucket: str, backup_obj: ObjectInfo) -> bool:
+        """ETag가 다른 쌍 중 체크섬 조회나 ETag 재계산으로 검증할 수 있는 쌍인지 확인합니다"""
+        return bool(common_checksums(source_obj, backup_obj)) or self._can_recompute_etag(
+            source_bucket, source_obj, backup_bucket, backup_obj
+        )
+    
+    def _verify_remote(self, source_bucket: str, source_obj: ObjectInfo,
+                       backup_bucket: str, backup_obj: ObjectInfo) -> Optional[str]:
+        """
+        추가 체크섬 비교, 이어서 ETag 재계산으로 객체 쌍을 검증합니다
+        
+        Returns:
+            검증 방식 (검증하지 못하면 None → 내용 비교)
+        """
+        try:
+            if common_checksums(source_obj, backup_obj):
+                method = self._compare_checksums(source_bucket, source_obj, backup_bucket, backup_obj)
+                if method is not None:
+                    return method
+            
+            if (self._can_recompute_etag(source_bucket, source_obj, backup_bucket, backup_obj)
+                    and self._recompute_etag(source_bucket, source_obj, backup_bucket, backup_obj)):
+                return 'etag-recomputed'
+        except Exception as e:
+            self.logger.warning(f"객체 메타데이터 검증 실패, 내용 비교로 진행 ({source_obj.key}): {e}")
+        return None
+    
+    def _compare_checksums(self, source_bucket: str, source_obj: ObjectInfo,
+                           backup_bucket: str, backup_obj: ObjectInfo) -> Optional[str]:
+        """
+        양쪽 객체의 추가 체크섬을 HEAD 요청으로 조회해 공통 알고리즘 값이 같은지 비교합니다
+        
+        Returns:
+            검증 방식 (예: "checksum-sha256"), 같은 값이 없으면 None
+        """
+        source_checksums = self.handler_for(source_bucket).get_file_metadata(
+            source_bucket, source_obj.key, checksum_mode=True
+        )['checksums']
+        backup_checksums = self.handler_for(backup_bucket).get_file_metadata(
+            backup_bucket, backup_obj.key, checksum_mode=True
+        )['checksums']
+        
+        for algorithm in CHECKSUM_PREFERENCE:
+            source_value = source_checksums.get(algorithm)
+            if source_value and source_value == backup_checksums.get(algorithm):
+                return f"checksum-{algorithm.lower()}"
+        return None
+    
+    def _recompute_etag(self, source_bucket: str, source_obj: ObjectInfo,
+                        backup_bucket: str, backup_obj: ObjectInfo) -> bool:
+        """
+        한쪽 객체 내용으로 반대편 객체의 ETag를 계산해 비교합니다
+        
+        로컬 파일이 있으면 로컬 파일로 S3 객체의 ETag를, 둘 다 S3이면 소스 객체를
+        내려받아 백업 객체의 파트 크기(HEAD PartNumber=1)로 ETag를 계산합니다.
+        파트 크기가 달라 멀티파트 ETag가 다른 복사본도 이 방법으로 검증할 수 있습니다.
+        
+        Returns:
+            계산한 ETag가 반대편 ETag와 같은지 여부
+        """
+        if is_local_location(backup_bucket):
+            content_bucket, content_obj = backup_bucket, backup_obj
+            target_bucket, target_obj = source_bucket, source_obj
+        else:
+            content_bucket, content_obj = source_bucket, source_obj
+            target_bucket, target_obj = backup_bucket, backup_obj
+        
+        if not target_obj.etag:
+            return False
+        
+        part_size = None
+        if is_multipart_etag(target_obj.etag):
+            part_size = self.handler_for(target_bucket).get_file_metadata(
+                target_bucket, target_obj.key, part_number=1
+            )['size']
+        
+        with self.handler_for(content_bucket).open_file_stream(
+            content_bucket, content_obj.key
+        ) as stream:
+            return compute_etag(stream, part_size) == target_obj.etag
+
@@ -0,0 +1,199 @@
+"""
+객체 프리페처 모듈
+
+현재 객체를 해시하는 동안 다음 객체들을 스레드 풀에서 미리 내려받는 클래스
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Generator, Iterable, Optional, Tuple
+
+# 기본 프리페치 설정
+DEFAULT_PREFETCH_COUNT = 4
+DEFAULT_PREFETCH_BYTES = 256 * 1024 * 1024
+
+# 프리페치로 통째로 미리 받을 최대 객체 크기. 프리페치는 객체마다의 요청 지연을 숨기는
+# 것이므로, 전송 시간이 지연보다 훨씬 긴 큰 객체는 메모리에 모으지 않고 바로 스트리밍
+DEFAULT_PREFETCH_MAX_OBJECT_BYTES = 8 * 1024 * 1024
+
+# 작은 객체 모드의 기본 동시 요청 수
+DEFAULT_SMALL_OBJECT_CONCURRENCY = 128
+
+# 작은 객체 모드에서 한 객체를 메모리로 압축 해제할 최대 크기
+# (동시 요청 수만큼 작업 스레드가 있으므로 최악의 경우 이 크기 × 동시 요청 수)
+DEFAULT_SMALL_OBJECT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class ObjectPrefetcher:
+    """동시 다운로드 수와 메모리 사용량이 제한된 프리페치 파이프라인"""
+    
+    def __init__(self, fetch: Callable[[str], bytes],
+                 max_prefetch: int = DEFAULT_PREFETCH_COUNT,
+                 max_inflight_bytes: int = DEFAULT_PREFETCH_BYTES,
+                 stream_threshold: int = DEFAULT_PREFETCH_MAX_OBJECT_BYTES):
+        """
+        ObjectPrefetcher 초기화
+        
+        Args:
+            fetch: 객체 키를 받아 객체 전체 바이트를 반환하는 함수
+            max_prefetch: 미리 내려받을 최대 객체 수
+            max_inflight_bytes: 내려받았지만 아직 소비되지 않은 최대 바이트 수
+            stream_threshold: 이 크기 이상인 객체는 미리 받지 않고 호출자가 스트리밍
+        """
+        self.fetch = fetch
+        self.max_prefetch = max(1, max_prefetch)
+        self.max_inflight_bytes = max_inflight_bytes
+        self.stream_threshold = stream_threshold
+        self.logger = logging.getLogger(__name__)
+    
+    def iter_objects(self, items: Iterable[Tuple[str, Optional[int]]]
+                     ) -> Generator[Tuple[str, Optional[bytes], Optional[Exception]], None, None]:
+        """
+        객체를 입력 순서대로 내려받아 반환합니다
+        
+        크기를 알 수 없는 객체는 지금까지 내려받은 객체의 평균 크기로 예산을
+        잡고, 크기가 stream_threshold 이상인 객체는 미리 받지 않고 데이터 None으로
+        반환하여 호출자가 직접 스트리밍하도록 합니다.
+        
+        Args:
+            items: (객체 키, 크기 또는 None) 목록
+        
+        Yields:
+            (객체 키, 객체 바이트 또는 None, 다운로드 오류 또는 None)
+        """
+        items = iter(items)
+        pending = deque()
+        held = None
+        reserved_bytes = 0
+        fetched_bytes = 0
+        fetched_count = 0
+        
+        def estimate(size: Optional[int]) -> int:
+            if size is not None:
+                return size
+            if fetched_count:
+                return fetched_bytes // fetched_count
+            return self.max_inflight_bytes // self.max_prefetch
+        
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_prefetch,
+            thread_name_prefix="s3-prefetch"
+        )
+        
+        try:
+            while True:
+                # 개수/바이트 예산 안에서 다음 객체 다운로드를 예약
+                while len(pending) < self.max_prefetch:
+                    if held is None:
+                        held = next(items, None)
+                        if held is None:
+                            break
+                    key, size = held
+                    
+                    if size is not None and (size >= self.stream_threshold
+                                             or size > self.max_inflight_bytes):
+                        # 큰 객체는 호출자가 스트리밍으로 처리
+                        pending.append((key, None, 0))
+                        held = None
+                        continue
+                    
+                    reservation = estimate(size)
+                    if pending and reserved_bytes + reservation > self.max_inflight_bytes:
+                        # 예산 초과: 앞선 객체가 소비될 때까지 대기
+                        break
+                    
+                    pending.append((key, executor.submit(self.fetch, key), reservation))
+                    reserved_bytes += reservation
+                    held = None
+                
+                if not pending:
+                    break
+                
+                key, future, reservation = pending.popleft()
+                reserved_bytes -= reservation
+                
+                if future is None:
+                    yield key, None, None
+                    continue
+                
+                try:
+                    data = future.result()
+                except Exception as e:
+                    yield key, None, e
+                    continue
+                
+                fetched_bytes += len(data)
+                fetched_count += 1
+                yield key, data, None
+        
+        finally:
+            for _, future, _ in pending:
+                if future is not None:
+                    future.cancel()
+            executor.shutdown(wait=False)
+
+
+class ConcurrentObjectProcessor:
+    """작은 객체를 많이 동시에 내려받아 작업 스레드에서 바로 처리하는 클래스"""
+    
+    def __init__(self, process: Callable[[str], Any],
+                 max_workers: int = DEFAULT_SMALL_OBJECT_CONCURRENCY):
+        """
+        ConcurrentObjectProcessor 초기화
+        
+        Args:
+            process: 객체 키를 받아 내려받고 처리한 결과를 반환하는 함수
+            max_workers: 동시에 처리할 객체 수 (동시 GET 요청 수)
+        """
+        self.process = process
+        self.max_workers = max(1, max_workers)
+        self.logger = logging.getLogger(__name__)
+    
+    def iter_results(self, keys: Iterable[str]
+                     ) -> Generator[Tuple[str, Any, Optional[Exception]], None, None]:
+        """
+        객체를 동시에 처리하여 완료되는 순서대로 반환합니다
+        
+        요청 지연이 처리 시간보다 긴 작은 객체에서는 입력 순서를 지키느라
+        기다리지 않도록 완료 순서로 반환하며, 대기 중인 작업 수는 작업 스레드의
+        두 배로 제한하여 목록 전체를 한꺼번에 예약하지 않습니다.
+        
+        Args:
+            keys: 객체 키 목록
+        
+        Yields:
+            (객체 키, 처리 결과 또는 None, 오류 또는 None)
+        """
+        keys = iter(keys)
+        max_pending = self.max_workers * 2
+        pending = {}
+        
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="s3-small-object"
+        )
+        
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    key = next(keys, None)
+                    if key is None:
+                        break
+                    pending[executor.submit(self.process, key)] = key
+                
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        yield key, future.result(), None
+                    except Exception as e:
+                        yield key, None, e
+        
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -0,0 +1,262 @@
+"""
+요청 속도 조절 모듈
+
+버킷/접두사별 토큰 버킷으로 S3 요청 속도를 제한하고, 503 SlowDown 응답에 따라
+AIMD(가법 증가/승법 감소) 방식으로 속도를 조절하는 클래스
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# S3는 접두사당 초당 5,500건의 GET/HEAD 요청을 기본으로 지원
+DEFAULT_REQUEST_RATE = 5500.0
+DEFAULT_MIN_REQUEST_RATE = 10.0
+DEFAULT_RATE_INCREASE = 100.0
+DEFAULT_RATE_DECREASE_FACTOR = 0.5
+DEFAULT_DECREASE_COOLDOWN = 1.0
+
+# 속도 제한으로 보는 오류 코드
+THROTTLE_ERROR_CODES = {
+    'SlowDown', 'Throttling', 'ThrottlingException', 'RequestLimitExceeded',
+    'TooManyRequests', 'TooManyRequestsException', 'RequestThrottled'
+}
+
+
+class AdaptiveRateLimiter:
+    """AIMD 방식으로 속도가 조절되는 토큰 버킷"""
+    
+    def __init__(self, rate: float = DEFAULT_REQUEST_RATE,
+                 min_rate: float = DEFAULT_MIN_REQUEST_RATE,
+                 max_rate: Optional[float] = None,
+                 increase: float = DEFAULT_RATE_INCREASE,
+                 decrease_factor: float = DEFAULT_RATE_DECREASE_FACTOR,
+                 decrease_cooldown: float = DEFAULT_DECREASE_COOLDOWN):
+        """
+        AdaptiveRateLimiter 초기화
+        
+        Args:
+            rate: 시작 속도 (초당 요청 수)
+            min_rate: 최소 속도
+            max_rate: 최대 속도 (기본값: 시작 속도)
+            increase: 성공 응답이 이어질 때 1초마다 늘릴 속도 (가법 증가)
+            decrease_factor: 속도 제한 응답을 받았을 때 곱할 비율 (승법 감소)
+            decrease_cooldown: 연속 감소 사이의 최소 간격 (초). 이미 보낸 요청들이
+                한꺼번에 503을 받아도 속도는 한 번만 줄어듭니다.
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        
+        self._lock = threading.Lock()
+        self._tokens = self.rate
+        self._last_refill = time.monotonic()
+        self._last_decrease = 0.0
+        self.throttle_count = 0
+    
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰을 채웁니다 (최대 1초 분량)"""
+        self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    def reserve(self) -> float:
+        """
+        요청 하나를 보낼 토큰을 예약합니다
+        
+        Returns:
+            토큰이 채워질 때까지 기다려야 하는 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            
+            # 토큰을 먼저 예약하여 대기 중인 요청들이 도착 순서대로 나가도록 함
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """요청 하나를 보낼 토큰을 얻습니다 (부족하면 채워질 때까지 대기)"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def on_success(self):
+        """성공 응답을 기록합니다 (가법 증가: 초당 increase만큼 회복)"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+    
+    def on_throttle(self) -> bool:
+        """
+        속도 제한 응답을 기록합니다 (승법 감소)
+        
+        Returns:
+            이번 응답으로 속도가 줄었는지 여부
+        """
+        with self._lock:
+            self.throttle_count += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_cooldown:
+                return False
+            
+            self._last_decrease = now
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            return True
+
+
+class RequestRateGovernor:
+    """버킷/접두사별 AdaptiveRateLimiter를 botocore 클라이언트 이벤트에 연결하는 클래스"""
+    
+    def __init__(self, rate: float = DEFAULT_REQUEST_RATE,
+                 min_rate: float = DEFAULT_MIN_REQUEST_RATE,
+                 increase: float = DEFAULT_RATE_INCREASE,
+                 decrease_factor: float = DEFAULT_RATE_DECREASE_FACTOR):
+        """
+        RequestRateGovernor 초기화
+        
+        Args:
+            rate: 접두사별 시작/최대 속도 (초당 요청 수)
+            min_rate: 접두사별 최소 속도
+            increase: 초당 가법 증가량
+            decrease_factor: 승법 감소 비율
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.logger = logging.getLogger(__name__)
+        
+        self._lock = threading.Lock()
+        self._limiters: Dict[Tuple[str, str], AdaptiveRateLimiter] = {}
+    
+    @staticmethod
+    def partition_key(bucket: str, path: str) -> Tuple[str, str]:
+        """
+        요청이 속한 (버킷, 접두사)를 구합니다 (키 또는 목록 접두사의 상위 디렉터리)
+        
+        Args:
+            bucket: 버킷명
+            path: 객체 키 또는 목록 조회 접두사
+        
+        Returns:
+            (버킷, 접두사)
+        """
+        return bucket, path.rsplit('/', 1)[0] if '/' in path else ''
+    
+    def limiter_for(self, partition: Tuple[str, str]) -> AdaptiveRateLimiter:
+        """
+        접두사의 속도 제한기를 반환합니다 (없으면 생성)
+        
+        Args:
+            partition: (버킷, 접두사)
+        
+        Returns:
+            속도 제한기
+        """
+        with self._lock:
+            limiter = self._limiters.get(partition)
+            if limiter is None:
+                limiter = AdaptiveRateLimiter(
+                    rate=self.rate,
+                    min_rate=self.min_rate,
+                    increase=self.increase,
+                    decrease_factor=self.decrease_factor
+                )
+                self._limiters[partition] = limiter
+            return limiter
+    
+    def register(self, client):
+        """
+        S3 클라이언트의 모든 요청(재시도 포함)에 속도 제한을 적용합니다
+        
+        Args:
+            client: boto3 S3 클라이언트
+        """
+        events = client.meta.events
+        events.register('before-parameter-build.s3', self._on_before_parameter_build)
+        events.register('before-send.s3', self._on_before_send)
+        events.register('response-received.s3', self._on_response_received)
+    
+    def register_async(self, client):
+        """
+        aiobotocore S3 클라이언트의 모든 요청에 속도 제한을 적용합니다
+        (이벤트 루프를 막지 않도록 토큰 대기는 asyncio.sleep으로 수행)
+        
+        Args:
+            client: aiobotocore S3 클라이언트
+        """
+        events = client.meta.events
+        events.register('before-parameter-build.s3', self._on_before_parameter_build)
+        events.register('before-send.s3', self._on_before_send_async)
+        events.register('response-received.s3', self._on_response_received)
+    
+    def _on_before_parameter_build(self, params: Dict[str, Any], context: Dict[str, Any], **kwargs):
+        """요청 파라미터에서 접두사를 구해 요청 컨텍스트에 기록합니다"""
+        bucket = params.get('Bucket')
+        if bucket:
+            path = params.get('Key') or params.get('Prefix') or ''
+            context['rate_limit_partition'] = self.partition_key(bucket, path)
+    
+    def _on_before_send(self, request, **kwargs):
+        """HTTP 요청을 보내기 직전에 토큰을 얻습니다 (botocore 재시도마다 호출됨)"""
+        partition = request.context.get('rate_limit_partition')
+        if partition is not None:
+            self.limiter_for(partition).acquire()
+    
+    async def _on_before_send_async(self, request, **kwargs):
+        """비동기 클라이언트에서 HTTP 요청을 보내기 직전에 토큰을 얻습니다"""
+        partition = request.context.get('rate_limit_partition')
+        if partition is not None:
+            wait_time = self.limiter_for(partition).reserve()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+    
+    def _on_response_received(self, context: Dict[str, Any],
+                              response_dict: Optional[Dict[str, Any]] = None,
+                              parsed_response: Optional[Dict[str, Any]] = None,
+                              **kwargs):
+        """응답 상태에 따라 접두사의 속도를 조절합니다"""
+        partition = context.get('rate_limit_partition')
+        if partition is None or response_dict is None:
+            # 연결 오류 등은 속도 제한과 무관하므로 무시
+            return
+        
+        limiter = self.limiter_for(partition)
+        status_code = response_dict.get('status_code', 0)
+        error_code = (parsed_response or {}).get('Error', {}).get('Code', '')
+        
+        if status_code == 503 or error_code in THROTTLE_ERROR_CODES:
+            if limiter.on_throttle():
+                self.logger.info(
+                    f"S3 요청 속도 제한 감지: {partition[0]}/{partition[1]} "
+                    f"→ {limiter.rate:,.0f} req/s로 감소"
+                )
+        elif status_code < 500:
+            limiter.on_success()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        접두사별 속도 조절 통계를 반환합니다
+        
+        Returns:
+            접두사 수, 속도 제한 응답 수, 속도가 줄어든 접두사별 현재 속도
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        
+        return {
+            'partitions': len(limiters),
+            'throttled_requests': sum(l.throttle_count for l in limiters.values()),
+            'throttled_partitions': {
+                f"{bucket}/{prefix}": round(limiter.rate, 1)
+                for (bucket, prefix), limiter in limiters.items()
+                if limiter.throttle_count
+            }
+        }
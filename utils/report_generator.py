@@ -9,7 +9,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 import pandas as pd
 
@@ -23,7 +23,8 @@ class ReportGenerator:
     
     def generate_report(self, results: List[Any], 
                        output_path: str = "compare_report.csv",
-                       format_type: str = "csv") -> bool:
+                       format_type: str = "csv",
+                       metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         비교 결과 리포트를 생성합니다
         
@@ -31,17 +32,18 @@ class ReportGenerator:
             results: 비교 결과 리스트
             output_path: 출력 파일 경로
             format_type: 리포트 형식 ("csv", "json", "excel")
+            metadata: 요약에 함께 기록할 비교 설정 (예: {'Hash Algorithm': 'blake2b (128-bit)'})
             
         Returns:
             성공 여부
         """
         try:
             if format_type.lower() == "csv":
-                return self._generate_csv_report(results, output_path)
+                return self._generate_csv_report(results, output_path, metadata)
             elif format_type.lower() == "json":
-                return self._generate_json_report(results, output_path)
+                return self._generate_json_report(results, output_path, metadata)
             elif format_type.lower() == "excel":
-                return self._generate_excel_report(results, output_path)
+                return self._generate_excel_report(results, output_path, metadata)
             else:
                 raise ValueError(f"지원하지 않는 형식: {format_type}")
                 
@@ -50,13 +52,15 @@ class ReportGenerator:
             return False
     
     def _generate_csv_report(self, results: List[Any], 
-                           output_path: str) -> bool:
+                           output_path: str,
+                           metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         CSV 형식의 리포트를 생성합니다
         
         Args:
             results: 비교 결과 리스트
             output_path: 출력 파일 경로
+            metadata: 요약 리포트에 함께 기록할 비교 설정
             
         Returns:
             성공 여부
@@ -75,7 +79,12 @@ class ReportGenerator:
                     'missing_in_source': result.missing_in_source,
                     'errors': '; '.join(result.errors) if result.errors else '',
                     'processing_time': round(result.processing_time, 2),
-                    'match_rate': self._calculate_match_rate(result)
+                    'match_rate': self._calculate_match_rate(result),
+                    'verification': getattr(result, 'verification', 'content'),
+                    'verification_strength': getattr(result, 'verification_strength', ''),
+                    'verified_objects': getattr(result, 'verified_objects', 0),
+                    'verified_bytes': getattr(result, 'verified_bytes', 0),
+                    'verified_records': getattr(result, 'verified_records', None)
                 }
                 data.append(row)
             
@@ -92,7 +101,7 @@ class ReportGenerator:
             
             # 요약 정보 생성
             summary_path = output_path.replace('.csv', '_summary.csv')
-            self._generate_summary_report(results, summary_path)
+            self._generate_summary_report(results, summary_path, metadata)
             
             self.logger.info(f"CSV 리포트 생성 완료: {output_path}")
             return True
@@ -102,13 +111,15 @@ class ReportGenerator:
             return False
     
     def _generate_json_report(self, results: List[Any], 
-                            output_path: str) -> bool:
+                            output_path: str,
+                            metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         JSON 형식의 리포트를 생성합니다
         
         Args:
             results: 비교 결과 리스트
             output_path: 출력 파일 경로
+            metadata: 메타데이터에 함께 기록할 비교 설정
             
         Returns:
             성공 여부
@@ -123,7 +134,8 @@ class ReportGenerator:
                     'total_backup_records': sum(r.backup_records for r in results),
                     'total_matched_records': sum(r.matched_records for r in results),
                     'total_mismatched_records': sum(r.mismatched_records for r in results),
-                    'total_processing_time': sum(r.processing_time for r in results)
+                    'total_processing_time': sum(r.processing_time for r in results),
+                    **(metadata or {})
                 },
                 'results': []
             }
@@ -139,7 +151,12 @@ class ReportGenerator:
                     'missing_in_source': result.missing_in_source,
                     'errors': result.errors,
                     'processing_time': result.processing_time,
-                    'match_rate': self._calculate_match_rate(result)
+                    'match_rate': self._calculate_match_rate(result),
+                    'verification': getattr(result, 'verification', 'content'),
+                    'verification_strength': getattr(result, 'verification_strength', ''),
+                    'verified_objects': getattr(result, 'verified_objects', 0),
+                    'verified_bytes': getattr(result, 'verified_bytes', 0),
+                    'verified_records': getattr(result, 'verified_records', None)
                 }
                 report_data['results'].append(result_data)
             
@@ -155,13 +172,15 @@ class ReportGenerator:
             return False
     
     def _generate_excel_report(self, results: List[Any], 
-                             output_path: str) -> bool:
+                             output_path: str,
+                             metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         Excel 형식의 리포트를 생성합니다
         
         Args:
             results: 비교 결과 리스트
             output_path: 출력 파일 경로
+            metadata: 요약 시트에 함께 기록할 비교 설정
             
         Returns:
             성공 여부
@@ -180,7 +199,12 @@ class ReportGenerator:
                     'missing_in_source': result.missing_in_source,
                     'errors': '; '.join(result.errors) if result.errors else '',
                     'processing_time': round(result.processing_time, 2),
-                    'match_rate': self._calculate_match_rate(result)
+                    'match_rate': self._calculate_match_rate(result),
+                    'verification': getattr(result, 'verification', 'content'),
+                    'verification_strength': getattr(result, 'verification_strength', ''),
+                    'verified_objects': getattr(result, 'verified_objects', 0),
+                    'verified_bytes': getattr(result, 'verified_bytes', 0),
+                    'verified_records': getattr(result, 'verified_records', None)
                 }
                 data.append(row)
             
@@ -192,7 +216,7 @@ class ReportGenerator:
                 df.to_excel(writer, sheet_name='상세결과', index=False)
                 
                 # 요약 시트
-                summary_df = self._generate_summary_dataframe(results)
+                summary_df = self._generate_summary_dataframe(results, metadata)
                 summary_df.to_excel(writer, sheet_name='요약', index=False)
                 
                 # 오류 시트
@@ -208,13 +232,15 @@ class ReportGenerator:
             return False
     
     def _generate_summary_report(self, results: List[Any], 
-                               output_path: str) -> bool:
+                               output_path: str,
+                               metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         요약 리포트를 생성합니다
         
         Args:
             results: 비교 결과 리스트
             output_path: 출력 파일 경로
+            metadata: 함께 기록할 비교 설정
             
         Returns:
             성공 여부
@@ -231,7 +257,8 @@ class ReportGenerator:
                 'Total Processing Time (seconds)': round(sum(r.processing_time for r in results), 2),
                 'Average Match Rate (%)': round(
                     sum(self._calculate_match_rate(r) for r in results) / len(results) if results else 0, 2
-                )
+                ),
+                **(metadata or {})
             }
             
             # CSV 형식으로 저장
@@ -248,12 +275,14 @@ class ReportGenerator:
             self.logger.error(f"요약 리포트 생성 실패: {e}")
             return False
     
-    def _generate_summary_dataframe(self, results: List[Any]) -> pd.DataFrame:
+    def _generate_summary_dataframe(self, results: List[Any],
+                                    metadata: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """
         요약 데이터를 DataFrame으로 생성합니다
         
         Args:
             results: 비교 결과 리스트
+            metadata: 함께 기록할 비교 설정
             
         Returns:
             요약 DataFrame
@@ -281,6 +310,10 @@ class ReportGenerator:
             ]
         }
         
+        for key, value in (metadata or {}).items():
+            summary_data['Metric'].append(key)
+            summary_data['Value'].append(value)
+        
         return pd.DataFrame(summary_data)
     
     def _generate_error_dataframe(self, results: List[Any]) -> pd.DataFrame:
@@ -308,7 +341,11 @@ class ReportGenerator:
     
     def _calculate_match_rate(self, result: Any) -> float:
         """
-        일치율을 계산합니다
+        일치율을 계산합니다 (크기/ETag/체크섬으로 객체 단위 검증된 결과는 100%)
+        
+        전체 결과에 검증된 객체의 레코드 수(verified_records)가 있으면 일치 레코드로 더해
+        객체 단위 검증을 끈 경우와 같은 일치율을 계산하고, 레코드 수를 모르면 내용 비교한
+        레코드만으로 계산합니다 (내용 비교한 레코드 없이 검증된 객체만 있으면 100%).
         
         Args:
             result: 비교 결과
@@ -316,11 +353,15 @@ class ReportGenerator:
         Returns:
             일치율 (%)
         """
-        total_records = max(result.source_records, result.backup_records)
+        if getattr(result, 'verification', 'content') != 'content':
+            return 100.0
+        
+        verified_records = getattr(result, 'verified_records', None) or 0
+        total_records = max(result.source_records, result.backup_records) + verified_records
         if total_records == 0:
-            return 0.0
+            return 100.0 if getattr(result, 'verified_objects', 0) else 0.0
         
-        return round((result.matched_records / total_records) * 100, 2)
+        return round(((result.matched_records + verified_records) / total_records) * 100, 2)
     
     def generate_detailed_mismatch_report(self, results: List[Any], 
                                         output_path: str) -> bool:
@@ -396,6 +437,7 @@ class ReportGenerator:
                 row = {
                     'hash': record['hash'],
                     'hash_short': record['hash_short'],
+                    'hash_algorithm': record.get('hash_algorithm', ''),
                     'file_path': record['file_path'],
                     'bucket_type': record['bucket_type'],
                     'json_content': record['json_content']
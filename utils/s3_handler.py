@@ -6,10 +6,309 @@ AWS S3와의 상호작용을 담당하는 클래스
 
 import io
 import logging
-from typing import Generator, List, Optional
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from botocore.config import Config
+from botocore.exceptions import (
+    ClientError, ConnectionClosedError, IncompleteReadError, NoCredentialsError,
+    ReadTimeoutError, ResponseStreamingError
+)
+from urllib3.exceptions import ProtocolError
+
+from .object_info import ObjectInfo, head_object_options, metadata_from_head
+from .rate_limiter import DEFAULT_REQUEST_RATE, RequestRateGovernor
+
+
+# 스트리밍 읽기 시 기본 버퍼 크기 (8MB)
+DEFAULT_STREAM_BUFFER_SIZE = 8 * 1024 * 1024
+
+# 범위(Range) 다운로드 기본값
+DEFAULT_RANGE_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_RANGE_MAX_CONCURRENCY = 8
+DEFAULT_RANGE_MAX_INFLIGHT_BYTES = 128 * 1024 * 1024
+
+_CONTENT_RANGE_PATTERN = re.compile(r'bytes (\d+)-(\d+)/(\d+)')
+
+# 읽는 도중 연결이 끊기는 등 이어 받기로 복구할 수 있는 오류
+TRANSIENT_STREAM_ERRORS = (
+    IncompleteReadError, ResponseStreamingError, ReadTimeoutError,
+    ConnectionClosedError, ProtocolError, ConnectionError, TimeoutError
+)
+DEFAULT_MAX_RESUME_ATTEMPTS = 5
+
+# 클라이언트 연결 풀/재시도 기본값 (botocore 기본값: 풀 10개, legacy 재시도)
+DEFAULT_MAX_POOL_CONNECTIONS = 64
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+# (요청 속도는 접두사별 RequestRateGovernor가 조절하므로 클라이언트 전체를 늦추는
+#  adaptive 모드 대신 standard 모드로 재시도)
+DEFAULT_RETRY_MODE = "standard"
+DEFAULT_MAX_ATTEMPTS = 10
+
+# 병렬 나열 기본값
+DEFAULT_LIST_MAX_WORKERS = 16
+DEFAULT_LIST_MAX_DEPTH = 4
+
+
+class ConnectionPoolMonitor:
+    """S3 클라이언트 연결 풀의 사용량(동시 요청 수)을 추적하는 클래스"""
+    
+    def __init__(self, pool_size: int):
+        """
+        ConnectionPoolMonitor 초기화
+        
+        Args:
+            pool_size: 연결 풀 크기
+        """
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._total_requests = 0
+        self._saturated_requests = 0
+    
+    def acquire(self):
+        """연결 사용 시작을 기록합니다"""
+        with self._lock:
+            self._in_use += 1
+            self._total_requests += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            
+            # 풀 크기를 넘는 요청은 연결을 기다리거나 풀 밖의 연결을 새로 만듦
+            if self._in_use > self.pool_size:
+                self._saturated_requests += 1
+    
+    def release(self):
+        """연결 사용 종료를 기록합니다"""
+        with self._lock:
+            self._in_use -= 1
+    
+    @contextmanager
+    def track(self):
+        """요청 하나가 연결을 사용하는 구간을 기록합니다"""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        연결 풀 사용 통계를 반환합니다
+        
+        Returns:
+            풀 크기, 현재/최대 동시 사용 수, 전체/포화 요청 수, 포화 비율
+        """
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'in_use': self._in_use,
+                'peak_in_use': self._peak_in_use,
+                'total_requests': self._total_requests,
+                'saturated_requests': self._saturated_requests,
+                'saturation_ratio': (
+                    self._saturated_requests / self._total_requests
+                    if self._total_requests else 0.0
+                )
+            }
+
+
+class _StreamingBodyReader(io.RawIOBase):
+    """botocore StreamingBody를 RawIOBase로 감싸 BufferedReader에 연결하는 어댑터"""
+    
+    def __init__(self, body, on_close: Optional[Callable[[], None]] = None,
+                 reopen: Optional[Callable[[int], Any]] = None,
+                 max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+                 transient_errors: Tuple[type, ...] = TRANSIENT_STREAM_ERRORS):
+        """
+        _StreamingBodyReader 초기화
+        
+        Args:
+            body: get_object 응답의 StreamingBody (read(size)/close()를 제공하는 객체)
+            on_close: 스트림을 닫을 때 호출할 함수
+            reopen: 읽은 바이트 오프셋을 받아 그 위치부터의 새 본문을 반환하는 함수
+                (None이면 이어 받지 않음)
+            max_resume_attempts: 스트림 하나에서 이어 받을 최대 횟수
+            transient_errors: 이어 받기로 복구할 오류 타입
+        """
+        self._body = body
+        self._transient_errors = transient_errors
+        self._on_close = on_close
+        self._reopen = reopen
+        self._max_resume_attempts = max_resume_attempts
+        self._offset = 0
+        self._resume_count = 0
+        self.logger = logging.getLogger(__name__)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        """
+        StreamingBody에서 버퍼 크기만큼 읽어 채웁니다
+        
+        Args:
+            buffer: 채울 버퍼
+            
+        Returns:
+            읽은 바이트 수 (EOF이면 0)
+        """
+        data = self._read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        return size
+    
+    def readall(self) -> bytes:
+        """
+        남은 본문 전체를 읽습니다 (RawIOBase 기본 구현의 8KB 단위 읽기 대신 큰 청크로)
+        
+        Returns:
+            남은 본문 바이트
+        """
+        chunks = []
+        while True:
+            data = self._read(DEFAULT_STREAM_BUFFER_SIZE)
+            if not data:
+                return b''.join(chunks)
+            chunks.append(data)
+    
+    def _read(self, size: int) -> bytes:
+        """
+        본문에서 최대 size 바이트를 읽습니다 (연결이 끊기면 이어 받은 뒤 다시 읽음)
+        
+        Args:
+            size: 읽을 최대 바이트 수
+        
+        Returns:
+            읽은 바이트 (EOF이면 빈 바이트)
+        """
+        while True:
+            try:
+                data = self._body.read(size)
+                break
+            except self._transient_errors as e:
+                # 이미 넘겨준 바이트는 다시 받지 않고 현재 오프셋부터 이어 받음
+                self._resume(e)
+        
+        self._offset += len(data)
+        return data
+    
+    def _resume(self, error: Exception):
+        """
+        연결이 끊긴 본문을 닫고 현재 오프셋부터 다시 요청합니다
+        
+        Args:
+            error: 읽기 중 발생한 오류 (이어 받을 수 없으면 다시 발생시킴)
+        """
+        if self._reopen is None or self._resume_count >= self._max_resume_attempts:
+            raise error
+        
+        self._resume_count += 1
+        self.logger.warning(
+            f"스트림 읽기 중단, {self._offset:,} 바이트부터 이어 받기 "
+            f"({self._resume_count}/{self._max_resume_attempts}): {error}"
+        )
+        
+        try:
+            self._body.close()
+        except Exception:
+            pass
+        self._body = self._reopen(self._offset)
+    
+    def close(self):
+        if not self.closed:
+            self._body.close()
+            if self._on_close is not None:
+                self._on_close()
+        super().close()
+
+
+class _RangedDownloadReader(io.RawIOBase):
+    """여러 바이트 범위를 동시에 내려받아 순서대로 재조립하는 RawIOBase 스트림"""
+    
+    def __init__(self, fetch_range: Callable[[int, int], bytes], first_part: bytes,
+                 total_size: int, part_size: int, max_concurrency: int,
+                 max_inflight_bytes: int):
+        """
+        _RangedDownloadReader 초기화
+        
+        Args:
+            fetch_range: (시작, 끝) 오프셋을 받아 해당 범위의 바이트를 반환하는 함수
+            first_part: 이미 내려받은 첫 번째 파트
+            total_size: 객체 전체 크기 (바이트)
+            part_size: 파트 크기 (바이트)
+            max_concurrency: 동시에 내려받을 최대 파트 수
+            max_inflight_bytes: 메모리에 올라와 있을 수 있는 최대 바이트 수
+        """
+        self._fetch_range = fetch_range
+        self._total_size = total_size
+        self._part_size = part_size
+        self._next_offset = len(first_part)
+        self._current = memoryview(first_part)
+        self._position = 0
+        self._pending = deque()
+        
+        # 소비 중인 파트 1개 + 대기 중인 파트들이 max_inflight_bytes를 넘지 않도록 제한
+        self._max_pending = max(1, min(max_concurrency, max_inflight_bytes // part_size - 1))
+        self._executor = None
+        if self._next_offset < total_size:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_pending,
+                thread_name_prefix="s3-range"
+            )
+            self._schedule_parts()
+    
+    def readable(self) -> bool:
+        return True
+    
+    def _schedule_parts(self):
+        """동시 실행 한도 내에서 다음 파트 다운로드를 예약합니다"""
+        while (len(self._pending) < self._max_pending
+               and self._next_offset < self._total_size):
+            start = self._next_offset
+            end = min(start + self._part_size, self._total_size) - 1
+            self._pending.append(self._executor.submit(self._fetch_range, start, end))
+            self._next_offset = end + 1
+    
+    def readinto(self, buffer) -> int:
+        """
+        재조립된 스트림에서 버퍼 크기만큼 읽어 채웁니다
+        
+        Args:
+            buffer: 채울 버퍼
+            
+        Returns:
+            읽은 바이트 수 (EOF이면 0)
+        """
+        while self._position >= len(self._current):
+            if not self._pending:
+                return 0
+            
+            # 다음 파트는 순서대로 꺼내고, 빈 슬롯에 새 파트를 예약
+            self._current = memoryview(self._pending.popleft().result())
+            self._position = 0
+            self._schedule_parts()
+        
+        size = min(len(buffer), len(self._current) - self._position)
+        buffer[:size] = self._current[self._position:self._position + size]
+        self._position += size
+        return size
+    
+    def close(self):
+        if not self.closed:
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._current = memoryview(b'')
+        super().close()
 
 
 class S3Handler:
@@ -17,32 +316,88 @@ class S3Handler:
     
     def __init__(self, aws_access_key_id: Optional[str] = None,
                  aws_secret_access_key: Optional[str] = None,
-                 region_name: str = "us-east-1"):
+                 region_name: str = "us-east-1",
+                 range_part_size: int = DEFAULT_RANGE_PART_SIZE,
+                 range_max_concurrency: int = DEFAULT_RANGE_MAX_CONCURRENCY,
+                 range_max_inflight_bytes: int = DEFAULT_RANGE_MAX_INFLIGHT_BYTES,
+                 max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+                 tcp_keepalive: bool = True,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 retry_mode: str = DEFAULT_RETRY_MODE,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 endpoint_url: Optional[str] = None,
+                 request_rate: Optional[float] = DEFAULT_REQUEST_RATE,
+                 max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS):
         """
         S3Handler 초기화
         
+        클라이언트는 한 번만 생성되어 모든 작업 스레드가 공유합니다
+        (boto3 클라이언트는 스레드 안전하지만 생성 과정은 그렇지 않음).
+        
         Args:
             aws_access_key_id: AWS 액세스 키 ID
             aws_secret_access_key: AWS 시크릿 액세스 키
             region_name: AWS 리전명
+            range_part_size: 범위 다운로드 시 파트 크기 (바이트)
+            range_max_concurrency: 범위 다운로드 시 동시 요청 수
+            range_max_inflight_bytes: 범위 다운로드 시 메모리에 올라올 수 있는 최대 바이트 수
+            max_pool_connections: HTTP 연결 풀 크기 (동시 요청 수 이상으로 설정)
+            tcp_keepalive: TCP keepalive 사용 여부
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기 타임아웃 (초)
+            retry_mode: 재시도 모드 ("adaptive", "standard", "legacy")
+            max_attempts: 최대 시도 횟수 (첫 요청 포함)
+            endpoint_url: S3 호환 엔드포인트 URL (로컬 moto 서버, MinIO 등)
+            request_rate: 버킷/접두사별 시작 요청 속도 (초당 요청 수, None이면 속도 조절 안 함).
+                503 SlowDown을 받으면 줄이고 성공 응답이 이어지면 다시 늘립니다.
+            max_resume_attempts: 다운로드 도중 연결이 끊겼을 때 이어 받을 최대 횟수
         """
         self.logger = logging.getLogger(__name__)
+        self.range_part_size = range_part_size
+        self.range_max_concurrency = range_max_concurrency
+        self.range_max_inflight_bytes = range_max_inflight_bytes
+        self.max_resume_attempts = max_resume_attempts
+        self.pool_monitor = ConnectionPoolMonitor(max_pool_connections)
+        self.rate_governor = (
+            RequestRateGovernor(rate=request_rate) if request_rate else None
+        )
+        
+        # 연결 풀/타임아웃/재시도 설정
+        client_config = Config(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=tcp_keepalive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries={'mode': retry_mode, 'max_attempts': max_attempts}
+        )
+        
+        self._client_config = client_config
+        self._endpoint_url = endpoint_url
+        
+        # 리전별 클라이언트와 버킷별 리전 캐시 (세션은 스레드 안전하지 않으므로 잠금 사용)
+        self._client_lock = threading.Lock()
+        self._regional_clients: Dict[str, Any] = {}
+        self._bucket_regions: Dict[str, str] = {}
         
         # S3 클라이언트 초기화
         try:
             if aws_access_key_id and aws_secret_access_key:
-                self.s3_client = boto3.client(
-                    's3',
+                self._session = boto3.session.Session(
                     aws_access_key_id=aws_access_key_id,
                     aws_secret_access_key=aws_secret_access_key,
                     region_name=region_name
                 )
             else:
                 # 환경변수나 IAM 역할을 통한 인증
-                self.s3_client = boto3.client('s3', region_name=region_name)
-                
-            # 연결 테스트
-            self.s3_client.list_buckets()
+                self._session = boto3.session.Session(region_name=region_name)
+            
+            # 계정 전체 권한이 필요한 list_buckets() 대신 자격 증명 존재만 확인
+            # (버킷 접근 확인은 버킷별 리전 조회 시 지연 수행)
+            if self._session.get_credentials() is None:
+                raise NoCredentialsError()
+            
+            self.s3_client = self._get_regional_client(region_name)
             self.logger.info("S3 클라이언트 초기화 완료")
             
         except NoCredentialsError:
@@ -52,8 +407,79 @@ class S3Handler:
             self.logger.error(f"S3 클라이언트 초기화 실패: {e}")
             raise
     
+    def _get_regional_client(self, region_name: str):
+        """
+        리전별 S3 클라이언트를 반환합니다 (없으면 생성)
+        
+        Args:
+            region_name: AWS 리전명
+            
+        Returns:
+            해당 리전의 S3 클라이언트
+        """
+        with self._client_lock:
+            client = self._regional_clients.get(region_name)
+            if client is None:
+                client = self._session.client(
+                    's3',
+                    region_name=region_name,
+                    endpoint_url=self._endpoint_url,
+                    config=self._client_config
+                )
+                if self.rate_governor is not None:
+                    self.rate_governor.register(client)
+                self._regional_clients[region_name] = client
+            return client
+    
+    def get_bucket_region(self, bucket_name: str) -> str:
+        """
+        버킷의 리전을 조회합니다 (버킷별로 한 번만 조회하여 캐시)
+        
+        HeadBucket 응답의 x-amz-bucket-region 헤더를 사용하며, 리전이 다른
+        경우의 301 응답이나 403 응답에도 헤더가 포함되므로 그대로 사용합니다.
+        
+        Args:
+            bucket_name: S3 버킷명
+            
+        Returns:
+            버킷 리전명
+        """
+        region = self._bucket_regions.get(bucket_name)
+        if region is not None:
+            return region
+        
+        try:
+            with self.pool_monitor.track():
+                response = self.s3_client.head_bucket(Bucket=bucket_name)
+            headers = response['ResponseMetadata']['HTTPHeaders']
+        except ClientError as e:
+            headers = e.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+            if 'x-amz-bucket-region' not in headers:
+                self.logger.error(f"버킷 접근 확인 실패 ({bucket_name}): {e}")
+                raise
+        
+        region = headers.get('x-amz-bucket-region') or self.s3_client.meta.region_name
+        self._bucket_regions[bucket_name] = region
+        self.logger.info(f"버킷 '{bucket_name}' 리전: {region}")
+        return region
+    
+    def _client_for(self, bucket_name: str):
+        """
+        버킷 리전에 맞는 S3 클라이언트를 반환합니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            
+        Returns:
+            S3 클라이언트
+        """
+        return self._get_regional_client(self.get_bucket_region(bucket_name))
+    
     def list_files(self, bucket_name: str, prefix: str = "", 
-                   suffix: str = "") -> List[str]:
+                   suffix: str = "", parallel: bool = False,
+                   max_workers: int = DEFAULT_LIST_MAX_WORKERS,
+                   max_depth: int = DEFAULT_LIST_MAX_DEPTH,
+                   preserve_order: bool = True) -> List[str]:
         """
         S3 버킷에서 파일 목록을 가져옵니다
         
@@ -61,65 +487,395 @@ class S3Handler:
             bucket_name: S3 버킷명
             prefix: 접두사 필터
             suffix: 접미사 필터
+            parallel: 하위 접두사 병렬 나열 여부 (list_objects 참고)
+            max_workers: 병렬 나열 시 동시 요청 수
+            max_depth: 하위 접두사를 찾아 내려갈 최대 깊이
+            preserve_order: 순차 나열과 같은 키 순서 유지 여부
             
         Returns:
             파일 경로 목록
         """
-        files = []
+        objects = self.list_objects(
+            bucket_name, prefix, suffix, parallel, max_workers, max_depth, preserve_order
+        )
+        return [obj.key for obj in objects]
+    
+    def list_objects(self, bucket_name: str, prefix: str = "",
+                     suffix: str = "", parallel: bool = False,
+                     max_workers: int = DEFAULT_LIST_MAX_WORKERS,
+                     max_depth: int = DEFAULT_LIST_MAX_DEPTH,
+                     preserve_order: bool = True,
+                     start_after: Optional[str] = None) -> List[ObjectInfo]:
+        """
+        S3 버킷에서 크기/ETag/LastModified/스토리지 클래스/체크섬 알고리즘을
+        포함한 객체 정보 목록을 가져옵니다 (추가 HEAD 요청 없음)
         
+        parallel=True이면 Delimiter='/'로 하위 접두사(month=, day=, hour= 등)를
+        찾아 각 하위 접두사를 동시에 나열한 뒤 결과를 합칩니다.
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사 필터
+            suffix: 접미사 필터
+            parallel: 하위 접두사 병렬 나열 여부
+            max_workers: 병렬 나열 시 동시 요청 수
+            max_depth: 하위 접두사를 찾아 내려갈 최대 깊이
+            preserve_order: 순차 나열과 같은 키 순서(UTF-8 바이트 순) 유지 여부
+            start_after: 이 키 이후의 객체만 나열 (증분 갱신용, 지정 시 순차 나열)
+            
+        Returns:
+            객체 정보 목록
+        """
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=bucket_name,
-                Prefix=prefix
-            )
+            if start_after:
+                objects = self._list_prefix(bucket_name, prefix, suffix, start_after)
+            elif parallel:
+                objects = self._list_objects_parallel(
+                    bucket_name, prefix, suffix, max_workers, max_depth, preserve_order
+                )
+            else:
+                objects = self._list_prefix(bucket_name, prefix, suffix)
             
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        file_path = obj['Key']
-                        
-                        # 접미사 필터 적용
-                        if suffix and not file_path.endswith(suffix):
-                            continue
-                            
-                        # 디렉터리는 제외
-                        if not file_path.endswith('/'):
-                            files.append(file_path)
-                            
         except ClientError as e:
             self.logger.error(f"파일 목록 가져오기 실패: {e}")
             raise
         
-        self.logger.info(f"버킷 '{bucket_name}'에서 {len(files)}개 파일 발견")
-        return files
+        self.logger.info(f"버킷 '{bucket_name}'에서 {len(objects)}개 파일 발견")
+        return objects
     
-    def get_file_stream(self, bucket_name: str, file_path: str) -> io.BytesIO:
+    def _iter_list_pages(self, bucket_name: str, prefix: str,
+                         delimiter: Optional[str] = None,
+                         start_after: Optional[str] = None) -> Generator[dict, None, None]:
+        """
+        list_objects_v2 페이지를 순서대로 반환합니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사
+            delimiter: 구분자 (지정 시 CommonPrefixes 포함)
+            start_after: 이 키 이후부터 나열
+            
+        Yields:
+            list_objects_v2 응답 페이지
+        """
+        paginator = self._client_for(bucket_name).get_paginator('list_objects_v2')
+        params = {'Bucket': bucket_name, 'Prefix': prefix}
+        if delimiter:
+            params['Delimiter'] = delimiter
+        if start_after:
+            params['StartAfter'] = start_after
+        
+        with self.pool_monitor.track():
+            yield from paginator.paginate(**params)
+    
+    @staticmethod
+    def _filter_objects(contents: List[dict], suffix: str) -> List[ObjectInfo]:
+        """
+        Contents 항목 중 접미사 필터를 통과한 파일을 객체 정보로 변환합니다
+        
+        Args:
+            contents: list_objects_v2 응답의 Contents
+            suffix: 접미사 필터
+            
+        Returns:
+            객체 정보 목록
+        """
+        objects = []
+        
+        for obj in contents:
+            file_path = obj['Key']
+            
+            # 접미사 필터 적용
+            if suffix and not file_path.endswith(suffix):
+                continue
+                
+            # 디렉터리는 제외
+            if not file_path.endswith('/'):
+                objects.append(ObjectInfo.from_listing(obj))
+        
+        return objects
+    
+    def _list_prefix(self, bucket_name: str, prefix: str, suffix: str,
+                     start_after: Optional[str] = None) -> List[ObjectInfo]:
+        """
+        접두사 아래의 모든 파일을 순차적으로 나열합니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사
+            suffix: 접미사 필터
+            start_after: 이 키 이후부터 나열
+            
+        Returns:
+            객체 정보 목록
+        """
+        objects = []
+        
+        for page in self._iter_list_pages(bucket_name, prefix, start_after=start_after):
+            objects.extend(self._filter_objects(page.get('Contents', []), suffix))
+        
+        return objects
+    
+    def _list_level(self, bucket_name: str, prefix: str,
+                    suffix: str) -> Tuple[List[ObjectInfo], List[str]]:
+        """
+        접두사 바로 아래 단계의 파일과 하위 접두사를 나열합니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사
+            suffix: 접미사 필터
+            
+        Returns:
+            (바로 아래 객체 정보 목록, 하위 접두사 목록)
         """
-        S3 파일을 스트림으로 가져옵니다
+        objects = []
+        child_prefixes = []
+        
+        for page in self._iter_list_pages(bucket_name, prefix, delimiter='/'):
+            objects.extend(self._filter_objects(page.get('Contents', []), suffix))
+            child_prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        
+        return objects, child_prefixes
+    
+    def _list_objects_parallel(self, bucket_name: str, prefix: str, suffix: str,
+                             max_workers: int, max_depth: int,
+                             preserve_order: bool) -> List[ObjectInfo]:
+        """
+        하위 접두사를 찾아 동시에 나열하고 결과를 합칩니다
+        
+        Args:
+            bucket_name: S3 버킷명
+            prefix: 접두사
+            suffix: 접미사 필터
+            max_workers: 동시 요청 수
+            max_depth: 하위 접두사를 찾아 내려갈 최대 깊이
+            preserve_order: 키 순서 유지 여부
+            
+        Returns:
+            객체 정보 목록
+        """
+        objects = []
+        level = [prefix]
+        
+        # 리전 조회를 작업 스레드 시작 전에 한 번만 수행
+        self.get_bucket_region(bucket_name)
+        
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="s3-list") as executor:
+            # 하위 접두사가 충분히 많아질 때까지 Delimiter='/'로 한 단계씩 내려감
+            for _ in range(max_depth):
+                next_level = []
+                for level_objects, child_prefixes in executor.map(
+                        lambda p: self._list_level(bucket_name, p, suffix), level):
+                    objects.extend(level_objects)
+                    next_level.extend(child_prefixes)
+                
+                level = next_level
+                if not level or len(level) >= max_workers * 4:
+                    break
+            
+            self.logger.debug(f"하위 접두사 {len(level)}개를 병렬로 나열합니다")
+            
+            # 남은 하위 접두사는 구분자 없이 전체를 동시에 나열
+            futures = [
+                executor.submit(self._list_prefix, bucket_name, p, suffix)
+                for p in level
+            ]
+            for future in as_completed(futures):
+                objects.extend(future.result())
+        
+        # S3 순차 나열은 UTF-8 바이트 순서이며, 이는 str 코드 포인트 정렬과 같음
+        if preserve_order:
+            objects.sort(key=lambda obj: obj.key)
+        
+        return objects
+    
+    def open_file_stream(self, bucket_name: str, file_path: str,
+                         buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE) -> io.BufferedReader:
+        """
+        S3 파일을 메모리에 적재하지 않고 스트리밍으로 엽니다
+        
+        응답의 StreamingBody를 큰 버퍼의 BufferedReader로 감싸 반환하므로
+        객체 크기와 관계없이 메모리 사용량이 일정하고, 첫 바이트가 도착하는
+        즉시 압축 해제/파싱을 시작할 수 있습니다. 사용 후 close()해야 합니다.
+        
+        읽는 도중 연결이 끊기면 읽은 위치부터 Range 요청(ETag로 고정)으로
+        이어 받으므로, 압축 해제/해시는 처음부터 다시 하지 않고 계속됩니다.
         
         Args:
             bucket_name: S3 버킷명
             file_path: 파일 경로
+            buffer_size: 읽기 버퍼 크기 (바이트)
             
         Returns:
-            파일 스트림
+            바이너리 스트림
+        """
+        return io.BufferedReader(
+            self._open_body_reader(bucket_name, file_path), buffer_size=buffer_size
+        )
+    
+    def _open_body_reader(self, bucket_name: str, file_path: str) -> _StreamingBodyReader:
+        """
+        GET 응답 본문을 이어 받기가 가능한 RawIOBase 리더로 엽니다 (사용 후 close 필요)
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+            
+        Returns:
+            본문 리더
         """
+        # 스트림이 닫힐 때까지 연결을 점유하므로 close 시점에 반환 기록
+        self.pool_monitor.acquire()
         try:
-            response = self.s3_client.get_object(
+            client = self._client_for(bucket_name)
+            response = client.get_object(
                 Bucket=bucket_name,
                 Key=file_path
             )
             
-            # 스트림 데이터 읽기
-            file_stream = io.BytesIO(response['Body'].read())
-            file_stream.seek(0)  # 스트림 포인터를 처음으로 이동
+            etag = response['ETag']
+            total_size = response['ContentLength']
+            
+            def reopen(offset: int):
+                if offset >= total_size:
+                    return io.BytesIO(b'')
+                # 다운로드 도중 객체가 바뀌었으면 412(PreconditionFailed)로 실패
+                return client.get_object(
+                    Bucket=bucket_name,
+                    Key=file_path,
+                    Range=f"bytes={offset}-",
+                    IfMatch=etag
+                )['Body']
             
-            return file_stream
+            return _StreamingBodyReader(
+                response['Body'],
+                on_close=self.pool_monitor.release,
+                reopen=reopen,
+                max_resume_attempts=self.max_resume_attempts
+            )
             
         except ClientError as e:
-            self.logger.error(f"파일 스트림 가져오기 실패 ({file_path}): {e}")
+            self.pool_monitor.release()
+            self.logger.error(f"파일 스트림 열기 실패 ({file_path}): {e}")
             raise
+        except Exception:
+            self.pool_monitor.release()
+            raise
+    
+    def open_file_stream_ranged(self, bucket_name: str, file_path: str,
+                                part_size: Optional[int] = None,
+                                max_concurrency: Optional[int] = None,
+                                max_inflight_bytes: Optional[int] = None,
+                                buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE) -> io.BufferedReader:
+        """
+        S3 파일을 여러 바이트 범위로 나누어 동시에 내려받는 스트림으로 엽니다
+        
+        첫 번째 범위 요청의 Content-Range로 전체 크기를 알아내므로 별도의
+        HEAD 요청이 필요 없고, 작은 객체는 단일 GET과 동일하게 처리됩니다.
+        이후 파트는 ETag(If-Match)로 고정하여 다운로드 도중 객체가 바뀌면
+        실패하도록 합니다. 사용 후 close()해야 합니다.
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+            part_size: 파트 크기 (기본값: range_part_size)
+            max_concurrency: 동시 요청 수 (기본값: range_max_concurrency)
+            max_inflight_bytes: 최대 메모리 사용량 (기본값: range_max_inflight_bytes)
+            buffer_size: 읽기 버퍼 크기 (바이트)
+            
+        Returns:
+            바이너리 스트림
+        """
+        part_size = part_size or self.range_part_size
+        max_concurrency = max_concurrency or self.range_max_concurrency
+        max_inflight_bytes = max_inflight_bytes or self.range_max_inflight_bytes
+        
+        try:
+            client = self._client_for(bucket_name)
+            
+            try:
+                with self.pool_monitor.track():
+                    response = client.get_object(
+                        Bucket=bucket_name,
+                        Key=file_path,
+                        Range=f"bytes=0-{part_size - 1}"
+                    )
+                    first_part = response['Body'].read()
+            except ClientError as e:
+                # 빈 객체는 범위 요청에 416(InvalidRange)으로 응답
+                if e.response['Error']['Code'] == 'InvalidRange':
+                    return io.BufferedReader(io.BytesIO(b''))
+                raise
+            
+            etag = response['ETag']
+            
+            match = _CONTENT_RANGE_PATTERN.match(response.get('ContentRange', ''))
+            total_size = int(match.group(3)) if match else len(first_part)
+            
+            def fetch_range(start: int, end: int) -> bytes:
+                # 파트는 다 받은 뒤에 소비되므로 끊기면 파트만 다시 요청
+                for attempt in range(self.max_resume_attempts + 1):
+                    try:
+                        with self.pool_monitor.track():
+                            part = client.get_object(
+                                Bucket=bucket_name,
+                                Key=file_path,
+                                Range=f"bytes={start}-{end}",
+                                IfMatch=etag
+                            )
+                            return part['Body'].read()
+                    except TRANSIENT_STREAM_ERRORS as e:
+                        if attempt >= self.max_resume_attempts:
+                            raise
+                        self.logger.warning(
+                            f"범위 다운로드 중단, 파트 재요청 ({file_path}, "
+                            f"bytes={start}-{end}): {e}"
+                        )
+            
+            reader = _RangedDownloadReader(
+                fetch_range, first_part, total_size, part_size,
+                max_concurrency, max_inflight_bytes
+            )
+            return io.BufferedReader(reader, buffer_size=buffer_size)
+            
+        except ClientError as e:
+            self.logger.error(f"범위 다운로드 스트림 열기 실패 ({file_path}): {e}")
+            raise
+    
+    def get_file_stream(self, bucket_name: str, file_path: str) -> io.BytesIO:
+        """
+        S3 파일 전체를 메모리로 읽어 스트림으로 가져옵니다
+        
+        대용량 객체는 open_file_stream()을 사용하세요.
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+            
+        Returns:
+            파일 스트림
+        """
+        return io.BytesIO(self.get_file_bytes(bucket_name, file_path))
+    
+    def get_file_bytes(self, bucket_name: str, file_path: str) -> bytes:
+        """
+        S3 파일 전체를 바이트로 가져옵니다
+        
+        open_file_stream과 같은 리더로 읽으므로, 읽는 도중 연결이 끊기면 읽은 위치부터
+        Range 요청(ETag로 고정)으로 이어 받습니다 (프리페치/작은 객체 모드에서 사용).
+        
+        Args:
+            bucket_name: S3 버킷명
+            file_path: 파일 경로
+            
+        Returns:
+            파일 내용
+        """
+        # 오류 로그는 _open_body_reader에서 기록
+        with self._open_body_reader(bucket_name, file_path) as reader:
+            return reader.readall()
     
     def file_exists(self, bucket_name: str, file_path: str) -> bool:
         """
@@ -133,7 +889,8 @@ class S3Handler:
             파일 존재 여부
         """
         try:
-            self.s3_client.head_object(Bucket=bucket_name, Key=file_path)
+            with self.pool_monitor.track():
+                self._client_for(bucket_name).head_object(Bucket=bucket_name, Key=file_path)
             return True
         except ClientError as e:
             if e.response['Error']['Code'] == '404':
@@ -154,41 +911,65 @@ class S3Handler:
             파일 크기 (바이트)
         """
         try:
-            response = self.s3_client.head_object(
-                Bucket=bucket_name,
-                Key=file_path
-            )
+            with self.pool_monitor.track():
+                response = self._client_for(bucket_name).head_object(
+                    Bucket=bucket_name,
+                    Key=file_path
+                )
             return response['ContentLength']
             
         except ClientError as e:
             self.logger.error(f"파일 크기 가져오기 실패 ({file_path}): {e}")
             raise
     
-    def get_file_metadata(self, bucket_name: str, file_path: str) -> dict:
+    def get_file_metadata(self, bucket_name: str, file_path: str,
+                          checksum_mode: bool = False,
+                          part_number: Optional[int] = None) -> dict:
         """
         S3 파일의 메타데이터를 가져옵니다
         
         Args:
             bucket_name: S3 버킷명
             file_path: 파일 경로
+            checksum_mode: 추가 체크섬(ChecksumSHA256/CRC32C 등)도 조회할지 여부
+            part_number: 멀티파트 객체의 파트 번호 (지정하면 size가 해당 파트 크기)
             
         Returns:
             파일 메타데이터
         """
         try:
-            response = self.s3_client.head_object(
-                Bucket=bucket_name,
-                Key=file_path
-            )
+            with self.pool_monitor.track():
+                response = self._client_for(bucket_name).head_object(
+                    Bucket=bucket_name,
+                    Key=file_path,
+                    **head_object_options(checksum_mode, part_number)
+                )
             
-            return {
-                'size': response['ContentLength'],
-                'last_modified': response['LastModified'],
-                'etag': response['ETag'].strip('"'),
-                'content_type': response.get('ContentType', ''),
-                'metadata': response.get('Metadata', {})
-            }
+            return metadata_from_head(response)
             
         except ClientError as e:
             self.logger.error(f"파일 메타데이터 가져오기 실패 ({file_path}): {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        연결 풀 사용 통계를 반환합니다
+        
+        peak_in_use가 pool_size에 닿거나 saturated_requests가 0보다 크면
+        동시성에 비해 풀이 작다는 뜻이므로 max_pool_connections를 늘리세요.
+        
+        Returns:
+            연결 풀 사용 통계
+        """
+        return self.pool_monitor.get_stats()
+    
+    def get_rate_stats(self) -> Dict[str, Any]:
+        """
+        접두사별 요청 속도 조절 통계를 반환합니다
+        
+        Returns:
+            속도 조절 통계 (속도 조절을 사용하지 않으면 빈 딕셔너리)
+        """
+        if self.rate_governor is None:
+            return {}
+        return self.rate_governor.get_stats()